@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for htb_writeup.py against synthetic sites of increasing size.
+
+Usage:
+  python bench_htb_writeup.py [--sizes 10,100,1000,10000] [--repeat 3] [--json FILE]
+
+For each size N a throwaway site is generated in a temp directory:
+writeups.json with N writeups, the four generated pages (Home, Writeups,
+Tags, WriteupDetail) rendered from it, the writeup templates and
+public/_headers/_redirects. Each operation is then timed (best and mean of
+--repeat runs), and run once more under tracemalloc for its peak memory:
+
+  parse-cards   lex the card arrays of the three card pages
+  parse-routes  lex WriteupDetail.js imports and route map
+  render        render every generated page from the registry (no writes)
+  build         full build with no build state (pages, previews, search index,
+                feeds, tag shards)
+  build-state   the same build with a warm build state (nothing changed)
+  check         consistency check (`check`) with that warm build state
+  next-id       Registry.next_id()
+  create        create one writeup end to end against a stub HTB server
+  remove        remove it again
+
+Throughput is reported per call and, for per-card work, in cards/s.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import struct
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import htb_writeup as hw  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 3
+
+SITE_FILES = [
+    "src/pages/Home.js",
+    "src/pages/Writeups.js",
+    "src/pages/Tags.js",
+    "src/pages/WriteupDetail.js",
+    "templates/writeup/machine.js.tmpl",
+    "templates/writeup/writeup.css.tmpl",
+    "templates/writeup/linux.md.tmpl",
+    "public/_headers",
+    "public/_redirects",
+]
+
+TAG_POOL = ["htb", "hmv", "linux", "windows", "ad", "smb", "ldap", "kerberos", "kerberoasting",
+            "asreproast", "dcsync", "adcs", "esc1", "esc15", "gmsa", "dpapi", "password-cracking",
+            "sqli", "xss", "ssti", "lfi", "rce", "suid", "sudo", "docker", "jwt", "ipsec", "xwiki"]
+WORDS = ("enumeration foothold privilege escalation exploit service credentials domain "
+         "controller shell reverse token certificate kerberos hash crack misconfiguration").split()
+
+
+# ---- Stub HTB server ----
+
+def tiny_png(size: int = 64) -> bytes:
+    """A valid RGB PNG, built without Pillow."""
+    raw = b"".join(b"\x00" + bytes([y % 256, 61, 0]) * size for y in range(size))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + tag + data
+                + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+AVATAR = tiny_png()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /api/machine/profile/<name> and /avatars/<name>.png."""
+
+    def do_GET(self):
+        if self.path.startswith("/api/machine/profile/"):
+            name = self.path.rsplit("/", 1)[-1]
+            body = json.dumps({"info": {"name": name, "avatar": f"/avatars/{name}.png"}}).encode()
+            content_type = "application/json"
+        elif self.path.startswith("/avatars/"):
+            body, content_type = AVATAR, "image/png"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ---- Synthetic sites ----
+
+def synthetic_post(i: int) -> dict:
+    slug = f"m{i:05d}"
+    component = f"M{i:05d}Walkthrough"
+    tags = [TAG_POOL[(i * 7 + k * 3) % len(TAG_POOL)] for k in range(2 + i % 5)]
+    excerpt = " ".join(WORDS[(i + k) % len(WORDS)] for k in range(40)).capitalize() + "."
+    return {
+        "id": i,
+        "slug": slug,
+        "category": "writeup",
+        "title": f"M{i:05d} Walkthrough",
+        "excerpt": excerpt,
+        "date": "Jan 01, 2026",
+        "tags": list(dict.fromkeys(tags)),
+        "difficulty": ("Easy", "Medium", "Hard", "Insane")[i % 4],
+        "os": ("Linux", "Windows")[i % 2],
+        "ip": f"10.10.{i // 250 % 256}.{i % 250 + 1}",
+        "image": f"/images/writeups/{slug}/machine.png",
+        "link": f"/writeups/{slug}-walkthrough",
+        "component": component,
+        "componentPath": f"./writeups/{slug}/{component}",
+    }
+
+
+def make_site(root: Path, size: int) -> None:
+    """Copy the page scaffolding into `root` and build it for `size` writeups."""
+    for name in SITE_FILES:
+        target = root / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(REPO_ROOT / name, target)
+    registry = hw.Registry([synthetic_post(i) for i in range(size, 0, -1)])
+    with quiet(), hw.transaction():
+        hw.publish(registry)
+
+
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+# ---- Measurement ----
+
+def measure(func: Callable[[], object], repeat: int, setup: Optional[Callable[[], object]] = None,
+            inner: int = 1) -> dict:
+    """Time `func` (called `inner` times per sample) and its tracemalloc peak."""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with quiet():
+            start = time.perf_counter()
+            for _ in range(inner):
+                func()
+            samples.append((time.perf_counter() - start) / inner)
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        with quiet():
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"best": min(samples), "mean": statistics.mean(samples), "peak": peak}
+
+
+def bench_size(size: int, repeat: int, stub_base: str) -> List[dict]:
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix=f"htb-bench-{size}-") as tmp:
+        os.chdir(tmp)
+        try:
+            hw.configure_build_state(None)
+            make_site(Path(tmp), size)
+            registry = hw.Registry.load()
+            card_pages = list(hw.PAGE_ARRAYS)
+
+            def record(operation: str, stats: dict, cards: int = 0) -> None:
+                stats.update(size=size, operation=operation,
+                             ops_per_sec=1 / stats["best"] if stats["best"] else None,
+                             cards_per_sec=cards / stats["best"] if cards and stats["best"] else None)
+                results.append(stats)
+
+            record("parse-cards", measure(
+                lambda: [hw.load_cards(path).cards for path in card_pages], repeat), size * len(card_pages))
+            record("parse-routes", measure(
+                lambda: hw.ComponentMap(hw.read_page(hw.WRITEUP_DETAIL)).routes, repeat), size)
+            record("render", measure(lambda: hw.render_pages(registry), repeat), size * len(hw.PAGE_CARDS))
+            record("build", measure(lambda: hw.publish_transaction(registry), repeat), size)
+
+            state_path = Path(tmp) / hw.BUILD_STATE_PATH
+            hw.configure_build_state(state_path)
+            with quiet():
+                hw.publish_transaction(registry)
+            record("build-state", measure(lambda: hw.publish_transaction(registry), repeat), size)
+            record("check", measure(lambda: hw.check_site(registry), repeat), size)
+            hw.configure_build_state(None)
+
+            inner = max(1, 100_000 // size)
+            record("next-id", measure(registry.next_id, repeat, inner=inner), size)
+
+            def create():
+                with hw.transaction():
+                    hw.create_writeup("Benchmark", "Benchmark Walkthrough", "Synthetic benchmark writeup.",
+                                      ["htb", "linux"], "Easy", "Linux", "10.10.10.10",
+                                      "Jan 01, 2026", registry)
+                    hw.publish(registry)
+
+            def remove():
+                with hw.transaction():
+                    hw.remove_writeup("Benchmark", registry)
+                    hw.publish(registry)
+
+            def ensure_absent():
+                if registry.get("benchmark"):
+                    with quiet():
+                        remove()
+
+            def ensure_present():
+                if not registry.get("benchmark"):
+                    with quiet():
+                        create()
+
+            hw.HTB_API_BASE, hw.HTB_IMAGE_BASE = f"{stub_base}/api", stub_base
+            record("create", measure(create, repeat, setup=ensure_absent), size)
+            record("remove", measure(remove, repeat, setup=ensure_present), size)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.3f} s "
+
+
+def report(results: List[dict]) -> str:
+    lines = [f"{'cards':>7}  {'operation':<12}  {'best':>11}  {'mean':>11}  {'ops/s':>10}"
+             f"  {'cards/s':>11}  {'peak mem':>9}"]
+    for r in results:
+        cards = f"{r['cards_per_sec']:11,.0f}" if r["cards_per_sec"] else f"{'-':>11}"
+        lines.append(f"{r['size']:7,d}  {r['operation']:<12}  {format_time(r['best'])}  "
+                     f"{format_time(r['mean'])}  {r['ops_per_sec']:10,.1f}  {cards}  "
+                     f"{hw.format_bytes(r['peak']):>9}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark htb_writeup.py on synthetic sites",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated card counts (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Timed runs per operation (default: %(default)s)")
+    parser.add_argument("--json", type=Path, metavar="FILE", help="Also write the results as JSON")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    os.environ["HTB_TOKEN"] = os.environ.get("HTB_TOKEN") or "benchmark"
+    hw.configure_cache(None)
+    hw.configure_machine_store(None)
+    server = start_stub_server()
+    stub_base = f"http://127.0.0.1:{server.server_address[1]}"
+    results: List[dict] = []
+    try:
+        for size in sizes:
+            print(f"Benchmarking {size:,} cards...", file=sys.stderr)
+            results.extend(bench_size(size, max(1, args.repeat), stub_base))
+    finally:
+        server.shutdown()
+
+    print(report(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"✓ Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,13 @@ Unified script: download HTB machine image + create/remove writeup.
 
 Combines:
 - Download machine avatar from HTB API (same as download_htb_machine_image.py)
-- Create/remove writeup: cards (Home, Writeups, Tags, TagDetail), component, route, image
+- Create/remove writeup: cards (Home, Writeups, Tags), tag shards, component, route,
+  image
 
 Usage (Create):
   python htb_writeup.py <MachineName> --title "Title" --description "Description" \\
-    --tags "tag1,tag2" --difficulty "Easy" --os "Linux" --ip "10.10.10.10"
+    --tags "tag1,tag2" --difficulty "Easy" --os "Linux" --ip "10.10.10.10" \\
+    [--date "Mar 16, 2026"]
 
 Usage (Remove):
   python htb_writeup.py --remove <MachineName>
@@ -21,47 +23,884 @@ Example (Create):
 Example (Remove):
   python htb_writeup.py --remove Active
 
+Usage (Batch):
+  python htb_writeup.py --manifest machines.yaml
+
+Usage (Build):
+  python htb_writeup.py build [--check] [--force] [--variants]
+  Regenerates the cards, routes, previews, content, search index, feeds and
+  tag shards from writeups.json, the single source of truth.
+
+Usage (Previews):
+  python htb_writeup.py regen-previews [--workers N]
+
+Usage (Images):
+  python htb_writeup.py optimize-images [PATH ...] [--workers N] [--no-avif] [--force]
+
+Usage (Watch):
+  python htb_writeup.py watch [--poll] [--debounce MS] [--avif]
+
+Usage (Screenshots):
+  python htb_writeup.py add-images <MachineName> <DIR> [--similar BITS] [--workers N]
+
+Usage (Sync):
+  python htb_writeup.py sync [MACHINE ...] [--workers N] [--rate N]
+
+Usage (Check):
+  python htb_writeup.py check [--max-image-kb KB] [--update-baseline]
+
+Usage (Prerender, after npm run build):
+  python htb_writeup.py prerender [--workers N]
+
+Usage (Report):
+  python htb_writeup.py report [--update-baseline] [--max-growth PCT] [--json FILE]
+
+Instrumentation (any command): --timings, --timings-json FILE, --profile.
+
 Requires: HTB_TOKEN environment variable for create (not for remove).
-Template: EditorWalkthrough (current site format — ## Overview, id="writeup-title", TableOfContents with title).
+HTB_API_BASE / HTB_IMAGE_BASE override the HTB endpoints (e.g. a local stub server).
+Templates: templates/writeup/ (current site format — ## Overview in the .md,
+id="writeup-title", TableOfContents with title); --template linux, windows-ad,
+sherlock or challenge.
 """
 
 import argparse
+import functools
+import gzip
+import hashlib
+import html
+import importlib.util
+import io
+import json
 import os
 import re
+import select
+import shutil
+import sqlite3
+import struct
 import sys
+import tempfile
+import threading
+import time
+import traceback
+import urllib.parse
 import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Both bases can be overridden (e.g. to point at a local stub server).
+HTB_API_BASE = os.getenv("HTB_API_BASE", "https://labs.hackthebox.com/api/v4")
+HTB_IMAGE_BASE = os.getenv(
+    "HTB_IMAGE_BASE",
+    "https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com",
+)
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
 
-HTB_API_BASE = "https://labs.hackthebox.com/api/v4"
-HTB_IMAGE_BASE = "https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com"
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_WORKERS = 4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_CACHE_DIR = (Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+                     / "htb_writeup")
+DEFAULT_CACHE_MAX_AGE_DAYS = 30
+DEFAULT_CACHE_MAX_MB = 256
+PROFILE_TOP = 20
+
+_session: Optional[requests.Session] = None
+_timeout: Tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+_cache: Optional["HttpCache"] = None
+_retries = DEFAULT_RETRIES
 
 
 def get_current_date() -> str:
     return datetime.now().strftime("%b %d, %Y")
 
 
+class PhaseTimer:
+    """Accumulates wall-clock time per named phase."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self) -> str:
+        width = max((len(name) for name in self.totals), default=0)
+        lines = [f"  {name:<{width}}  {secs:8.3f}s"
+                 for name, secs in self.totals.items()]
+        lines.append(f"  {'total':<{width}}  {sum(self.totals.values()):8.3f}s")
+        return "\n".join(lines)
+
+
+def format_bytes(count: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+class Metrics:
+    """Run-wide instrumentation, reported with --timings / --timings-json.
+
+    Records wall and CPU time per step (inclusive of nested steps), bytes
+    read and written per file, and latency and size of every HTTP request.
+    With --profile it also holds a cProfile capture and tracemalloc peaks.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps: Dict[str, List[float]] = {}  # name -> [calls, wall, cpu]
+        self.files: Dict[str, List[int]] = {}  # path -> [bytes read, bytes written]
+        self.requests: List[dict] = []
+        self.profile: Optional[List[dict]] = None
+        self.memory: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name: str):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            with self._lock:
+                totals = self.steps.setdefault(name, [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += wall
+                totals[2] += cpu
+
+    def file_io(self, path: Path, read: int = 0, written: int = 0) -> None:
+        with self._lock:
+            totals = self.files.setdefault(Path(path).as_posix(), [0, 0])
+            totals[0] += read
+            totals[1] += written
+
+    def request(self, url: str, status: Optional[int], seconds: float, size: int,
+                source: str) -> None:
+        """Record one HTTP GET. `source` is network, revalidated (304) or cache
+        (offline)."""
+        with self._lock:
+            self.requests.append({"url": url, "status": status,
+                                  "seconds": round(seconds, 6),
+                                  "bytes": size, "source": source})
+
+    def to_dict(self) -> dict:
+        return {
+            "wall": round(time.perf_counter() - self.started, 6),
+            "steps": {name: {"calls": calls, "wall": round(wall, 6),
+                             "cpu": round(cpu, 6)}
+                      for name, (calls, wall, cpu) in self.steps.items()},
+            "http": {
+                "requests": self.requests,
+                "seconds": round(sum(r["seconds"] for r in self.requests), 6),
+                "bytes": sum(r["bytes"] for r in self.requests),
+            },
+            "files": {path: {"read": read, "written": written}
+                      for path, (read, written) in sorted(self.files.items())},
+            "bytes_read": sum(read for read, _ in self.files.values()),
+            "bytes_written": sum(written for _, written in self.files.values()),
+            "memory": self.memory,
+            "profile": self.profile,
+        }
+
+    def report(self) -> str:
+        data = self.to_dict()
+        lines = [f"Timings (total {data['wall']:.3f}s)", "", "Steps (inclusive):"]
+        width = max((len(name) for name in data["steps"]), default=0)
+        for name, step in sorted(data["steps"].items(),
+                                 key=lambda item: -item[1]["wall"]):
+            lines.append(f"  {name:<{width}}  {step['calls']:4d}x"
+                         f"  wall {step['wall']:8.3f}s  cpu {step['cpu']:8.3f}s")
+        http = data["http"]
+        lines += ["", f"HTTP: {len(http['requests'])} request(s), "
+                      f"{http['seconds']:.3f}s, {format_bytes(http['bytes'])}"]
+        for r in http["requests"]:
+            lines.append(f"  {r['status'] or '-':>3}  {r['source']:<11}"
+                         f"  {r['seconds'] * 1000:8.1f} ms"
+                         f"  {format_bytes(r['bytes']):>9}  {r['url']}")
+        lines += ["", f"Files: read {format_bytes(data['bytes_read'])}, "
+                      f"written {format_bytes(data['bytes_written'])}"]
+        for path, io_bytes in data["files"].items():
+            lines.append(f"  read {format_bytes(io_bytes['read']):>9}  written "
+                         f"{format_bytes(io_bytes['written']):>9}  {path}")
+        if self.memory:
+            lines += ["", f"Memory: peak {format_bytes(self.memory['peak'])}, "
+                          f"current {format_bytes(self.memory['current'])}"]
+            for alloc in self.memory["top"]:
+                lines.append(f"  {format_bytes(alloc['bytes']):>9}  {alloc['where']}")
+        if self.profile:
+            lines += ["", "Profile (top functions by cumulative time):"]
+            for entry in self.profile:
+                lines.append(f"  {entry['cumtime']:8.3f}s  {entry['tottime']:8.3f}s  "
+                             f"{entry['calls']:7d}  {entry['function']}")
+        return "\n".join(lines)
+
+
+_metrics = Metrics()
+
+
+def timed(name: Optional[str] = None):
+    """Decorator recording a function's wall/CPU time as a Metrics step."""
+    def decorate(func):
+        step = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _metrics.step(step):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write a file via a temp file, fsync and os.replace, so readers only
+    ever see the old or the new content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _metrics.file_io(path, written=len(data))
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class Transaction:
+    """File writes and deletes staged in memory and applied all-or-nothing.
+
+    While a transaction is active, read_page/write_page/delete_path go through
+    it: reads see staged content, each file is read from disk at most once,
+    and nothing on disk changes until commit(). Commit writes every file to a
+    temp file, fsyncs it and os.replace()s it into place, keeping the old
+    version aside; if any step fails, everything already applied is put back
+    before the error propagates. Callbacks registered with after_commit (e.g.
+    deriving image variants) run once the commit has succeeded.
+    """
+
+    def __init__(self):
+        self.staged: Dict[Path, Optional[bytes]] = {}  # None = delete
+        self.loaded: Dict[Path, str] = {}
+        self.callbacks: list = []
+        self.aborted = False
+        self.committed = False
+        self.written: List[Path] = []
+
+    def read(self, file_path: Path) -> str:
+        if file_path in self.staged:
+            data = self.staged[file_path]
+            if data is None:
+                raise FileNotFoundError(f"{file_path} is deleted in this transaction")
+            return data.decode()
+        if file_path not in self.loaded:
+            self.loaded[file_path] = _read_text(file_path)
+        return self.loaded[file_path]
+
+    def exists(self, file_path: Path) -> bool:
+        if file_path in self.staged:
+            return self.staged[file_path] is not None
+        return file_path.exists()
+
+    def write(self, file_path: Path, content) -> None:
+        if isinstance(content, str):
+            content = content.encode()
+        self.staged[file_path] = content
+
+    def delete(self, file_path: Path) -> None:
+        """Stage the removal of a file or a whole directory."""
+        self.staged[file_path] = None
+
+    def savepoint(self) -> tuple:
+        return dict(self.staged), len(self.callbacks)
+
+    def rollback_to(self, savepoint: tuple) -> None:
+        """Discard everything staged since `savepoint`."""
+        staged, callbacks = savepoint
+        self.staged = dict(staged)
+        del self.callbacks[callbacks:]
+
+    def abort(self) -> None:
+        self.aborted = True
+
+    @timed("Transaction.commit")
+    def commit(self) -> List[Path]:
+        """Apply every staged change. Returns the paths that changed on disk."""
+        if self.committed:
+            return self.written
+        suffix = f".{os.getpid()}.txn"
+        # (path, previous version moved aside)
+        applied: List[Tuple[Path, Optional[Path]]] = []
+        created_dirs: List[Path] = []
+        try:
+            for file_path, data in sorted(self.staged.items()):
+                if data is None:
+                    if file_path.exists():
+                        backup = file_path.with_name(f".{file_path.name}{suffix}")
+                        os.replace(file_path, backup)
+                        applied.append((file_path, backup))
+                    continue
+                if file_path in self.loaded:
+                    if self.loaded[file_path].encode() == data:
+                        continue
+                elif file_path.is_file():
+                    current = file_path.read_bytes()
+                    _metrics.file_io(file_path, read=len(current))
+                    if current == data:
+                        continue
+                missing = [d for d in [file_path.parent, *file_path.parent.parents]
+                           if not d.exists()]
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.extend(missing)
+                tmp = file_path.with_name(f".{file_path.name}{suffix}.tmp")
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                _metrics.file_io(file_path, written=len(data))
+                backup = None
+                if file_path.exists():
+                    backup = file_path.with_name(f".{file_path.name}{suffix}")
+                    try:
+                        os.link(file_path, backup)
+                    except OSError:
+                        shutil.copy2(file_path, backup)
+                applied.append((file_path, backup))
+                os.replace(tmp, file_path)
+            for directory in sorted({p.parent for p, _ in applied}):
+                _fsync_dir(directory)
+        except BaseException:
+            for file_path, backup in reversed(applied):
+                try:
+                    if backup is None:
+                        file_path.unlink(missing_ok=True)
+                    else:
+                        os.replace(backup, file_path)
+                        # rename() is a no-op if both names link the same inode
+                        backup.unlink(missing_ok=True)
+                except OSError as e:
+                    print(f"Error: could not restore {file_path}: {e}", file=sys.stderr)
+            for directory in created_dirs:
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+            for file_path in self.staged:
+                tmp = file_path.with_name(f".{file_path.name}{suffix}.tmp")
+                tmp.unlink(missing_ok=True)
+            raise
+        for _, backup in applied:
+            if backup is not None:
+                shutil.rmtree(backup) if backup.is_dir() else backup.unlink()
+        self.committed = True
+        self.written = [file_path for file_path, _ in applied]
+        return self.written
+
+
+_transaction: Optional[Transaction] = None
+
+
+@contextmanager
+def transaction():
+    """Stage every file change made in the block and commit them together
+    when it ends. Nothing is written if the block raises or calls abort();
+    a nested block joins the outer transaction."""
+    global _transaction
+    if _transaction is not None:
+        yield _transaction
+        return
+    txn = Transaction()
+    _transaction = txn
+    try:
+        yield txn
+    finally:
+        _transaction = None
+    if not txn.aborted:
+        txn.commit()
+        for callback in txn.callbacks:
+            callback()
+
+
+def after_commit(callback) -> None:
+    """Run `callback` once the active transaction commits (now if none is active)."""
+    if _transaction is not None:
+        _transaction.callbacks.append(callback)
+    else:
+        callback()
+
+
+def _read_text(file_path: Path) -> str:
+    data = file_path.read_bytes()
+    _metrics.file_io(file_path, read=len(data))
+    return data.decode()
+
+
+def read_page(file_path: Path) -> str:
+    if _transaction is not None:
+        return _transaction.read(file_path)
+    return _read_text(file_path)
+
+
+def page_exists(file_path: Path) -> bool:
+    if _transaction is not None:
+        return _transaction.exists(file_path)
+    return file_path.exists()
+
+
+def write_page(file_path: Path, content) -> None:
+    """Write text or bytes, staged in the active transaction or atomically now."""
+    if _transaction is not None:
+        _transaction.write(file_path, content)
+    else:
+        atomic_write(file_path,
+                     content.encode() if isinstance(content, str) else content)
+
+
+def delete_path(file_path: Path) -> None:
+    """Delete a file or directory, staged in the active transaction or now."""
+    if _transaction is not None:
+        _transaction.delete(file_path)
+    elif file_path.is_dir():
+        shutil.rmtree(file_path)
+    else:
+        file_path.unlink(missing_ok=True)
+
+
+def configure_http(connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                   read_timeout: float = DEFAULT_READ_TIMEOUT,
+                   retries: int = DEFAULT_RETRIES,
+                   backoff: float = DEFAULT_BACKOFF,
+                   pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """(Re)create the shared keep-alive session used for every HTB request.
+
+    Idempotent GETs are retried with exponential backoff on connection errors
+    and on 429/5xx responses (honouring Retry-After).
+    """
+    global _session, _timeout, _retries
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size,
+                          pool_maxsize=pool_size)
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if _session is not None:
+        _session.close()
+    _session = session
+    _timeout = (connect_timeout, read_timeout)
+    _retries = retries
+    return session
+
+
+def get_session() -> requests.Session:
+    return _session if _session is not None else configure_http()
+
+
+class CacheMiss(requests.exceptions.RequestException):
+    """Raised in offline mode when a URL has never been cached."""
+
+
+class HttpCache:
+    """Content-addressed on-disk cache for HTB profile and avatar responses.
+
+    index/<key>.json records the URL, machine, validators (ETag/Last-Modified)
+    and the SHA-256 of the body for each (machine, URL) pair; objects/<sha256>
+    holds the body itself, so identical avatars are stored once. Cached
+    entries are revalidated with If-None-Match/If-Modified-Since; in offline
+    mode they are served without touching the network.
+    """
+
+    def __init__(self, root: Path, offline: bool = False,
+                 max_age_days: float = DEFAULT_CACHE_MAX_AGE_DAYS,
+                 max_mb: float = DEFAULT_CACHE_MAX_MB):
+        self.root = root
+        self.offline = offline
+        self.max_age = max_age_days * 86400
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        (root / "index").mkdir(parents=True, exist_ok=True)
+        (root / "objects").mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        atomic_write(path, data)
+
+    def _index_path(self, machine: str, url: str) -> Path:
+        key = hashlib.sha256(f"{machine.lower()}\0{url}".encode()).hexdigest()
+        return self.root / "index" / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest
+
+    def lookup(self, machine: str, url: str) -> Optional[Tuple[dict, bytes]]:
+        try:
+            entry = json.loads(self._index_path(machine, url).read_text())
+            return entry, self._object_path(entry["sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, machine: str, url: str, body: bytes, headers) -> dict:
+        digest = hashlib.sha256(body).hexdigest()
+        obj = self._object_path(digest)
+        if not obj.exists():
+            self._write_atomic(obj, body)
+        now = time.time()
+        entry = {
+            "url": url,
+            "machine": machine.lower(),
+            "sha256": digest,
+            "size": len(body),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched": now,
+            "used": now,
+        }
+        self._write_atomic(self._index_path(machine, url), json.dumps(entry).encode())
+        return entry
+
+    def _touch(self, machine: str, url: str, entry: dict) -> None:
+        entry["used"] = time.time()
+        self._write_atomic(self._index_path(machine, url), json.dumps(entry).encode())
+
+    def get(self, url: str, machine: str, headers: Optional[dict] = None) -> bytes:
+        cached = self.lookup(machine, url)
+        if self.offline:
+            if cached is None:
+                raise CacheMiss(f"{url} is not cached (offline mode)")
+            self._touch(machine, url, cached[0])
+            _metrics.request(url, None, 0.0, 0, "cache")
+            return cached[1]
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            entry = cached[0]
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+        start = time.perf_counter()
+        response = get_session().get(url, headers=request_headers, timeout=_timeout)
+        if response.status_code == 304 and cached is not None:
+            _metrics.request(url, 304, time.perf_counter() - start, 0, "revalidated")
+            self._touch(machine, url, cached[0])
+            return cached[1]
+        _metrics.request(url, response.status_code, time.perf_counter() - start,
+                         len(response.content), "network")
+        response.raise_for_status()
+        self.store(machine, url, response.content, response.headers)
+        return response.content
+
+    def evict(self) -> Tuple[int, int]:
+        """Drop entries unused for max_age, then least-recently-used ones until
+        the cache fits in max_bytes. Returns (entries removed, bytes freed)."""
+        entries = []
+        for path in (self.root / "index").glob("*.json"):
+            try:
+                entries.append((path, json.loads(path.read_text())))
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+        entries.sort(key=lambda item: item[1].get("used", 0))
+
+        cutoff = time.time() - self.max_age
+        keep, removed = [], 0
+        for path, entry in entries:
+            if entry.get("used", 0) < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                keep.append((path, entry))
+        sizes = {e["sha256"]: e.get("size", 0) for _, e in keep if "sha256" in e}
+        while keep and sum(sizes.values()) > self.max_bytes:
+            path, entry = keep.pop(0)
+            path.unlink(missing_ok=True)
+            removed += 1
+            if not any(e.get("sha256") == entry.get("sha256") for _, e in keep):
+                sizes.pop(entry.get("sha256"), None)
+
+        freed = 0
+        live = {e.get("sha256") for _, e in keep}
+        for obj in (self.root / "objects").iterdir():
+            if obj.name not in live:
+                freed += obj.stat().st_size
+                obj.unlink(missing_ok=True)
+        return removed, freed
+
+
+def configure_cache(cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+                    offline: bool = False,
+                    max_age_days: float = DEFAULT_CACHE_MAX_AGE_DAYS,
+                    max_mb: float = DEFAULT_CACHE_MAX_MB) -> Optional[HttpCache]:
+    """Enable the on-disk HTTP cache, or disable it when cache_dir is None."""
+    global _cache
+    _cache = HttpCache(cache_dir, offline, max_age_days, max_mb) if cache_dir else None
+    return _cache
+
+
+def http_get(url: str, machine: str, headers: Optional[dict] = None) -> bytes:
+    """GET a URL through the cache (when enabled) and return the body."""
+    if _cache is not None:
+        return _cache.get(url, machine, headers)
+    start = time.perf_counter()
+    response = get_session().get(url, headers=headers, timeout=_timeout)
+    _metrics.request(url, response.status_code, time.perf_counter() - start,
+                     len(response.content), "network")
+    response.raise_for_status()
+    return response.content
+
+
+# ---- Avatar downloads ----
+#
+# Avatars are streamed into a partial file outside public/ (under the cache
+# directory, or the system temp dir with --no-cache) and only handed to the
+# transaction once they are complete and verified: size cap, Content-Type,
+# magic bytes and a full Pillow decode. An interrupted transfer keeps its
+# partial file and resumes with Range/If-Range, both on the next attempt and
+# on the next run. The verified body's SHA-256 and validators go into the
+# HTTP cache, so later runs revalidate with a conditional request instead of
+# downloading the avatar again.
+
+AVATAR_MAX_BYTES = 5 * 1024 * 1024
+DOWNLOAD_CHUNK = 64 * 1024
+IMAGE_MAGIC = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+
+class DownloadError(requests.exceptions.RequestException):
+    """A download was rejected: too large, not an image, or corrupt."""
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """MIME type from the file's magic bytes, or None if not a known image."""
+    for magic, mime in IMAGE_MAGIC:
+        if data.startswith(magic):
+            return mime
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def verify_image(data: bytes) -> str:
+    """Check that `data` is a complete, decodable image; returns its MIME type."""
+    mime = sniff_image_type(data)
+    if mime is None:
+        raise DownloadError("response is not a PNG, JPEG, GIF or WebP image")
+    try:
+        from PIL import Image
+    except ImportError:
+        return mime  # magic bytes only; Pillow is needed for the decode check
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.verify()
+        with Image.open(io.BytesIO(data)) as image:
+            image.load()
+    except Exception as e:
+        raise DownloadError(f"image failed to decode: {e}") from e
+    return mime
+
+
+def partial_path(url: str) -> Path:
+    if _cache is not None:
+        root = _cache.root
+    else:
+        root = Path(tempfile.gettempdir()) / "htb_writeup"
+    return root / "partial" / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.part"
+
+
+def _check_content_type(response: requests.Response, url: str) -> None:
+    content_type = response.headers.get("Content-Type", "")
+    content_type = content_type.split(";")[0].strip().lower()
+    if (content_type and not content_type.startswith("image/")
+            and content_type != "application/octet-stream"):
+        raise DownloadError(f"{url} returned {content_type}, not an image")
+
+
+def _iter_body(response: requests.Response):
+    """Yield the body as it arrives. urllib3 2's read1() hands back whatever
+    has been received, so a dropped connection loses nothing already sent."""
+    read1 = getattr(response.raw, "read1", None)
+    if read1 is None:
+        yield from response.iter_content(DOWNLOAD_CHUNK)
+        return
+    try:
+        while True:
+            chunk = read1(DOWNLOAD_CHUNK, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+    except Exception as e:
+        raise requests.exceptions.ChunkedEncodingError(str(e)) from e
+
+
+def _stream_to_partial(url: str, part: Path, headers: dict,
+                       max_bytes: int) -> Optional[requests.Response]:
+    """One attempt at fetching `url` into `part`, resuming from its current
+    size. Returns None on 304 (the cached copy is current), else the response
+    once the body is complete."""
+    meta = part.with_suffix(".json")
+    have = part.stat().st_size if part.exists() else 0
+    request_headers = dict(headers)
+    if have:
+        try:
+            validator = json.loads(meta.read_text()).get("validator")
+        except (OSError, ValueError):
+            validator = None
+        if validator:
+            request_headers["Range"] = f"bytes={have}-"
+            request_headers["If-Range"] = validator
+        else:
+            have = 0
+    start = time.perf_counter()
+    response = get_session().get(url, headers=request_headers, timeout=_timeout,
+                                 stream=True)
+    with response:
+        if response.status_code == 304:
+            _metrics.request(url, 304, time.perf_counter() - start, 0, "revalidated")
+            return None
+        if response.status_code == 416:
+            part.unlink(missing_ok=True)  # our partial no longer matches; start over
+            raise requests.exceptions.ConnectionError(
+                f"{url}: stale partial download discarded")
+        response.raise_for_status()
+        _check_content_type(response, url)
+        resumed = response.status_code == 206 and response.headers.get(
+            "Content-Range", "").startswith(f"bytes {have}-")
+        offset = have if resumed else 0
+        length = response.headers.get("Content-Length")
+        expected = offset + int(length) if length and length.isdigit() else None
+        if expected is not None and expected > max_bytes:
+            raise DownloadError(
+                f"{url} is {expected} bytes, over the {max_bytes} byte limit")
+
+        part.parent.mkdir(parents=True, exist_ok=True)
+        validator = (response.headers.get("ETag")
+                     or response.headers.get("Last-Modified"))
+        meta.write_text(json.dumps({"url": url, "validator": validator}))
+        received = offset
+        with open(part, "ab" if resumed else "wb") as f:
+            for chunk in _iter_body(response):
+                received += len(chunk)
+                if received > max_bytes:
+                    f.close()
+                    part.unlink(missing_ok=True)
+                    raise DownloadError(f"{url} exceeded the {max_bytes} byte limit")
+                f.write(chunk)
+        _metrics.request(url, response.status_code, time.perf_counter() - start,
+                         received - offset, "network")
+        if expected is not None and received != expected:
+            raise requests.exceptions.ConnectionError(
+                f"{url}: got {received} of {expected} bytes; will resume")
+        return response
+
+
+@timed()
+def download_image(url: str, machine: str, max_bytes: int = AVATAR_MAX_BYTES) -> bytes:
+    """Download an image through the partial-file path and return its verified
+    bytes. Uses (and fills) the HTTP cache when it is enabled."""
+    cached = _cache.lookup(machine, url) if _cache is not None else None
+    if _cache is not None and _cache.offline:
+        if cached is None:
+            raise CacheMiss(f"{url} is not cached (offline mode)")
+        _metrics.request(url, None, 0.0, 0, "cache")
+        verify_image(cached[1])
+        return cached[1]
+
+    headers = {}
+    if cached is not None:
+        if cached[0].get("etag"):
+            headers["If-None-Match"] = cached[0]["etag"]
+        if cached[0].get("last_modified"):
+            headers["If-Modified-Since"] = cached[0]["last_modified"]
+    part = partial_path(url)
+    for attempt in range(_retries + 1):
+        try:
+            response = _stream_to_partial(url, part, headers, max_bytes)
+            break
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout):
+            if attempt == _retries:
+                raise
+            time.sleep(DEFAULT_BACKOFF * 2 ** attempt)
+
+    if response is None:
+        _cache._touch(machine, url, cached[0])
+        return cached[1]
+    data = part.read_bytes()
+    try:
+        verify_image(data)
+    finally:
+        part.unlink(missing_ok=True)
+        part.with_suffix(".json").unlink(missing_ok=True)
+    if _cache is not None:
+        _cache.store(machine, url, data, response.headers)
+    return data
+
+
+@timed()
+def fetch_machine_profile(machine_name: str, token: str) -> dict:
+    """Fetch the machine's profile "info" object from the HTB API."""
+    api_url = f"{HTB_API_BASE}/machine/profile/{machine_name}"
+    body = http_get(api_url, machine_name, headers={"Authorization": f"Bearer {token}"})
+    info = json.loads(body).get("info", {})
+    store = machine_store()
+    if info and store is not None:
+        store.put(machine_name, info)
+    return info
+
+
+@timed()
 def download_machine_image(machine_name: str) -> Tuple[bool, str]:
     """Download machine avatar from HTB. Returns (success, image_path)."""
     token = os.getenv("HTB_TOKEN")
-    if not token:
+    if not token and not (_cache is not None and _cache.offline):
         print("Error: HTB_TOKEN environment variable is not set.", file=sys.stderr)
         print("Set it with: export HTB_TOKEN=your_token", file=sys.stderr)
         return False, ""
 
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-    }
-    api_url = f"{HTB_API_BASE}/machine/profile/{machine_name}"
     print(f"Fetching machine profile: {machine_name}")
 
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        machine_info = data.get("info", {})
+        machine_info = fetch_machine_profile(machine_name, token)
         if not machine_info:
             print(f"Error: Machine '{machine_name}' not found or invalid response.", file=sys.stderr)
             return False, ""
@@ -71,21 +910,21 @@ def download_machine_image(machine_name: str) -> Tuple[bool, str]:
             return False, ""
         image_url = avatar_path if avatar_path.startswith("http") else f"{HTB_IMAGE_BASE}{avatar_path}"
         print(f"Downloading image from: {image_url}")
-        img_response = requests.get(
-            image_url,
-            headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"},
-            stream=True,
-        )
-        img_response.raise_for_status()
+        image_bytes = download_image(image_url, machine_name)
         machine_name_lower = machine_name.lower()
-        output_dir = Path("public/images/writeups") / machine_name_lower
-        output_dir.mkdir(parents=True, exist_ok=True)
-        filename = output_dir / "machine.png"
-        with open(filename, "wb") as f:
-            for chunk in img_response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        filename = Path("public/images/writeups") / machine_name_lower / "machine.png"
         image_path = f"/images/writeups/{machine_name_lower}/machine.png"
-        print(f"Image saved: {filename}")
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        if filename.exists() and (filename.read_bytes() == image_bytes or (
+                _build_state is not None
+                and _build_state.fresh("avatar", machine_name_lower, digest))):
+            print(f"Image unchanged: {filename}")
+        else:
+            write_page(filename, image_bytes)
+            print(f"Image saved: {filename}")
+            if _build_state is not None:
+                _build_state.record("avatar", machine_name_lower, digest,
+                                    {filename: digest})
         return True, image_path
     except requests.exceptions.HTTPError as e:
         print(f"HTTP Error: {e}", file=sys.stderr)
@@ -102,546 +941,4102 @@ def download_machine_image(machine_name: str) -> Tuple[bool, str]:
         return False, ""
 
 
-def format_tags_for_home(tags: list) -> list:
-    return [tag.lower() for tag in tags]
+def download_machine_images(machine_names: List[str], workers: int = DEFAULT_WORKERS
+                            ) -> Dict[str, Tuple[bool, str]]:
+    """Download avatars for many machines in parallel over the shared session."""
+    results: Dict[str, Tuple[bool, str]] = {}
+    if not machine_names:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(download_machine_image, name): name
+                   for name in machine_names}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
 
 
-def format_tags_for_writeups(tags: list) -> list:
-    return [tag.capitalize() for tag in tags]
+# ---- Machine metadata store ----
+#
+# Every HTB profile fetched is kept in a SQLite database next to the HTTP
+# cache (machines.db): the card fields (difficulty, OS, IP), release date and
+# stats in columns, and the full profile JSON, keyed by lowercase machine
+# name. Create and batch manifests fill a missing --difficulty/--os/--ip from
+# it without a network round trip, fetching the profile only on a miss.
+# `sync` refreshes every known machine (the store plus the registry's HTB
+# writeups) concurrently with If-None-Match/If-Modified-Since, spacing the
+# requests out with a shared rate limiter, and reports where writeups.json
+# disagrees with HTB.
 
+DEFAULT_MACHINE_DB = DEFAULT_CACHE_DIR / "machines.db"
+MACHINE_DB_VERSION = 1
+DEFAULT_SYNC_RATE = 2.0  # requests per second
+DIFFICULTIES = ("Easy", "Medium", "Hard", "Insane")
+OS_NAMES = ("Linux", "Windows")
+MACHINE_FIELDS = ("difficulty", "os", "ip")
 
-def format_tags_for_tags_page(tags: list) -> list:
-    return [tag.lower() for tag in tags]
+_MACHINE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS machines (
+    name TEXT PRIMARY KEY,
+    display_name TEXT NOT NULL,
+    htb_id INTEGER,
+    difficulty TEXT,
+    os TEXT,
+    ip TEXT,
+    release TEXT,
+    retired INTEGER,
+    stars REAL,
+    user_owns INTEGER,
+    root_owns INTEGER,
+    profile TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    updated REAL NOT NULL,
+    checked REAL NOT NULL
+)
+"""
 
 
-def get_next_id(file_path: Path) -> int:
+def release_date(value) -> Optional[str]:
+    """An HTB timestamp ("2019-04-20T19:00:00.000000Z") in the site's date format."""
     try:
-        content = file_path.read_text()
-        ids = re.findall(r"id:\s*(\d+)", content)
-        return max(int(i) for i in ids) + 1 if ids else 1
-    except Exception:
-        return 1
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").strftime("%b %d, %Y")
+    except ValueError:
+        return None
 
 
-def add_card_to_home(machine_name: str, title: str, excerpt: str, tags: list,
-                     image_path: str, link: str, os: str, date: str) -> bool:
-    try:
-        file_path = Path("src/pages/Home.js")
-        content = file_path.read_text()
-        next_id = get_next_id(file_path)
-        formatted_tags = format_tags_for_home(tags)
-        new_card = f"""    {{
-      id: {next_id},
-      title: '{title}',
-      excerpt: '{excerpt.replace("'", "\\'")}',
-      date: '{date}',
-      category: 'writeup',
-      tags: {formatted_tags},
-      image: '{image_path}',
-      link: '{link}',
-      os: '{os}'
-    }},"""
-        pattern = r"(recentPosts = useMemo\(\(\) => \[)"
-        match = re.search(pattern, content)
-        if match:
-            insert_pos = match.end()
-            while insert_pos < len(content) and content[insert_pos] in " \n\t":
-                insert_pos += 1
-            content = content[:insert_pos] + "\n" + new_card + content[insert_pos:]
-            file_path.write_text(content)
-            print("✓ Added card to Home.js")
-            return True
-        return False
-    except Exception as e:
-        print(f"Error adding card to Home.js: {e}", file=sys.stderr)
-        return False
+class MachineStore:
+    """SQLite store of HTB machine profiles, safe to share between threads."""
 
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(path), check_same_thread=False,
+                                  isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != MACHINE_DB_VERSION:
+            self.db.execute("DROP TABLE IF EXISTS machines")
+            self.db.execute(f"PRAGMA user_version = {MACHINE_DB_VERSION}")
+        self.db.execute(_MACHINE_SCHEMA)
 
-def add_card_to_writeups(machine_name: str, title: str, excerpt: str, tags: list,
-                         image_path: str, link: str, difficulty: str, os: str, date: str) -> bool:
-    try:
-        file_path = Path("src/pages/Writeups.js")
-        content = file_path.read_text()
-        next_id = get_next_id(file_path)
-        formatted_tags = format_tags_for_writeups(tags)
-        new_card = f"""    {{
-      id: {next_id},
-      title: '{title}',
-      excerpt: '{excerpt.replace("'", "\\'")}',
-      date: '{date}',
-      tags: {formatted_tags},
-      image: '{image_path}',
-      link: '{link}',
-      difficulty: '{difficulty}',
-      category: 'writeup',
-      os: '{os}'
-    }},"""
-        pattern = r"(writeups = useMemo\(\(\) => \[)"
-        match = re.search(pattern, content)
-        if match:
-            insert_pos = match.end()
-            while insert_pos < len(content) and content[insert_pos] in " \n\t":
-                insert_pos += 1
-            content = content[:insert_pos] + "\n" + new_card + content[insert_pos:]
-            file_path.write_text(content)
-            print("✓ Added card to Writeups.js")
-            return True
-        return False
-    except Exception as e:
-        print(f"Error adding card to Writeups.js: {e}", file=sys.stderr)
-        return False
+    def get(self, machine: str) -> Optional[dict]:
+        with self.lock:
+            row = self.db.execute("SELECT * FROM machines WHERE name = ?",
+                                  (machine.lower(),)).fetchone()
+        return dict(row) if row else None
 
+    def all(self) -> List[dict]:
+        with self.lock:
+            rows = self.db.execute("SELECT * FROM machines ORDER BY name")
+            return [dict(row) for row in rows]
 
-def add_card_to_tags(machine_name: str, title: str, tags: list) -> bool:
-    try:
-        file_path = Path("src/pages/Tags.js")
-        content = file_path.read_text()
-        next_id = get_next_id(file_path)
-        formatted_tags = format_tags_for_tags_page(tags)
-        new_card = f"""    {{
-      id: {next_id},
-      title: '{title}',
-      category: 'writeup',
-      tags: {formatted_tags}
-    }},"""
-        pattern = r"(const allPosts = \[)"
-        match = re.search(pattern, content)
-        if match:
-            insert_pos = match.end()
-            while insert_pos < len(content) and content[insert_pos] in " \n\t":
-                insert_pos += 1
-            content = content[:insert_pos] + "\n" + new_card + content[insert_pos:]
-            file_path.write_text(content)
-            print("✓ Added card to Tags.js")
-            return True
-        return False
-    except Exception as e:
-        print(f"Error adding card to Tags.js: {e}", file=sys.stderr)
-        return False
+    def put(self, machine: str, info: dict, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> bool:
+        """Store a profile; returns True if it differs from the stored one."""
+        profile = json.dumps(info, sort_keys=True, separators=(",", ":"))
+        previous = self.get(machine)
+        now = time.time()
+        unchanged = previous is not None and previous["profile"] == profile
+        row = (machine.lower(), str(info.get("name") or machine), info.get("id"),
+               info.get("difficultyText"), info.get("os"), info.get("ip"),
+               release_date(info.get("release")), 1 if info.get("retired") else 0,
+               info.get("stars"), info.get("user_owns_count"),
+               info.get("root_owns_count"), profile, etag, last_modified,
+               previous["updated"] if unchanged else now, now)
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO machines VALUES "
+                            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+        return previous is None or previous["profile"] != profile
 
+    def touch(self, machine: str) -> None:
+        """Record a revalidation that found the profile unchanged."""
+        with self.lock:
+            self.db.execute("UPDATE machines SET checked = ? WHERE name = ?",
+                            (time.time(), machine.lower()))
 
-def add_card_to_tag_detail(machine_name: str, title: str, excerpt: str, tags: list,
-                           image_path: str, link: str, date: str, os: str) -> bool:
-    try:
-        file_path = Path("src/pages/TagDetail.js")
-        content = file_path.read_text()
-        next_id = get_next_id(file_path)
-        formatted_tags = format_tags_for_tags_page(tags)
-        new_card = f"""    {{
-      id: {next_id},
-      title: '{title}',
-      excerpt: '{excerpt.replace("'", "\\'")}',
-      date: '{date}',
-      tags: {formatted_tags},
-      image: '{image_path}',
-      link: '{link}',
-      category: 'writeup',
-      os: '{os}'
-    }},"""
-        pattern = r"(const allPosts = \[)"
-        match = re.search(pattern, content)
-        if match:
-            insert_pos = match.end()
-            while insert_pos < len(content) and content[insert_pos] in " \n\t":
-                insert_pos += 1
-            content = content[:insert_pos] + "\n" + new_card + content[insert_pos:]
-            file_path.write_text(content)
-            print("✓ Added card to TagDetail.js")
-            return True
-        return False
-    except Exception as e:
-        print(f"Error adding card to TagDetail.js: {e}", file=sys.stderr)
-        return False
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
 
 
-def create_writeup_component(machine_name: str, title: str, excerpt: str, tags: list,
-                             difficulty: str, os: str, ip: str, date: str, image_path: str) -> bool:
-    """Create writeup React component from EditorWalkthrough template (current site format)."""
-    try:
-        machine_name_lower = machine_name.lower()
-        component_name = f"{machine_name.capitalize()}Walkthrough"
-        component_dir = Path(f"src/pages/writeups/{machine_name_lower}")
-        component_dir.mkdir(parents=True, exist_ok=True)
-
-        template_path = Path("src/pages/writeups/editor/EditorWalkthrough.js")
-        template_content = template_path.read_text()
-
-        machine_title = title.replace(" Walkthrough", "")
-        formatted_tags_writeups = format_tags_for_writeups(tags)
-        escaped_excerpt = excerpt.replace("'", "\\'")
-
-        # New format: content starts with ## Overview (no # Title line), TOC uses title prop
-        writeup_data = f"""  const writeup = {{
-    id: '{machine_name_lower}-walkthrough',
-    title: '{title}',
-    excerpt: '{escaped_excerpt}',
-    date: '{date}',
-    tags: {formatted_tags_writeups},
-    difficulty: '{difficulty}',
-    os: '{os}',
-    ip: '{ip}',
-    content: `## Overview
-{excerpt}
-
-## Enumeration
-
-## Foothold
-
-## Privilege Escalation
-
-## Conclusion
-`}};"""
-
-        # Match writeup block: from "const writeup = {" to closing backtick (not escaped) + "};"
-        pattern = r"const writeup = \{[\s\S]*?(?<!\\)`\s*\}\;"
-        template_content = re.sub(pattern, writeup_data, template_content, count=1)
-
-        # Component and path names (Editor -> new machine)
-        template_content = template_content.replace("EditorWalkthrough", component_name)
-        template_content = template_content.replace("editor", machine_name_lower)
-        template_content = template_content.replace("Editor", machine_title)
-
-        # Image paths and alt
-        template_content = template_content.replace(
-            "/images/writeups/editor/machine.png",
-            image_path,
-        )
-        template_content = template_content.replace(
-            "alt=\"Editor\"",
-            f"alt=\"{machine_title}\"",
-        )
+_machines: Optional[MachineStore] = None
+_machines_path: Optional[Path] = DEFAULT_MACHINE_DB
 
-        component_file = component_dir / f"{component_name}.js"
-        component_file.write_text(template_content)
-        print(f"✓ Created writeup component: {component_file}")
 
-        css_template = Path("src/pages/writeups/editor/EditorWalkthrough.css")
-        if css_template.exists():
-            css_content = css_template.read_text()
-            css_content = css_content.replace("Editor", machine_title)
-            css_file = component_dir / f"{component_name}.css"
-            css_file.write_text(css_content)
-            print(f"✓ Created CSS: {css_file}")
+def configure_machine_store(path: Optional[Path] = DEFAULT_MACHINE_DB) -> None:
+    """Use the store at `path` (opened on first use), or none when path is None."""
+    global _machines, _machines_path
+    if _machines is not None:
+        _machines.close()
+    _machines, _machines_path = None, path
 
-        return True
-    except Exception as e:
-        print(f"Error creating writeup component: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
-        return False
 
+def machine_store() -> Optional[MachineStore]:
+    global _machines
+    if _machines is None and _machines_path is not None:
+        try:
+            _machines = MachineStore(_machines_path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: machine store {_machines_path} unavailable: {e}",
+                  file=sys.stderr)
+            configure_machine_store(None)
+    return _machines
 
-def add_route_to_writeup_detail(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/WriteupDetail.js")
-        content = file_path.read_text()
-        machine_name_lower = machine_name.lower()
-        component_name = f"{machine_name.capitalize()}Walkthrough"
-        route_id = f"{machine_name_lower}-walkthrough"
-        import_line = f"import {component_name} from './writeups/{machine_name_lower}/{component_name}';"
-
-        import_pattern = r"(import \w+Walkthrough from './writeups/[\w/]+';)"
-        matches = list(re.finditer(import_pattern, content))
-        if matches:
-            last_import = matches[-1]
-            insert_pos = last_import.end()
-            content = content[:insert_pos] + "\n" + import_line + content[insert_pos:]
-        else:
-            print("Error: Could not find import section in WriteupDetail.js", file=sys.stderr)
-            return False
 
-        start_pattern = r"const writeupComponents = \{"
-        start_match = re.search(start_pattern, content)
-        if not start_match:
-            print("Error: Could not find writeupComponents in WriteupDetail.js", file=sys.stderr)
-            return False
-        start_pos = start_match.end()
-        brace_count = 1
-        pos = start_pos
-        end_pos = None
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == "{":
-                brace_count += 1
-            elif content[pos] == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    semicolon_pos = pos + 1
-                    while semicolon_pos < len(content) and content[semicolon_pos] in " \n\t":
-                        semicolon_pos += 1
-                    if semicolon_pos < len(content) and content[semicolon_pos] == ";":
-                        end_pos = semicolon_pos + 1
-                        break
-            pos += 1
-        if end_pos is None:
-            return False
-        closing_brace_pos = None
-        for i in range(end_pos - 1, start_pos - 1, -1):
-            if content[i] == "}":
-                closing_brace_pos = i
-                break
-        if closing_brace_pos is None:
-            return False
-        object_content = content[start_pos:closing_brace_pos]
-        lines = object_content.split("\n")
-        last_entry_line_idx = None
-        for i in range(len(lines) - 1, -1, -1):
-            line = lines[i].strip()
-            if line and "':" in line and not line.startswith("//"):
-                last_entry_line_idx = i
-                break
-        if last_entry_line_idx is not None:
-            last_line = lines[last_entry_line_idx]
-            if not last_line.rstrip().endswith(","):
-                lines[last_entry_line_idx] = last_line.rstrip() + ","
-                object_content = "\n".join(lines)
-        component_entry = f"    '{route_id}': {component_name}"
-        before_object = content[:start_pos]
-        after_object = content[end_pos:]
-        new_content = before_object + object_content + "\n" + component_entry + "\n  };" + after_object
-        file_path.write_text(new_content)
-        print("✓ Added route to WriteupDetail.js")
-        return True
-    except Exception as e:
-        print(f"Error adding route: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
-        return False
+def machine_defaults(machine: str) -> dict:
+    """Difficulty, OS and IP of a machine: from the store, or
+    from its HTB profile (which is then stored) on a miss. Values the create
+    options do not accept are left out."""
+    store = machine_store()
+    row = store.get(machine) if store is not None else None
+    offline = _cache is not None and _cache.offline
+    if row is None and (os.getenv("HTB_TOKEN") or offline):
+        try:
+            fetch_machine_profile(machine, os.getenv("HTB_TOKEN"))
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Warning: could not fetch the {machine} profile: {e}",
+                  file=sys.stderr)
+        row = store.get(machine) if store is not None else None
+    if row is None:
+        return {}
+    defaults = {"difficulty": (row["difficulty"] if row["difficulty"] in DIFFICULTIES
+                               else None),
+                "os": row["os"] if row["os"] in OS_NAMES else None,
+                "ip": row["ip"]}
+    return {key: value for key, value in defaults.items() if value}
 
 
-# ---- Remove functions (same logic as create_htb_writeup.py) ----
+def fill_machine_fields(machine: str, fields: dict) -> List[str]:
+    """Fill the missing difficulty/os/ip in `fields` from machine_defaults();
+    returns the names filled."""
+    missing = [key for key in MACHINE_FIELDS if not fields.get(key)]
+    if not missing:
+        return []
+    defaults = machine_defaults(machine)
+    filled = [key for key in missing if key in defaults]
+    for key in filled:
+        fields[key] = defaults[key]
+    return filled
 
-def remove_card_from_home(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/Home.js")
-        content = file_path.read_text()
-        link_pattern = f"/writeups/{machine_name.lower()}-walkthrough"
-        pattern = r"(\s*\{\s*id:\s*\d+,[\s\S]*?link:\s*'[^']*',[\s\S]*?\},?\s*\n)"
-        for match in re.finditer(pattern, content):
-            if link_pattern in match.group(1):
-                content = content[: match.start()] + content[match.end() :]
-                file_path.write_text(content)
-                print("✓ Removed card from Home.js")
-                return True
-        return False
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
 
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart, across threads."""
 
-def remove_card_from_writeups(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/Writeups.js")
-        content = file_path.read_text()
-        link_pattern = f"/writeups/{machine_name.lower()}-walkthrough"
-        pattern = r"(\s*\{\s*id:\s*\d+,[\s\S]*?link:\s*'[^']*',[\s\S]*?\},?\s*\n)"
-        for match in re.finditer(pattern, content):
-            if link_pattern in match.group(1):
-                content = content[: match.start()] + content[match.end() :]
-                file_path.write_text(content)
-                print("✓ Removed card from Writeups.js")
-                return True
-        return False
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next = 0.0
 
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next)
+            self.next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
-def remove_card_from_tags(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/Tags.js")
-        content = file_path.read_text()
-        title_pattern = f"{machine_name.capitalize()} Walkthrough"
-        pattern = r"(\s*\{\s*id:\s*\d+,[\s\S]*?title:\s*'[^']*',[\s\S]*?\},?\s*\n)"
-        for match in re.finditer(pattern, content):
-            if title_pattern in match.group(1) or machine_name.lower() in match.group(1).lower():
-                content = content[: match.start()] + content[match.end() :]
-                file_path.write_text(content)
-                print("✓ Removed card from Tags.js")
-                return True
-        return False
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
 
+def fetch_profile_conditional(machine: str, token: str, cached: Optional[dict],
+                              limiter: RateLimiter) -> Tuple[Optional[dict], dict]:
+    """GET a machine profile, revalidating the stored copy. Returns (None, {})
+    on 304, else (profile info, validators)."""
+    url = f"{HTB_API_BASE}/machine/profile/{machine}"
+    headers = {"Authorization": f"Bearer {token}"}
+    if cached is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached is not None and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    limiter.wait()
+    start = time.perf_counter()
+    response = get_session().get(url, headers=headers, timeout=_timeout)
+    if response.status_code == 304 and cached is not None:
+        _metrics.request(url, 304, time.perf_counter() - start, 0, "revalidated")
+        return None, {}
+    _metrics.request(url, response.status_code, time.perf_counter() - start,
+                     len(response.content), "network")
+    response.raise_for_status()
+    info = json.loads(response.content).get("info")
+    if not info:
+        raise ValueError(f"no profile for {machine}")
+    return info, {"etag": response.headers.get("ETag"),
+                  "last_modified": response.headers.get("Last-Modified")}
 
-def remove_card_from_tag_detail(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/TagDetail.js")
-        content = file_path.read_text()
-        link_pattern = f"/writeups/{machine_name.lower()}-walkthrough"
-        pattern = r"(\s*\{\s*id:\s*\d+,[\s\S]*?link:\s*'[^']*',[\s\S]*?\},?\s*\n)"
-        for match in re.finditer(pattern, content):
-            if link_pattern in match.group(1):
-                content = content[: match.start()] + content[match.end() :]
-                file_path.write_text(content)
-                print("✓ Removed card from TagDetail.js")
-                return True
-        return False
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
 
+def known_machines(registry: "Registry", store: MachineStore) -> Dict[str, str]:
+    """Lowercase name -> HTB name of every stored machine and HTB writeup."""
+    names = {row["name"]: row["display_name"] for row in store.all()}
+    for post in registry.writeups:
+        if post.get("slug") and "htb" in post.get("tags", []):
+            names.setdefault(post["slug"], post["title"].removesuffix(" Walkthrough"))
+    return names
 
-def remove_route_from_writeup_detail(machine_name: str) -> bool:
-    try:
-        file_path = Path("src/pages/WriteupDetail.js")
-        content = file_path.read_text()
-        machine_name_lower = machine_name.lower()
-        component_name = f"{machine_name.capitalize()}Walkthrough"
-        route_id = f"{machine_name_lower}-walkthrough"
-        import_pattern = f"import {component_name} from './writeups/{machine_name_lower}/{component_name}';"
-        content = content.replace(import_pattern + "\n", "").replace(import_pattern, "")
-        pattern = rf"(\s*)'{route_id}':\s*{component_name},?\s*\n"
-        matches = list(re.finditer(pattern, content))
-        if matches:
-            content = content[: matches[0].start()] + content[matches[0].end() :]
-            start_pattern = r"const writeupComponents = \{"
-            start_match = re.search(start_pattern, content)
-            if start_match:
-                start_pos = start_match.end()
-                brace_count = 1
-                pos = start_pos
-                end_pos = None
-                while pos < len(content) and brace_count > 0:
-                    if content[pos] == "{":
-                        brace_count += 1
-                    elif content[pos] == "}":
-                        brace_count -= 1
-                        if brace_count == 0:
-                            semicolon_pos = pos + 1
-                            while semicolon_pos < len(content) and content[semicolon_pos] in " \n\t":
-                                semicolon_pos += 1
-                            if semicolon_pos < len(content) and content[semicolon_pos] == ";":
-                                end_pos = semicolon_pos + 1
-                                break
-                    pos += 1
-                if end_pos:
-                    object_content = content[start_pos : end_pos - 1]
-                    lines = object_content.split("\n")
-                    for i in range(len(lines) - 1, -1, -1):
-                        if lines[i].strip() and "':" in lines[i] and not lines[i].strip().startswith("//"):
-                            if lines[i].rstrip().endswith(","):
-                                lines[i] = lines[i].rstrip()[:-1]
-                                content = content[:start_pos] + "\n".join(lines) + content[end_pos - 1 :]
-                            break
-        file_path.write_text(content)
-        print("✓ Removed route from WriteupDetail.js")
-        return True
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+
+@timed()
+def sync_machines(registry: "Registry", extra: List[str], token: str,
+                  workers: int = DEFAULT_WORKERS,
+                  rate: float = DEFAULT_SYNC_RATE) -> bool:
+    """Refresh every known machine's profile (plus `extra`) in the store and
+    report registry fields that disagree with HTB. Returns False if any
+    refresh failed."""
+    store = machine_store()
+    if store is None:
         return False
+    names = known_machines(registry, store)
+    for name in extra:
+        names[name.lower()] = name
+    if not names:
+        print("No machines to sync.")
+        return True
 
+    limiter = RateLimiter(rate)
+    counts = {"updated": 0, "unchanged": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_profile_conditional, name, token, store.get(key),
+                               limiter): (key, name)
+                   for key, name in sorted(names.items())}
+        for future in as_completed(futures):
+            key, name = futures[future]
+            try:
+                info, validators = future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"✗ {name}: {e}", file=sys.stderr)
+                counts["failed"] += 1
+                continue
+            if info is None:
+                store.touch(key)
+                counts["unchanged"] += 1
+            elif store.put(key, info, **validators):
+                print(f"✓ Updated {name}")
+                counts["updated"] += 1
+            else:
+                counts["unchanged"] += 1
 
-def remove_writeup_component(machine_name: str) -> bool:
-    try:
-        machine_name_lower = machine_name.lower()
-        component_name = f"{machine_name.capitalize()}Walkthrough"
-        component_dir = Path(f"src/pages/writeups/{machine_name_lower}")
-        for name in [f"{component_name}.js", f"{component_name}.css"]:
-            f = component_dir / name
-            if f.exists():
-                f.unlink()
-                print(f"✓ Removed {f}")
-        if component_dir.exists() and not any(component_dir.iterdir()):
-            component_dir.rmdir()
-            print(f"✓ Removed directory {component_dir}")
-        return True
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
+    # IPs are reassigned on every spawn, so only difficulty and OS are compared
+    for post in registry.writeups:
+        row = store.get(post.get("slug") or "") if post.get("slug") in names else None
+        for key in ("difficulty", "os"):
+            if row and row[key] and post.get(key) and row[key] != post[key]:
+                print(f"⚠ {post['slug']}: {key} is {post[key]!r} in {registry.path}, "
+                      f"{row[key]!r} on HTB")
+    print(f"✓ {len(names)} machine(s): {counts['updated']} updated, "
+          f"{counts['unchanged']} unchanged, {counts['failed']} failed ({store.path})")
+    return counts["failed"] == 0
 
 
-def remove_machine_image(machine_name: str) -> bool:
-    try:
-        import shutil
-        image_dir = Path(f"public/images/writeups/{machine_name.lower()}")
-        if image_dir.exists():
-            shutil.rmtree(image_dir)
-            print(f"✓ Removed image directory {image_dir}")
-            return True
-        return False
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return False
+# ---- Build state ----
+#
+# .htb_writeup_state.json remembers, per stage and key (e.g. "component" /
+# "dc02"), a hash of everything that went into the last run and the content
+# hash of every file it wrote. A stage whose inputs hash is unchanged and
+# whose outputs are still on disk as written is skipped. File hashes are
+# cached by (size, mtime), so unchanged files are not re-read.
+#
+# A stage's inputs also include its STAGE_VERSIONS entry. Bump it in the
+# same change as any edit to the code that renders that stage's output, so
+# existing outputs are regenerated; edits elsewhere in this script leave
+# every other stage's records valid.
 
+BUILD_STATE_PATH = Path(".htb_writeup_state.json")
+BUILD_STATE_VERSION = 1
+STAGE_VERSIONS = {
+    "component": 1,  # create_writeup_component, the writeup templates
+    "pages": 1,      # render_pages
+    "preview": 2,    # render_preview
+    "content": 1,    # parse_markdown, image_attributes
+    "search": 1,     # build_search_index
+    "feeds": 1,      # render_sitemap, render_feed
+    "tags": 1,       # tag_detail_card, the tag shard format
+    "snapshot": 1,   # render_snapshot
+}
 
-def remove_writeup(machine_name: str) -> bool:
-    print(f"\n{'='*60}\nRemoving writeup: {machine_name}\n{'='*60}\n")
-    success = True
-    if not remove_card_from_home(machine_name):
-        success = False
-    if not remove_card_from_writeups(machine_name):
-        success = False
-    if not remove_card_from_tags(machine_name):
-        success = False
-    if not remove_card_from_tag_detail(machine_name):
-        success = False
-    if not remove_route_from_writeup_detail(machine_name):
-        success = False
-    if not remove_writeup_component(machine_name):
-        success = False
-    if not remove_machine_image(machine_name):
-        success = False
+
+def hash_inputs(*parts) -> str:
+    """Stable hash of JSON-serialisable values."""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def stage_version(stage: str) -> str:
+    """The stage's code version, as the first of its hashed inputs."""
+    return f"{stage}/{STAGE_VERSIONS[stage]}"
+
+
+class BuildState:
+    """Persisted input/output hashes for incremental builds."""
+
+    def __init__(self, path: Path = BUILD_STATE_PATH, data: Optional[dict] = None):
+        data = data or {}
+        self.path = path
+        self.stages: Dict[str, Dict[str, dict]] = data.get("stages", {})
+        self.files: Dict[str, list] = data.get("files", {})
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: Path = BUILD_STATE_PATH) -> "BuildState":
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != BUILD_STATE_VERSION:
+            data = {}
+        return cls(path, data)
+
+    def file_hash(self, path: Path) -> Optional[str]:
+        """SHA-256 of a file, re-read only when its size or mtime changed."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = path.as_posix()
+        cached = self.files.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        data = path.read_bytes()
+        _metrics.file_io(path, read=len(data))
+        digest = hashlib.sha256(data).hexdigest()
+        self.files[key] = [st.st_size, st.st_mtime_ns, digest]
+        self.changed = True
+        return digest
+
+    def fresh(self, stage: str, key: str, inputs: str) -> bool:
+        """True if `stage` already ran for `key` with these inputs and its
+        outputs are intact."""
+        record = self.stages.get(stage, {}).get(key)
+        if not record or record["inputs"] != inputs:
+            return False
+        return all(self.file_hash(Path(p)) == h for p, h in record["outputs"].items())
+
+    def record(self, stage: str, key: str, inputs: str, outputs) -> None:
+        """Record a finished stage. `outputs` is a list of written paths, or a
+        {path: content hash} mapping for files not yet flushed to disk."""
+        if not isinstance(outputs, dict):
+            outputs = {path: self.file_hash(Path(path)) for path in outputs}
+        self.stages.setdefault(stage, {})[key] = {
+            "inputs": inputs,
+            "outputs": {Path(p).as_posix(): h
+                        for p, h in sorted(outputs.items(), key=lambda i: str(i[0]))},
+        }
+        self.changed = True
+
+    def update_output(self, path: Path, digest: Optional[str] = None) -> None:
+        """Re-hash `path` in every record that wrote it, after a later stage
+        (e.g. lossless recompression) rewrote it in place. Pass `digest` for
+        a file not yet flushed to disk."""
+        key = path.as_posix()
+        for records in self.stages.values():
+            for record in records.values():
+                if key in record["outputs"]:
+                    record["outputs"][key] = digest or self.file_hash(path)
+                    self.changed = True
+
+    def forget(self, key: str) -> None:
+        """Drop every stage record for `key` (e.g. a removed writeup)."""
+        for records in self.stages.values():
+            if records.pop(key, None) is not None:
+                self.changed = True
+
+    def save(self) -> bool:
+        if not self.changed:
+            return False
+        self.files = {p: v for p, v in self.files.items() if Path(p).exists()}
+        data = {"version": BUILD_STATE_VERSION, "stages": self.stages,
+                "files": self.files}
+        text = json.dumps(data, indent=1, sort_keys=True) + "\n"
+        atomic_write(self.path, text.encode())
+        self.changed = False
+        return True
+
+
+_build_state: Optional[BuildState] = None
+
+
+def configure_build_state(path: Optional[Path] = BUILD_STATE_PATH
+                          ) -> Optional[BuildState]:
+    """Load the build state from `path`; None disables incremental builds."""
+    global _build_state
+    _build_state = BuildState.load(path) if path is not None else None
+    return _build_state
+
+
+def save_build_state() -> None:
+    if _build_state is not None:
+        _build_state.save()
+
+
+def content_hash(path: Path) -> str:
+    """Content hash of a file, through the build state's stat cache when enabled."""
+    if _build_state is not None:
+        return _build_state.file_hash(path) or ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# ---- Image optimization ----
+#
+# Source images (PNG/JPEG under public/images) are recompressed losslessly in
+# place, and get WebP (and AVIF, when Pillow supports it) variants next to
+# them: <stem>-thumb.<ext> for cards and <stem>-full.<ext> for the writeup
+# body. public/images/manifest.json records each source's size and hash, so a
+# later run skips every file whose hash is unchanged and whose variants exist.
+#
+# The variants are build outputs: they are not committed (.gitignore) and the
+# manifest does not list them. Their size follows from the source's, so
+# image_variants() finds them by name, and only deploy builds
+# (`build --variants`, after optimize-images) put them into srcset.
+
+PUBLIC_DIR = Path("public")
+IMAGES_ROOT = PUBLIC_DIR / "images"
+IMAGE_MANIFEST = IMAGES_ROOT / "manifest.json"
+IMAGE_SOURCE_SUFFIXES = (".png", ".jpg", ".jpeg")
+IMAGE_VARIANTS = {"thumb": 480, "full": 1600}  # variant name -> max width
+DEFAULT_IMAGE_QUALITY = 80
+
+
+def image_formats(avif: bool = True) -> Tuple[str, ...]:
+    """Variant formats this Pillow build can write."""
+    from PIL import features
+    formats = ["webp"] if features.check("webp") else []
+    if avif and features.check("avif"):
+        formats.append("avif")
+    return tuple(formats)
+
+
+def image_web_path(path: Path) -> str:
+    """/images/... URL of a file under public/."""
+    return "/" + path.relative_to(PUBLIC_DIR).as_posix()
+
+
+def variant_size(width: int, height: int, max_width: int) -> Tuple[int, int]:
+    if width <= max_width:
+        return width, height
+    return max_width, max(1, round(height * max_width / width))
+
+
+def variant_path(source: Path, name: str, fmt: str) -> Path:
+    return source.with_name(f"{source.stem}-{name}.{fmt}")
+
+
+def image_variants(src: str, entry: Optional[dict]) -> Dict[str, dict]:
+    """The variants of the manifest entry for `src` that exist under public/,
+    keyed "<name>.<format>" ({path, width, height, bytes})."""
+    if not entry:
+        return {}
+    source = PUBLIC_DIR / src.lstrip("/")
+    variants = {}
+    for name, max_width in IMAGE_VARIANTS.items():
+        width, height = variant_size(entry["width"], entry["height"], max_width)
+        for fmt in ("webp", "avif"):
+            path = variant_path(source, name, fmt)
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            variants[f"{name}.{fmt}"] = {"path": image_web_path(path), "width": width,
+                                         "height": height, "bytes": size}
+    return variants
+
+
+def optimize_image(source: str, quality: int, formats: Tuple[str, ...]
+                   ) -> Tuple[dict, Dict[str, bytes]]:
+    """Optimize one image and encode its variants. Returns its manifest entry
+    and the files to write ({path: bytes}: the recompressed source, if it
+    shrank, and every variant).
+
+    Runs in a worker process, so it only takes and returns plain values and
+    leaves the writing to the caller's transaction.
+    """
+    from PIL import Image
+
+    path = Path(source)
+    data = path.read_bytes()
+    files: Dict[str, bytes] = {}
+    with Image.open(io.BytesIO(data)) as img:
+        img.load()
+        if img.format == "PNG":
+            out = io.BytesIO()
+            img.save(out, "PNG", optimize=True, icc_profile=img.info.get("icc_profile"))
+            if out.tell() < len(data):
+                data = out.getvalue()
+                files[source] = data
+        width, height = img.size
+        has_alpha = (img.mode in ("RGBA", "LA")
+                     or (img.mode == "P" and "transparency" in img.info))
+        base = img.convert("RGBA" if has_alpha else "RGB")
+
+    for name, max_width in IMAGE_VARIANTS.items():
+        size = variant_size(width, height, max_width)
+        resized = base.resize(size, Image.LANCZOS) if size != (width, height) else base
+        for fmt in formats:
+            out = io.BytesIO()
+            resized.save(out, fmt.upper(), quality=quality)
+            files[str(variant_path(path, name, fmt))] = out.getvalue()
+    entry = {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "width": width,
+        "height": height,
+        "bytes": len(data),
+    }
+    return entry, files
+
+
+def load_image_manifest(path: Path = IMAGE_MANIFEST) -> dict:
+    if page_exists(path):
+        try:
+            images = json.loads(read_page(path)).get("images", {})
+        except (OSError, ValueError):
+            return {}
+        for entry in images.values():
+            entry.pop("variants", None)  # listed by older versions
+        return images
+    return {}
+
+
+def save_image_manifest(images: dict, path: Path = IMAGE_MANIFEST) -> bool:
+    """Write the manifest if it changed. Returns True when it was written."""
+    document = {"version": 1, "images": dict(sorted(images.items()))}
+    text = json.dumps(document, indent=2) + "\n"
+    if page_exists(path) and read_page(path) == text:
+        return False
+    write_page(path, text)
+    return True
+
+
+def find_source_images(paths: List[Path]) -> List[Path]:
+    """PNG/JPEG sources under the given files or directories."""
+    found = set()
+    for path in paths:
+        candidates = path.rglob("*") if path.is_dir() else [path]
+        for candidate in candidates:
+            suffix = candidate.suffix.lower()
+            if candidate.is_file() and suffix in IMAGE_SOURCE_SUFFIXES:
+                found.add(candidate)
+    return sorted(found)
+
+
+@timed()
+def optimize_images(paths: Optional[List[Path]] = None, workers: Optional[int] = None,
+                    quality: int = DEFAULT_IMAGE_QUALITY, avif: bool = True,
+                    force: bool = False) -> bool:
+    """Optimize every source image under `paths` (default: public/images).
+
+    Files whose content hash matches the manifest (and whose variants all
+    exist) are skipped; the rest are processed in a process pool. Every
+    output is staged in the active transaction (or one of its own), so a
+    failed run writes nothing.
+    """
+    try:
+        formats = image_formats(avif)
+    except ImportError:
+        print("Error: Pillow is required to optimize images "
+              "(pip install -r requirements.txt)", file=sys.stderr)
+        return False
+
+    full_scan = not paths
+    sources = find_source_images(paths or [IMAGES_ROOT])
+    manifest = load_image_manifest()
+    if full_scan:
+        live = {image_web_path(source) for source in sources}
+        manifest = {key: entry for key, entry in manifest.items() if key in live}
+
+    pending = []
+    for source in sources:
+        entry = manifest.get(image_web_path(source))
+        if (not force and entry
+                and entry["sha256"] == content_hash(source)
+                and all(variant_path(source, name, fmt).exists()
+                        for name in IMAGE_VARIANTS for fmt in formats)):
+            continue
+        pending.append(source)
+
+    original_size = {source: source.stat().st_size for source in pending}
+    failed = 0
+    saved = 0
+
+    def record(source: Path, result: Optional[tuple],
+               error: Optional[BaseException]) -> None:
+        nonlocal failed, saved
+        if error is not None:
+            failed += 1
+            print(f"Error: {source}: {error}", file=sys.stderr)
+            return
+        entry, files = result
+        for file_path, data in files.items():
+            write_page(Path(file_path), data)
+        saved += original_size[source] - entry["bytes"]
+        manifest[image_web_path(source)] = entry
+        _metrics.file_io(source, read=original_size[source])
+        if _build_state is not None and entry["bytes"] != original_size[source]:
+            _build_state.update_output(source, entry["sha256"])
+
+    workers = workers or os.cpu_count() or 1
+    with transaction():
+        if len(pending) <= 1 or workers == 1:
+            for source in pending:
+                try:
+                    record(source, optimize_image(str(source), quality, formats), None)
+                except Exception as e:
+                    record(source, None, e)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(optimize_image, str(source), quality, formats):
+                           source for source in pending}
+                for future in as_completed(futures):
+                    try:
+                        record(futures[future], future.result(), None)
+                    except Exception as e:
+                        record(futures[future], None, e)
+        manifest_written = save_image_manifest(manifest)
+    skipped = len(sources) - len(pending)
+    print(f"✓ Optimized {len(pending) - failed} image(s), {skipped} unchanged"
+          + (f", {failed} failed" if failed else "")
+          + (f", PNG/JPEG bytes saved: {saved // 1024} KB" if saved >= 1024 else "")
+          + (f" ({', '.join(formats)} variants)" if formats else ""))
+    if manifest_written:
+        print(f"✓ Updated {IMAGE_MANIFEST}")
+    return failed == 0
+
+
+# ---- Screenshot ingestion ----
+#
+# `add-images` turns a folder of raw captures into the machine's numbered
+# screenshots. Captures are decoded in a process pool, rotated upright from
+# their EXIF orientation, stripped of every metadata chunk (EXIF, ICC, text)
+# and re-encoded as optimized PNG. A capture is dropped as a duplicate when
+# its decoded pixels match an earlier capture or an image already in the
+# folder (or, with --similar N, when their 64-bit difference hashes are
+# within N bits). The rest are numbered after the highest existing N.png,
+# in natural filename order, and optimize_images() derives their variants.
+
+INGEST_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff")
+_NUMBERED_IMAGE = re.compile(r"^(\d+)\.png$")
+_GENERIC_CAPTURE = re.compile(
+    r"^(screen ?shot|screen|capture|snip|image|img|photo|scr)\b", re.I)
+
+
+def natural_key(name: str) -> list:
+    """Sort key that orders 'shot2' before 'shot10'."""
+    return [int(part) if part.isdigit() else part.lower()
+            for part in re.split(r"(\d+)", name)]
+
+
+def difference_hash(img) -> int:
+    """64-bit dHash: brightness gradients of a 9x8 grayscale thumbnail."""
+    from PIL import Image
+    pixels = img.convert("L").resize((9, 8), Image.LANCZOS).tobytes()
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+
+def ingest_image(source: str, encode: bool = True) -> dict:
+    """Decode one capture; returns its pixel hash and dHash and, if `encode`,
+    the metadata-free PNG. Runs in a worker process."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as opened:
+        img = ImageOps.exif_transpose(opened)
+        img.load()
+    if img.mode not in ("RGB", "RGBA"):
+        has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    if img.mode == "RGBA" and img.getchannel("A").getextrema()[0] == 255:
+        img = img.convert("RGB")
+    img.info.clear()
+    entry = {
+        "pixels": hashlib.sha256(f"{img.mode}{img.size}".encode()
+                                 + img.tobytes()).hexdigest(),
+        "dhash": difference_hash(img),
+        "width": img.width,
+        "height": img.height,
+    }
+    if encode:
+        out = io.BytesIO()
+        img.save(out, "PNG", optimize=True)
+        entry["data"] = out.getvalue()
+    return entry
+
+
+def capture_alt(source: Path, machine: str, number: int) -> str:
+    """Alt text from a descriptive capture filename, else '<Machine> step N'."""
+    words = re.sub(r"[\s_-]+", " ", source.stem).strip()
+    if not re.search(r"[A-Za-z]{3}", words) or _GENERIC_CAPTURE.match(words):
+        return f"{machine.capitalize()} step {number}"
+    return words[:1].upper() + words[1:]
+
+
+@timed()
+def add_images(machine: str, source_dir: Path, workers: Optional[int] = None,
+               similar: int = 0) -> Optional[List[str]]:
+    """Ingest every capture in `source_dir` into public/images/writeups/<machine>/.
+    Returns the markdown lines for the added images, or None if any capture
+    could not be read (the caller aborts the transaction)."""
+    if importlib.util.find_spec("PIL") is None:
+        print("Error: Pillow is required to add images "
+              "(pip install -r requirements.txt)", file=sys.stderr)
+        return None
+    if not source_dir.is_dir():
+        print(f"Error: {source_dir} is not a directory", file=sys.stderr)
+        return None
+
+    machine = machine.lower()
+    image_dir = IMAGES_ROOT / "writeups" / machine
+    sources = sorted((p for p in source_dir.iterdir()
+                      if p.is_file() and p.suffix.lower() in INGEST_SUFFIXES),
+                     key=lambda p: natural_key(p.name))
+    existing = []
+    if image_dir.is_dir():
+        existing = sorted((p for p in image_dir.glob("*.png")
+                           if _NUMBERED_IMAGE.match(p.name)),
+                          key=lambda p: natural_key(p.name))
+    if not sources:
+        print(f"Error: no images ({', '.join(INGEST_SUFFIXES)}) in {source_dir}",
+              file=sys.stderr)
+        return None
+
+    jobs = ([(str(path), False) for path in existing]
+            + [(str(path), True) for path in sources])
+    results: Dict[str, dict] = {}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        for path, encode in jobs:
+            try:
+                results[path] = ingest_image(path, encode)
+            except Exception as e:
+                print(f"Error: {path}: {e}", file=sys.stderr)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(ingest_image, path, encode): path
+                       for path, encode in jobs}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"Error: {futures[future]}: {e}", file=sys.stderr)
+
+    failed = sum(str(source) not in results for source in sources)
+    if failed:
+        print(f"✗ {failed} capture(s) could not be read; nothing was added",
+              file=sys.stderr)
+        return None
+
+    kept: List[Tuple[Path, dict]] = [(path, results[str(path)]) for path in existing
+                                     if str(path) in results]
+    number = max((int(_NUMBERED_IMAGE.match(p.name).group(1)) for p in existing),
+                 default=0)
+    lines, added = [], []
+    duplicates = read_bytes = written_bytes = 0
+    for source in sources:
+        entry = results[str(source)]
+        original = next((path for path, seen in kept
+                         if seen["pixels"] == entry["pixels"]
+                         or (similar and bin(seen["dhash"] ^ entry["dhash"]).count("1")
+                             <= similar)), None)
+        if original is not None:
+            duplicates += 1
+            print(f"  = {source.name} duplicates {original.name}; skipped")
+            continue
+        number += 1
+        target = image_dir / f"{number}.png"
+        write_page(target, entry["data"])
+        kept.append((target, entry))
+        added.append(target)
+        read_bytes += source.stat().st_size
+        written_bytes += len(entry["data"])
+        alt = capture_alt(source, machine, number)
+        lines.append(f"![{alt}]({image_web_path(target)})")
+        print(f"✓ {source.name} -> {target} ({entry['width']}x{entry['height']})")
+
+    if added:
+        # Variants are derived from the committed files, so they are built after commit.
+        after_commit(lambda: optimize_images(added, workers))
+    print(f"✓ Added {len(added)} image(s) to {image_dir}/, "
+          f"{duplicates} duplicate(s) skipped"
+          + (f", {format_bytes(read_bytes)} -> {format_bytes(written_bytes)}"
+             if added else ""))
+    return lines
+
+
+# ---- JS page parsing ----
+#
+# The page files are edited through a small lexer that understands strings,
+# template literals and comments, so a brace or bracket inside a string never
+# confuses it. Each card array / component map is lexed once into spans; edits
+# splice only the affected span and leave the rest of the file byte-identical.
+
+# Whitespace and comments are consumed as a prefix of the next token, so
+# each match is one significant token.
+_JS_TOKEN = re.compile(r"""
+    (?:\s+|//[^\n]*|/\*(?:[^*]|\*(?!/))*\*/)*
+    (?:
+      (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    | (?P<number>-?\d+(?:\.\d+)?)
+    | (?P<name>[A-Za-z_$][\w$]*)
+    | (?P<punct>[{}\[\](),:;])
+    | (?P<end>\Z)
+    )?
+""", re.X | re.S)
+
+_JS_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v",
+               "0": "\0"}
+_JS_ESCAPE = re.compile(
+    r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.S)
+
+
+class JsName(str):
+    """A bare identifier in a JS literal (e.g. a component reference)."""
+
+
+class JsLazyImport(str):
+    """A `lazy(() => import('./path'))` value; the string is the import path."""
+
+
+def iter_js_tokens(text: str, pos: int = 0):
+    """Yield (kind, start, end) for each significant token from pos onwards.
+
+    Whitespace and comments are skipped. Template literals (including nested
+    ${...} expressions) come back as a single "template" token; anything the
+    grammar does not know is a one-character "other" token.
+    """
+    while True:
+        for m in _JS_TOKEN.finditer(text, pos):
+            kind = m.lastgroup
+            if kind is None:
+                break
+            if kind == "end":
+                return
+            yield kind, m.start(kind), m.end()
+        else:
+            return
+        pos = m.end()
+        if text[pos] == "`":
+            end = _scan_template(text, pos)
+            yield "template", pos, end
+        else:
+            end = pos + 1
+            yield "other", pos, end
+        pos = end
+
+
+def _scan_template(text: str, pos: int) -> int:
+    """Return the index just past the template literal starting at pos."""
+    i = pos + 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\":
+            i += 2
+        elif c == "`":
+            return i + 1
+        elif c == "$" and text.startswith("{", i + 1):
+            depth = 1
+            for kind, start, end in iter_js_tokens(text, i + 2):
+                if text[start] == "{" and kind == "punct":
+                    depth += 1
+                elif text[start] == "}" and kind == "punct":
+                    depth -= 1
+                    if depth == 0:
+                        i = end
+                        break
+            else:
+                break
+        else:
+            i += 1
+    raise ValueError(f"unterminated template literal at offset {pos}")
+
+
+def js_string_value(raw: str) -> str:
+    """Decode a quoted JS string token (including its quotes)."""
+    def unescape(m):
+        esc = m.group(1)
+        if esc.startswith("u{"):
+            return chr(int(esc[2:-1], 16))
+        if esc[0] in "ux" and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        if esc == "\n":
+            return ""
+        return _JS_ESCAPES.get(esc, esc)
+    return _JS_ESCAPE.sub(unescape, raw[1:-1])
+
+
+def js_quote(value: str) -> str:
+    """Single-quote a Python string as a JS string literal."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+    return f"'{escaped}'"
+
+
+class _JsLiteralParser:
+    """Recursive-descent parser for JSON-like JS literals over iter_js_tokens."""
+
+    def __init__(self, text: str, pos: int):
+        self.text = text
+        self.tokens = iter_js_tokens(text, pos)
+        self.advance()
+
+    def advance(self):
+        self.tok = next(self.tokens, ("eof", len(self.text), len(self.text)))
+
+    def peek(self) -> str:
+        kind, start, end = self.tok
+        return "" if kind == "eof" else self.text[start:end]
+
+    def expect(self, value: str) -> int:
+        if self.peek() != value:
+            raise ValueError(f"expected {value!r} at offset {self.tok[1]}, "
+                             f"found {self.peek()!r}")
+        end = self.tok[2]
+        self.advance()
+        return end
+
+    def value(self):
+        """Parse one value; returns (value, start, end)."""
+        kind, start, end = self.tok
+        token = self.text[start:end]
+        if token == "{":
+            return self.object()
+        if token == "[":
+            return self.array()
+        self.advance()
+        if kind == "string":
+            return js_string_value(token), start, end
+        if kind == "template":
+            return token[1:-1], start, end
+        if kind == "number":
+            return (float(token) if "." in token else int(token)), start, end
+        if kind == "name":
+            if token == "lazy" and self.peek() == "(":
+                return self.lazy_import(start)
+            if token in ("true", "false", "null"):
+                return {"true": True, "false": False, "null": None}[token], start, end
+            return JsName(token), start, end
+        raise ValueError(f"unexpected {token!r} at offset {start}")
+
+    def lazy_import(self, start: int):
+        """The rest of `lazy(() => import('...'))` after the `lazy` name."""
+        for punct in ("(", "(", ")", "=", ">", "import", "("):
+            self.expect(punct)
+        kind, path_start, path_end = self.tok
+        if kind != "string":
+            raise ValueError(f"expected an import path at offset {path_start}")
+        path = js_string_value(self.text[path_start:path_end])
+        self.advance()
+        self.expect(")")
+        end = self.expect(")")
+        return JsLazyImport(path), start, end
+
+    def array(self):
+        items, start, end = self.array_items()
+        return [item[0] for item in items], start, end
+
+    def array_items(self):
+        """Parse [a, b, ...] keeping each element's (value, start, end) span."""
+        start = self.tok[1]
+        self.expect("[")
+        items = []
+        while self.peek() != "]":
+            items.append(self.value())
+            if self.peek() == ",":
+                self.advance()
+            elif self.peek() != "]":
+                raise ValueError(f"expected ',' or ']' at offset {self.tok[1]}")
+        end = self.expect("]")
+        return items, start, end
+
+    def object(self):
+        entries, start, end = self.object_entries()
+        return {key: value for key, value, _, _ in entries}, start, end
+
+    def object_entries(self):
+        """Parse {k: v, ...} keeping each entry's (key, value, start, end) span."""
+        start = self.tok[1]
+        self.expect("{")
+        entries = []
+        while self.peek() != "}":
+            kind, key_start, key_end = self.tok
+            if kind == "string":
+                key = js_string_value(self.text[key_start:key_end])
+            elif kind in ("name", "number"):
+                key = self.text[key_start:key_end]
+            else:
+                raise ValueError(f"unexpected {self.peek()!r} at offset {key_start}")
+            self.advance()
+            self.expect(":")
+            value, _, value_end = self.value()
+            entries.append((key, value, key_start, value_end))
+            if self.peek() == ",":
+                self.advance()
+            elif self.peek() != "}":
+                raise ValueError(f"expected ',' or '}}' at offset {self.tok[1]}")
+        end = self.expect("}")
+        return entries, start, end
+
+
+def _line_start(text: str, pos: int) -> int:
+    """Move pos back over indentation to the start of its line, if only
+    whitespace precedes it on that line."""
+    i = pos
+    while i > 0 and text[i - 1] in " \t":
+        i -= 1
+    return i if i == 0 or text[i - 1] == "\n" else pos
+
+
+class JsListDoc:
+    """A JS array/object literal inside a page file, lexed once into item spans.
+
+    `items` holds [start, end, value] for each element in source order;
+    `with_body` swaps everything between the brackets for generated text and
+    leaves the rest of the file untouched.
+    """
+
+    def __init__(self, text: str, anchor: str, file_label: str = "page"):
+        match = re.search(anchor, text)
+        if not match:
+            raise ValueError(f"could not find {anchor!r} in {file_label}")
+        self.text = text
+        self.open_pos = match.end() - 1
+        self.items: List[list] = []
+        self.close_pos = 0
+
+    def with_body(self, body: str) -> str:
+        return self.text[:self.open_pos + 1] + body + self.text[self.close_pos:]
+
+
+class CardArray(JsListDoc):
+    """A page's card array (e.g. Home.js `recentPosts`), parsed in one pass."""
+
+    def __init__(self, text: str, anchor: str, file_label: str = "page"):
+        super().__init__(text, anchor, file_label)
+        parser = _JsLiteralParser(text, self.open_pos)
+        items, _, end = parser.array_items()
+        self.close_pos = end - 1
+        self.items = [[start, end, value] for value, start, end in items]
+
+    @property
+    def cards(self) -> List[dict]:
+        return [item[2] for item in self.items]
+
+
+class ComponentMap(JsListDoc):
+    """WriteupDetail.js: the `writeupComponents` route map.
+
+    Generated maps load each walkthrough with `lazy(() => import(...))`; the
+    older form, static imports plus bare component names, is still read so
+    the registry can be imported from it.
+    """
+
+    ANCHOR = r"const writeupComponents = \{"
+    IMPORT = re.compile(r"^import (\w+) from '(\./writeups/[^']+)';[ \t]*\n", re.M)
+
+    def __init__(self, text: str):
+        super().__init__(text, self.ANCHOR, "WriteupDetail.js")
+        parser = _JsLiteralParser(text, self.open_pos)
+        entries, _, end = parser.object_entries()
+        self.close_pos = end - 1
+        self.items = [[start, end, (key, value)] for key, value, start, end in entries]
+
+    @property
+    def routes(self) -> Dict[str, str]:
+        """Route id -> component import path, e.g. './writeups/dc02/DC02Walkthrough'."""
+        import_paths = {m.group(1): m.group(2) for m in self.imports()}
+        routes = {}
+        for _, _, (key, value) in self.items:
+            if isinstance(value, JsLazyImport):
+                path = value
+            else:
+                path = import_paths.get(str(value))
+            if path:
+                routes[key] = str(path)
+        return routes
+
+    def imports(self) -> List[re.Match]:
+        return list(self.IMPORT.finditer(self.text, 0, self.open_pos))
+
+    def render(self, entries: List[str]) -> str:
+        """Replace the map body with `entries` (one per line, without commas)
+        and drop any static walkthrough imports left from the older form."""
+        indent = self.text[_line_start(self.text, self.close_pos):self.close_pos]
+        body = ",\n".join(f"{indent}  {entry}" for entry in entries)
+        text = self.with_body(f"\n{body}\n{indent}")
+        for m in reversed(self.imports()):
+            text = text[:m.start()] + text[m.end():]
+        return text
+
+
+# Card array anchor for each page file.
+PAGE_ARRAYS = {
+    Path("src/pages/Home.js"): r"recentPosts = useMemo\(\(\) => \[",
+    Path("src/pages/Writeups.js"): r"writeups = useMemo\(\(\) => \[",
+    Path("src/pages/Tags.js"): r"const allPosts = \[",
+}
+WRITEUP_DETAIL = Path("src/pages/WriteupDetail.js")
+
+
+def load_cards(file_path: Path) -> CardArray:
+    return CardArray(read_page(file_path), PAGE_ARRAYS[file_path], file_path.name)
+
+
+def format_js_list(values: list) -> str:
+    return "[" + ", ".join(js_quote(str(v)) for v in values) + "]"
+
+
+def format_tags_for_home(tags: list) -> list:
+    return [tag.lower() for tag in tags]
+
+
+def format_tags_for_writeups(tags: list) -> list:
+    return [tag.capitalize() for tag in tags]
+
+
+def format_tags_for_tags_page(tags: list) -> list:
+    return [tag.lower() for tag in tags]
+
+
+# ---- Writeup templates ----
+#
+# A new writeup's component, CSS and markdown are rendered from the files in
+# templates/writeup/, which mark every substitution with an explicit
+# placeholder: {{name}} inserts a value as is, {{name|js}} as a JS literal
+# (quoted string, or array for lists) and {{name|attr}} HTML-escaped. Nothing
+# else in a template is touched, so machine names that occur in the text
+# cannot corrupt it. A template is parsed once into literal and placeholder
+# parts and cached by file size and mtime; its version (content hash) goes
+# into the component's build-state inputs. Variants pick the component and
+# markdown skeleton: a Linux box, a Windows Active Directory box, or a
+# Sherlock/Challenge, which has no OS or IP.
+
+TEMPLATE_DIR = Path("templates/writeup")
+COMPONENT_CSS_TEMPLATE = "writeup.css.tmpl"
+TEMPLATE_VARIANTS = {
+    "linux": {"component": "machine.js.tmpl", "markdown": "linux.md.tmpl"},
+    "windows-ad": {"component": "machine.js.tmpl", "markdown": "windows-ad.md.tmpl"},
+    "sherlock": {"component": "challenge.js.tmpl", "markdown": "challenge.md.tmpl",
+                 "kind": "Sherlock"},
+    "challenge": {"component": "challenge.js.tmpl", "markdown": "challenge.md.tmpl",
+                  "kind": "Challenge"},
+}
+_PLACEHOLDER = re.compile(r"\{\{(\w+)(?:\|(\w+))?\}\}")
+
+
+class TemplateError(ValueError):
+    """A template is missing, malformed, or was rendered without a value it uses."""
+
+
+def _js_literal(value) -> str:
+    return format_js_list(value) if isinstance(value, list) else js_quote(str(value))
+
+
+TEMPLATE_FILTERS = {"text": str, "js": _js_literal,
+                    "attr": lambda value: html.escape(str(value))}
+
+
+class Template:
+    """A template parsed into literal text and (name, filter) placeholders."""
+
+    def __init__(self, text: str, name: str):
+        self.name = name
+        self.version = hash_text(text)
+        self.parts: list = []
+        pos = 0
+        for match in _PLACEHOLDER.finditer(text):
+            flt = match.group(2) or "text"
+            if flt not in TEMPLATE_FILTERS:
+                raise TemplateError(f"{name}: unknown filter in {match.group(0)}")
+            self.parts += [text[pos:match.start()],
+                           (match.group(1), TEMPLATE_FILTERS[flt])]
+            pos = match.end()
+        self.parts.append(text[pos:])
+        self.names = {part[0] for part in self.parts if isinstance(part, tuple)}
+
+    def render(self, context: dict) -> str:
+        missing = self.names - context.keys()
+        if missing:
+            raise TemplateError(
+                f"{self.name}: no value for {', '.join(sorted(missing))}")
+        return "".join(part if isinstance(part, str) else part[1](context[part[0]])
+                       for part in self.parts)
+
+
+_templates: Dict[Path, Tuple[Tuple[int, int], Template]] = {}
+
+
+def load_template(name: str) -> Template:
+    """The parsed template TEMPLATE_DIR/name, re-parsed only when the file changed."""
+    path = TEMPLATE_DIR / name
+    try:
+        st = path.stat()
+    except OSError as e:
+        raise TemplateError(f"template {path} not found") from e
+    stamp = (st.st_size, st.st_mtime_ns)
+    cached = _templates.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _templates[path] = (stamp, Template(path.read_text(), path.as_posix()))
+    return cached[1]
+
+
+def choose_variant(fields: dict) -> str:
+    """fields["template"] if given; else sherlock/challenge when tagged so,
+    else windows-ad or linux by OS."""
+    if fields.get("template"):
+        return fields["template"]
+    tags = {str(tag).lower() for tag in fields.get("tags") or []}
+    for variant, spec in TEMPLATE_VARIANTS.items():
+        if "kind" in spec and variant in tags:
+            return variant
+    return "windows-ad" if fields.get("os") == "Windows" else "linux"
+
+
+def is_machine_variant(variant: str) -> bool:
+    """True for HTB machines (OS, IP and an avatar); False for Sherlocks/Challenges."""
+    return "kind" not in TEMPLATE_VARIANTS[variant]
+
+
+def render_writeup(variant: str, context: dict) -> Dict[str, str]:
+    """Render a writeup's component, CSS and markdown ("js", "css", "md")."""
+    spec = TEMPLATE_VARIANTS[variant]
+    context = {**context, "kind": spec.get("kind", "")}
+    return {"js": load_template(spec["component"]).render(context),
+            "css": load_template(COMPONENT_CSS_TEMPLATE).render(context),
+            "md": load_template(spec["markdown"]).render(context)}
+
+
+def template_versions(variant: str) -> List[str]:
+    spec = TEMPLATE_VARIANTS[variant]
+    names = (spec["component"], COMPONENT_CSS_TEMPLATE, spec["markdown"])
+    return [load_template(name).version for name in names]
+
+
+@timed()
+def create_writeup_component(machine_name: str, title: str, excerpt: str, tags: list,
+                             difficulty: str, os: str, ip: str, date: str,
+                             image_path: str, variant: str = "linux") -> bool:
+    """Render a writeup's component, CSS and markdown from the `variant` templates."""
+    try:
+        machine_name_lower = machine_name.lower()
+        component_name = f"{machine_name.capitalize()}Walkthrough"
+        component_dir = Path(f"src/pages/writeups/{machine_name_lower}")
+        component_file = component_dir / f"{component_name}.js"
+        css_file = component_dir / f"{component_name}.css"
+        markdown_file = component_dir / f"{component_name}.md"
+
+        inputs = ""
+        if _build_state is not None:
+            inputs = hash_inputs(
+                stage_version("component"), variant, template_versions(variant),
+                machine_name, title, excerpt, tags, difficulty, os, ip, date,
+                image_path,
+            )
+            if (_build_state.fresh("component", machine_name_lower, inputs)
+                    and page_exists(markdown_file)):
+                print(f"✓ Writeup component unchanged: {component_file}")
+                return True
+
+        rendered = render_writeup(variant, {
+            "component": component_name,
+            "machine": title.replace(" Walkthrough", ""),
+            "slug": machine_name_lower,
+            "id": f"{machine_name_lower}-walkthrough",
+            "title": title,
+            "excerpt": excerpt,
+            "date": date,
+            "tags": format_tags_for_writeups(tags),
+            "difficulty": difficulty,
+            "os": os or "",
+            "ip": ip or "",
+            "image": image_path,
+        })
+
+        write_page(component_file, rendered["js"])
+        print(f"✓ Created writeup component: {component_file} ({variant})")
+        write_page(css_file, rendered["css"])
+        print(f"✓ Created CSS: {css_file}")
+        written = {component_file: hash_text(rendered["js"]),
+                   css_file: hash_text(rendered["css"])}
+
+        # Never clobber a writeup that is already being written
+        if not page_exists(markdown_file):
+            write_page(markdown_file, rendered["md"])
+            print(f"✓ Created markdown: {markdown_file}")
+
+        if _build_state is not None:
+            _build_state.record("component", machine_name_lower, inputs, written)
+        return True
+    except TemplateError as e:
+        print(f"Error creating writeup component: {e}", file=sys.stderr)
+        return False
+    except Exception as e:
+        print(f"Error creating writeup component: {e}", file=sys.stderr)
+        traceback.print_exc()
+        return False
+
+
+# ---- Writeup registry ----
+#
+# writeups.json is the single source of truth for every post. The card arrays
+# in Home/Writeups/Tags and the WriteupDetail route map (one React.lazy chunk
+# per walkthrough) are regenerated from it by build_site(), so the pages
+# cannot drift apart.
+
+REGISTRY_PATH = Path("writeups.json")
+REGISTRY_VERSION = 1
+
+
+class Registry:
+    """The list of posts (writeups and projects) in display order, newest first."""
+
+    def __init__(self, posts: List[dict], path: Path = REGISTRY_PATH):
+        self.path = path
+        self.posts = posts
+        self._by_slug = {post["slug"]: post for post in posts if post.get("slug")}
+
+    @classmethod
+    @timed("Registry.load")
+    def load(cls, path: Path = REGISTRY_PATH) -> "Registry":
+        """Load the registry, importing it from the page files on first use."""
+        if not path.exists():
+            print(f"{path} not found; importing posts from the page files.")
+            return cls(import_posts_from_pages(), path)
+        data = json.loads(read_page(path))
+        return cls(data.get("posts", []), path)
+
+    def to_json(self) -> str:
+        """One field per line, lists kept inline, so registry diffs stay small."""
+        posts = []
+        for post in self.posts:
+            fields = ",\n".join(
+                f"      {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}"
+                for key, value in post.items())
+            posts.append(f"    {{\n{fields}\n    }}")
+        body = ",\n".join(posts)
+        return f'{{\n  "version": {REGISTRY_VERSION},\n  "posts": [\n{body}\n  ]\n}}\n'
+
+    @timed("Registry.save")
+    def save(self) -> bool:
+        """Write the registry if it changed. Returns True when written."""
+        text = self.to_json()
+        if page_exists(self.path) and read_page(self.path) == text:
+            return False
+        write_page(self.path, text)
+        return True
+
+    @property
+    def writeups(self) -> List[dict]:
+        return [post for post in self.posts if post.get("category") == "writeup"]
+
+    def get(self, slug: str) -> Optional[dict]:
+        return self._by_slug.get(slug.lower())
+
+    def next_id(self) -> int:
+        return max((post.get("id", 0) for post in self.posts), default=0) + 1
+
+    def add(self, entry: dict) -> None:
+        """Insert a post at the top, or replace the existing post with the same slug."""
+        existing = self._by_slug.get(entry["slug"])
+        if existing is not None:
+            self.posts[self.posts.index(existing)] = entry
+        else:
+            self.posts.insert(0, entry)
+        self._by_slug[entry["slug"]] = entry
+
+    def remove(self, slug: str) -> Optional[dict]:
+        entry = self._by_slug.pop(slug.lower(), None)
+        if entry is not None:
+            self.posts.remove(entry)
+        return entry
+
+    def snapshot(self) -> List[dict]:
+        """The current posts, for restore(). add() and remove() replace post
+        dicts rather than editing them, so a shallow copy is enough."""
+        return list(self.posts)
+
+    def restore(self, snapshot: List[dict]) -> None:
+        self.posts = list(snapshot)
+        self._by_slug = {post["slug"]: post for post in self.posts if post.get("slug")}
+
+
+def writeup_route(post: dict) -> str:
+    """Route id of a writeup, e.g. 'dc02-walkthrough'."""
+    return post["link"].rstrip("/").rsplit("/", 1)[-1]
+
+
+# Hand-set fields that survive re-creating a writeup.
+PRESERVED_FIELDS = ("previewDescription", "keywords")
+
+
+@timed()
+def make_writeup_entry(registry: Registry, machine_name: str, title: str, excerpt: str,
+                       tags: list, difficulty: str, os: str, ip: str, date: str,
+                       image_path: str) -> dict:
+    slug = machine_name.lower()
+    component_name = f"{machine_name.capitalize()}Walkthrough"
+    existing = registry.get(slug)
+    return {
+        "id": existing["id"] if existing else registry.next_id(),
+        "slug": slug,
+        "category": "writeup",
+        "title": title,
+        "excerpt": excerpt,
+        "date": date,
+        "tags": format_tags_for_home(tags),
+        **{key: value for key, value in
+           (("difficulty", difficulty), ("os", os), ("ip", ip)) if value},
+        "image": image_path,
+        "link": f"/writeups/{slug}-walkthrough",
+        "component": component_name,
+        "componentPath": f"./writeups/{slug}/{component_name}",
+        **{key: existing[key] for key in PRESERVED_FIELDS
+           if existing and key in existing},
+    }
+
+
+def read_component_metadata(component_path: str) -> dict:
+    """Parse the `const writeup = {...}` object out of a walkthrough component."""
+    file_path = Path("src/pages") / f"{component_path[2:]}.js"
+    try:
+        text = read_page(file_path)
+        match = re.search(r"const writeup = \{", text)
+        if not match:
+            return {}
+        return _JsLiteralParser(text, match.end() - 1).object()[0]
+    except (OSError, ValueError):
+        return {}
+
+
+@timed()
+def import_posts_from_pages() -> List[dict]:
+    """Build registry entries from the hand-maintained page arrays.
+
+    Home.js is the primary source (it lists every post, in display order);
+    Writeups.js adds difficulty and its tag casing, WriteupDetail.js the
+    component, and each component its IP.
+    """
+    home, writeups, tags_page = (load_cards(path).cards for path in PAGE_ARRAYS)
+    routes = ComponentMap(read_page(WRITEUP_DETAIL)).routes
+    writeup_cards = {card["link"]: card for card in writeups if card.get("link")}
+
+    cards_by_key: Dict[str, dict] = {}
+    for card in home + writeups + tags_page:
+        key = card.get("link") or card.get("title", "").lower()
+        if card.get("link") is None and any(c.get("title", "").lower() == key
+                                            for c in cards_by_key.values()):
+            continue
+        cards_by_key.setdefault(key, card)
+
+    posts, seen_ids = [], set()
+    for card in cards_by_key.values():
+        category = card.get("category", "writeup")
+        entry = {"id": card.get("id")}
+        if category == "writeup" and card.get("link"):
+            entry["slug"] = writeup_route(card).removesuffix("-walkthrough")
+        entry["category"] = category
+        for key in ("title", "excerpt", "date"):
+            if card.get(key) is not None:
+                entry[key] = card[key]
+        entry["tags"] = [str(tag).lower() for tag in card.get("tags", [])]
+        if category == "writeup":
+            writeup_card = writeup_cards.get(card.get("link"), {})
+            display_tags = writeup_card.get("tags")
+            if display_tags and display_tags != format_tags_for_writeups(entry["tags"]):
+                entry["displayTags"] = display_tags
+            component_path = (routes.get(writeup_route(card)) if card.get("link")
+                              else None)
+            metadata = read_component_metadata(component_path) if component_path else {}
+            for key in ("difficulty", "os", "ip"):
+                value = writeup_card.get(key) or card.get(key) or metadata.get(key)
+                if value:
+                    entry[key] = value
+        for key in ("image", "link", "github"):
+            if card.get(key):
+                entry[key] = card[key]
+        if category == "writeup" and card.get("link"):
+            component_path = routes.get(writeup_route(card))
+            if component_path:
+                entry["component"] = component_path.rsplit("/", 1)[-1]
+                entry["componentPath"] = component_path
+        posts.append(entry)
+
+    next_id = max((p["id"] for p in posts if isinstance(p["id"], int)), default=0) + 1
+    for post in posts:
+        if not isinstance(post["id"], int) or post["id"] in seen_ids:
+            post["id"] = next_id
+            next_id += 1
+        seen_ids.add(post["id"])
+    return posts
+
+
+# ---- Page generation ----
+
+def _js_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return format_js_list(value)
+    return js_quote(str(value))
+
+
+def render_card(fields: List[Tuple[str, object]], indent: str = "    ") -> str:
+    lines = ",\n".join(f"{indent}  {key}: {_js_value(value)}"
+                       for key, value in fields if value is not None)
+    return f"{indent}{{\n{lines}\n{indent}}}"
+
+
+def home_card(post: dict) -> List[Tuple[str, object]]:
+    fields = [("id", post["id"]), ("title", post["title"]),
+              ("excerpt", post.get("excerpt", "")), ("date", post.get("date", "")),
+              ("category", post["category"]),
+              ("tags", format_tags_for_home(post["tags"])),
+              ("image", post.get("image")), ("link", post.get("link"))]
+    if post["category"] == "writeup":
+        return fields + [("os", post.get("os"))]
+    return fields + [("github", post.get("github"))]
+
+
+def writeups_card(post: dict) -> List[Tuple[str, object]]:
+    return [("id", post["id"]), ("title", post["title"]),
+            ("excerpt", post.get("excerpt", "")),
+            ("date", post.get("date", "")),
+            ("tags", post.get("displayTags") or format_tags_for_writeups(post["tags"])),
+            ("image", post.get("image")), ("link", post.get("link")),
+            ("difficulty", post.get("difficulty")), ("category", post["category"]),
+            ("os", post.get("os"))]
+
+
+def tags_card(post: dict) -> List[Tuple[str, object]]:
+    return [("id", post["id"]), ("title", post["title"]),
+            ("category", post["category"]),
+            ("tags", format_tags_for_tags_page(post["tags"]))]
+
+
+def tag_detail_card(post: dict) -> List[Tuple[str, object]]:
+    fields = [("id", post["id"]), ("title", post["title"]),
+              ("excerpt", post.get("excerpt", "")), ("date", post.get("date", "")),
+              ("tags", format_tags_for_tags_page(post["tags"])),
+              ("image", post.get("image")), ("link", post.get("link")),
+              ("category", post["category"])]
+    if post["category"] == "writeup":
+        return fields + [("os", post.get("os"))]
+    return fields + [("github", post.get("github"))]
+
+
+# Page -> (card renderer, writeups only?)
+PAGE_CARDS = {
+    Path("src/pages/Home.js"): (home_card, False),
+    Path("src/pages/Writeups.js"): (writeups_card, True),
+    Path("src/pages/Tags.js"): (tags_card, False),
+}
+
+
+@timed()
+def render_pages(registry: Registry) -> Dict[Path, str]:
+    """Render every generated page from the registry (nothing is written)."""
+    rendered = {}
+    for file_path, (card_renderer, writeups_only) in PAGE_CARDS.items():
+        posts = registry.writeups if writeups_only else registry.posts
+        cards = ",\n".join(render_card(card_renderer(post)) for post in posts)
+        rendered[file_path] = load_cards(file_path).with_body(f"\n{cards}\n  ")
+
+    routed = [post for post in registry.writeups if post.get("componentPath")]
+    entries = [f"'{writeup_route(post)}': lazy(() => import('{post['componentPath']}'))"
+               for post in routed]
+    rendered[WRITEUP_DETAIL] = ComponentMap(read_page(WRITEUP_DETAIL)).render(entries)
+    return rendered
+
+
+def pages_inputs(registry: Registry) -> str:
+    return hash_inputs(stage_version("pages"), registry.to_json())
+
+
+def pages_fresh(registry: Registry) -> bool:
+    """True if every generated page is exactly what build_site() last wrote
+    for this registry (so its cards and routes match it by construction)."""
+    return (_build_state is not None
+            and _build_state.fresh("pages", "site", pages_inputs(registry)))
+
+
+@timed()
+def build_site(registry: Registry) -> List[Path]:
+    """Regenerate the page files from the registry, writing only those that changed.
+
+    Skipped entirely when the registry and generator are unchanged since the
+    last build and every page is still as it was written.
+    """
+    inputs = pages_inputs(registry)
+    if _build_state is not None and _build_state.fresh("pages", "site", inputs):
+        return []
+    changed = []
+    rendered = render_pages(registry)
+    for file_path, text in rendered.items():
+        if read_page(file_path) != text:
+            write_page(file_path, text)
+            changed.append(file_path)
+    if _build_state is not None:
+        _build_state.record("pages", "site", inputs,
+                            {path: hash_text(text) for path, text in rendered.items()})
+    return changed
+
+
+@timed()
+def publish(registry: Registry) -> bool:
+    """Save the registry and regenerate the pages, link previews, writeup
+    content, search index, sitemap, feed and tag shards from it."""
+    try:
+        if registry.save():
+            print(f"✓ Updated {registry.path}")
+        for file_path in build_site(registry):
+            print(f"✓ Regenerated {file_path}")
+        for file_path in write_previews(registry):
+            print(f"✓ Regenerated {file_path}")
+        for file_path in write_content(registry):
+            print(f"✓ Regenerated {file_path}")
+        if write_search_index(registry):
+            print(f"✓ Regenerated {SEARCH_INDEX}")
+        for file_path in write_feeds(registry):
+            print(f"✓ Regenerated {file_path}")
+        return True
+    except Exception as e:
+        print(f"Error regenerating pages: {e}", file=sys.stderr)
+        return False
+
+
+def publish_transaction(registry: Registry) -> bool:
+    """publish() with every file written atomically together, or none at all."""
+    try:
+        with transaction() as txn:
+            if not publish(registry):
+                txn.abort()
+                return False
+    except OSError as e:
+        print(f"Error: writing files failed; all changes were rolled back: {e}",
+              file=sys.stderr)
+        return False
+    return True
+
+
+# ---- Link previews ----
+#
+# public/<slug>-walkthrough.html is a static page carrying the OG/Twitter tags
+# for link-preview bots; _headers marks it noindex/no-cache and _redirects
+# sends regular visitors on to the React route. All three are rendered from
+# the registry. A post's optional "previewDescription" and "keywords" fields
+# override the excerpt and the default keywords (OS + tags).
+
+SITE_URL = "https://endlssightmare.com"
+SITE_NAME = "V01 Notes"
+TWITTER_HANDLE = "@v01_cyber"
+HEADERS_FILE = PUBLIC_DIR / "_headers"
+REDIRECTS_FILE = PUBLIC_DIR / "_redirects"
+PREVIEW_FILE = re.compile(r"^[\w.-]+-walkthrough\.html$")
+HEADERS_ENTRY = re.compile(r"^/[\w.-]+-walkthrough\.html\s*$")
+ASSET_HEADERS_ENTRY = re.compile(r"^/images/h/\*\s*$")
+REDIRECTS_ENTRY = re.compile(r"^/[\w.-]+-walkthrough\.html\s")
+
+PREVIEW_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+
+    <!-- Basic Meta Tags -->
+    <title>{title} | {site_name}</title>
+    <meta name="description" content="{description}" />
+    <meta name="keywords" content="{keywords}" />
+
+    <!-- Open Graph Meta Tags for Discord/Facebook -->
+    <meta property="og:title" content="{title} | {site_name}" />
+    <meta property="og:description" content="{description}" />
+    <meta property="og:image" content="{image}" />
+    <meta property="og:url" content="{url}" />
+    <meta property="og:type" content="article" />
+    <meta property="og:site_name" content="{site_name}" />
+    <meta property="og:image:width" content="600" />
+    <meta property="og:image:height" content="600" />
+
+    <!-- Twitter Card Meta Tags -->
+    <meta name="twitter:card" content="summary_large_image" />
+    <meta name="twitter:title" content="{title} | {site_name}" />
+    <meta name="twitter:description" content="{description}" />
+    <meta name="twitter:image" content="{image}" />
+    <meta name="twitter:url" content="{url}" />
+    <meta name="twitter:creator" content="{twitter}" />
+
+    <!-- Cache busting for link previews -->
+    <meta property="og:image:secure_url" content="{image}" />
+    <meta name="twitter:image:alt" content="{title}" />
+
+    <!-- No redirect - let React Router handle navigation -->
+</head>
+<body style="font-family: Arial, sans-serif; max-width: 800px; margin: 50px auto; padding: 20px; background-color: #0a0a0a; color: #e0e0e0; text-align: center;">
+    <h1 style="color: #ff6b6b;">{title}</h1>
+    <p style="font-size: 16px; line-height: 1.6;">{description}</p>
+    <p style="color: #666; font-size: 14px; margin-top: 20px;">Loading the full writeup...</p>
+    <p><a href="{link}" style="color: #ff6b6b; text-decoration: none; font-weight: bold;">← View Full Writeup</a></p>
+</body>
+</html>"""  # noqa: E501
+
+
+def preview_path(post: dict) -> Path:
+    return PUBLIC_DIR / f"{writeup_route(post)}.html"
+
+
+def preview_keywords(post: dict) -> List[str]:
+    if post.get("keywords"):
+        return post["keywords"]
+    keywords = [post["os"]] if post.get("os") else []
+    for tag in post.get("displayTags") or format_tags_for_writeups(post["tags"]):
+        if tag.lower() not in (k.lower() for k in keywords):
+            keywords.append(tag)
+    return keywords
+
+
+def render_preview(post: dict) -> str:
+    """The static link-preview page for one writeup."""
+    def esc(value) -> str:
+        return html.escape(str(value), quote=True)
+
+    return PREVIEW_TEMPLATE.format(
+        title=esc(post["title"]),
+        description=esc(post.get("previewDescription") or post.get("excerpt", "")),
+        keywords=esc(", ".join(preview_keywords(post))),
+        image=esc(SITE_URL + post["image"]),
+        url=esc(SITE_URL + post["link"]),
+        link=esc(post["link"]),
+        site_name=esc(SITE_NAME),
+        twitter=esc(TWITTER_HANDLE),
+    )
+
+
+def splice_entries(text: str, is_entry, entries: List[str], blank_between: bool) -> str:
+    """Replace the generated entries in a hand-edited config file.
+
+    An entry is a line matching `is_entry` plus the indented lines under it.
+    Everything else (comments, other rules) is kept; the new entries go where
+    the first old one was, or at the end.
+    """
+    lines = text.split("\n")
+    kept: List[str] = []
+    insert_at = None
+    i = 0
+    while i < len(lines):
+        if not is_entry(lines[i]):
+            kept.append(lines[i])
+            i += 1
+            continue
+        if insert_at is None:
+            insert_at = len(kept)
+        i += 1
+        while i < len(lines) and lines[i][:1] in (" ", "\t") and lines[i].strip():
+            i += 1
+        if blank_between and i < len(lines) - 1 and not lines[i].strip():
+            i += 1
+    if insert_at is None:
+        insert_at = len(kept) - 1 if kept and not kept[-1] else len(kept)
+        if blank_between and insert_at and kept[insert_at - 1].strip():
+            kept.insert(insert_at, "")
+            insert_at += 1
+    separator = "\n\n" if blank_between else "\n"
+    block = separator.join(entries).split("\n") if entries else []
+    rest = kept[insert_at:]
+    if blank_between and block and rest and rest[0].strip():
+        block.append("")
+    return "\n".join(kept[:insert_at] + block + rest)
+
+
+def render_headers(posts: List[dict], text: str) -> str:
+    entries = [f"/{preview_path(post).name}\n  X-Robots-Tag: noindex\n"
+               f"  Cache-Control: no-cache"
+               for post in posts]
+    text = splice_entries(text, HEADERS_ENTRY.match, entries, blank_between=True)
+    asset_rule = (f"{build_web_path(ASSET_DIR)}/*\n"
+                  f"  Cache-Control: public, max-age={ASSET_MAX_AGE}, immutable")
+    return splice_entries(text, ASSET_HEADERS_ENTRY.match, [asset_rule],
+                          blank_between=True)
+
+
+def render_redirects(posts: List[dict], text: str) -> str:
+    entries = [f"/{preview_path(post).name} {post['link']} 302" for post in posts]
+    return splice_entries(text, REDIRECTS_ENTRY.match, entries, blank_between=False)
+
+
+def _write_preview(post: dict) -> Optional[Path]:
+    """Render one preview page; returns its path if it was (re)written."""
+    file_path = preview_path(post)
+    inputs = hash_inputs(stage_version("preview"), post)
+    if _build_state is not None and _build_state.fresh("preview", post["slug"], inputs):
+        return None
+    text = render_preview(post)
+    changed = not (page_exists(file_path) and read_page(file_path) == text)
+    if changed:
+        write_page(file_path, text)
+    if _build_state is not None:
+        _build_state.record("preview", post["slug"], inputs,
+                            {file_path: hash_text(text)})
+    return file_path if changed else None
+
+
+@timed()
+def write_previews(registry: Registry, workers: int = DEFAULT_WORKERS) -> List[Path]:
+    """Render every writeup's preview page, _headers and _redirects concurrently,
+    writing only the files that changed and deleting previews of removed posts."""
+    posts = [post for post in registry.writeups
+             if post.get("link") and post.get("image")]
+    changed: List[Path] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for file_path in pool.map(_write_preview, posts):
+            if file_path is not None:
+                changed.append(file_path)
+
+    for file_path, render in ((HEADERS_FILE, render_headers),
+                              (REDIRECTS_FILE, render_redirects)):
+        current = read_page(file_path) if page_exists(file_path) else ""
+        text = render(posts, current)
+        if text != current:
+            write_page(file_path, text)
+            changed.append(file_path)
+
+    live = {preview_path(post).name for post in posts}
+    for file_path in sorted(PUBLIC_DIR.glob("*-walkthrough.html")):
+        if PREVIEW_FILE.match(file_path.name) and file_path.name not in live:
+            delete_path(file_path)
+            print(f"✓ Removed stale preview {file_path}")
+    return changed
+
+
+# ---- Writeup content ----
+#
+# Each writeup's markdown lives next to its component as <Component>.md and
+# is parsed once here into public/content/<slug>.json, which the component
+# fetches (see src/utils/writeupContent.js) and only maps to elements. The
+# file is {"version", "toc", "blocks"}; a block is a compact array:
+#
+#   ["h", level, anchor, inline]   ["p", inline]   ["br"]
+#   ["code", language, text]       ["info", title, message]
+#   ["img", alt, src, width, height, [[mime type, srcset], ...]]
+#
+# and `inline` is a plain string, or a list of strings and ["b", text],
+# ["i", text], ["c", text] (inline code) and ["a", text, href] spans. The
+# grammar is the one the components used to parse at render time: one block
+# per line, headings down to ###, ``` fences, and <InfoStatus> tags.
+#
+# Image blocks carry the intrinsic size from public/images/manifest.json and,
+# in deploy builds (`build --variants`), the WebP/AVIF variants that exist,
+# so the renderer can reserve their space and emit srcset and lazy loading.
+# Every local image a writeup references gets a manifest entry; one that
+# optimize-images has not processed yet is entered with the size read from
+# its header (and is picked up by the next optimize-images run).
+
+CONTENT_DIR = PUBLIC_DIR / "content"
+CONTENT_VERSION = 2
+_MD_INLINE = re.compile(r"(\[.*?\]\(.*?\)|\*\*.*?\*\*|\*.*?\*|`.*?`)")
+_MD_LINK = re.compile(r"\[(.*?)\]\((.*?)\)")
+_MD_IMAGE = re.compile(r"!\[(.*?)\]\((.*?)\)")
+_MD_ATTR = re.compile(r'(\w+)="([^"]*)"')
+_ANCHOR_STRIP = re.compile(r"[^a-z0-9]+")
+
+
+def markdown_path(post: dict) -> Path:
+    """The writeup's markdown file, next to its component."""
+    return Path("src/pages") / f"{post['componentPath'][2:]}.md"
+
+
+def content_path(post: dict) -> Path:
+    return CONTENT_DIR / f"{post['slug']}.json"
+
+
+def parse_inline(text: str):
+    """Bold, italic, inline code and links; plain text stays a plain string."""
+    parts: list = []
+    last = 0
+    for match in _MD_INLINE.finditer(text):
+        if match.start() > last:
+            parts.append(text[last:match.start()])
+        token = match.group(0)
+        link = _MD_LINK.match(token) if token.startswith("[") else None
+        if link:
+            parts.append(["a", link.group(1), link.group(2)])
+        elif token.startswith("**") and token.endswith("**") and len(token) >= 4:
+            parts.append(["b", token[2:-2]])
+        elif token.startswith("*") and token.endswith("*") and len(token) >= 2:
+            parts.append(["i", token[1:-1]])
+        elif token.startswith("`"):
+            parts.append(["c", token[1:-1]])
+        else:
+            parts.append(token)
+        last = match.end()
+    if last < len(text):
+        parts.append(text[last:])
+    if all(isinstance(part, str) for part in parts):
+        return "".join(parts)
+    return parts
+
+
+def inline_text(inline) -> str:
+    if isinstance(inline, str):
+        return inline
+    return "".join(part if isinstance(part, str) else part[1] for part in inline)
+
+
+def heading_anchor(text: str, seen: Dict[str, int]) -> str:
+    """GitHub-style anchor, made unique within the document."""
+    base = _ANCHOR_STRIP.sub("-", text.lower()).strip("-") or "section"
+    count = seen.get(base, 0)
+    seen[base] = count + 1
+    return base if count == 0 else f"{base}-{count + 1}"
+
+
+def parse_markdown(content: str) -> dict:
+    """Parse a writeup's markdown into its block tree and table of contents."""
+    blocks: list = []
+    toc: List[dict] = []
+    anchors: Dict[str, int] = {}
+    lines = content.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        level = next((n for n in (1, 2, 3) if line.startswith("#" * n + " ")), 0)
+        if level:
+            text = line[level + 1:]
+            inline = parse_inline(text)
+            anchor = heading_anchor(inline_text(inline), anchors)
+            blocks.append(["h", level, anchor, inline])
+            toc.append({"id": anchor, "text": text, "level": level})
+        elif line.startswith("```"):
+            language = line[3:].strip()
+            code = []
+            i += 1
+            while i < len(lines) and not lines[i].startswith("```"):
+                code.append(lines[i])
+                i += 1
+            blocks.append(["code", language, "\n".join(code)])
+        elif line.startswith("!["):
+            match = _MD_IMAGE.search(line)
+            if match:
+                blocks.append(["img", match.group(1), match.group(2)])
+        elif line.startswith("<InfoStatus"):
+            attrs = dict(_MD_ATTR.findall(line))
+            if "title" in attrs and "message" in attrs:
+                blocks.append(["info", attrs["title"], attrs["message"]])
+        elif line.strip():
+            blocks.append(["p", parse_inline(line)])
+        else:
+            blocks.append(["br"])
+        i += 1
+    return {"version": CONTENT_VERSION, "toc": toc, "blocks": blocks}
+
+
+def read_writeup_markdown(post: dict) -> str:
+    """The writeup's markdown, or "" if the post has no markdown file."""
+    if not post.get("componentPath"):
+        return ""
+    file_path = markdown_path(post)
+    return read_page(file_path) if page_exists(file_path) else ""
+
+
+def index_images(srcs: List[str], images: dict) -> bool:
+    """Give every local image in `srcs` a manifest entry with its intrinsic
+    size, replacing entries whose file has changed since. Returns True if
+    `images` changed."""
+    changed = False
+    for src in srcs:
+        path = PUBLIC_DIR / src.lstrip("/")
+        if not src.startswith("/images/") or not path.is_file():
+            continue
+        digest = content_hash(path)
+        entry = images.get(src)
+        if entry and entry["sha256"] == digest:
+            continue
+        try:
+            from PIL import Image
+            with Image.open(path) as img:
+                width, height = img.size
+        except (ImportError, OSError):
+            continue
+        images[src] = {"sha256": digest, "width": width, "height": height,
+                       "bytes": path.stat().st_size}
+        changed = True
+    return changed
+
+
+_srcset_variants = False
+
+
+def configure_image_variants(enabled: bool) -> None:
+    """Whether image blocks list the generated variants (deploy builds only:
+    the variants are not committed, so committed content must not name them)."""
+    global _srcset_variants
+    _srcset_variants = enabled
+
+
+def image_attributes(src: str, entry: Optional[dict]) -> list:
+    """[width, height, [[mime type, srcset], ...]] of an image block, AVIF first."""
+    if not entry:
+        return []
+    widths: Dict[str, Dict[int, str]] = {}
+    variants = image_variants(src, entry) if _srcset_variants else {}
+    for name, variant in sorted(variants.items()):
+        widths.setdefault(name.split(".", 1)[1], {})[variant["width"]] = variant["path"]
+    sources = [[f"image/{fmt}",
+                ", ".join(f"{path} {width}w" for width, path in sorted(paths.items()))]
+               for fmt, paths in sorted(widths.items())]
+    return [entry["width"], entry["height"], sources]
+
+
+def _write_content(post: dict, images: Optional[dict] = None) -> Optional[Path]:
+    """Parse one writeup; returns its content path if it was (re)written.
+    `images` is the loaded image manifest, which is updated in place; without
+    it the manifest is loaded and saved here."""
+    source = markdown_path(post)
+    if not page_exists(source):
+        return None
+    standalone = images is None
+    if standalone:
+        images = load_image_manifest()
+    markdown = read_page(source)
+    srcs = [match.group(2) for match in _MD_IMAGE.finditer(markdown)]
+    if index_images(srcs, images) and standalone:
+        save_image_manifest(images)
+    file_path = content_path(post)
+    attributes = {src: image_attributes(src, images.get(src)) for src in srcs}
+    inputs = hash_inputs(stage_version("content"), content_hash(source), attributes)
+    if _build_state is not None and _build_state.fresh("content", post["slug"], inputs):
+        return None
+    document = parse_markdown(markdown)
+    for block in document["blocks"]:
+        if block[0] == "img":
+            block.extend(attributes[block[2]])
+    text = json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n"
+    changed = not (page_exists(file_path) and read_page(file_path) == text)
+    if changed:
+        write_page(file_path, text)
+    if _build_state is not None:
+        _build_state.record("content", post["slug"], inputs,
+                            {file_path: hash_text(text)})
+    return file_path if changed else None
+
+
+@timed()
+def write_content(registry: Registry) -> List[Path]:
+    """Parse every writeup's markdown into public/content/, writing only the
+    files that changed and deleting the content of removed posts."""
+    posts = [post for post in registry.writeups
+             if post.get("slug") and post.get("componentPath")]
+    images = load_image_manifest()
+    indexed = dict(images)
+    changed = [path for path in (_write_content(post, images) for post in posts)
+               if path is not None]
+    if images != indexed and save_image_manifest(images):
+        changed.append(IMAGE_MANIFEST)
+    live = {content_path(post).name for post in posts}
+    if CONTENT_DIR.is_dir():
+        for file_path in sorted(CONTENT_DIR.glob("*.json")):
+            if file_path.name not in live:
+                delete_path(file_path)
+                print(f"✓ Removed stale content {file_path}")
+    return changed
+
+
+# ---- Search index ----
+#
+# public/search-index.json is fetched lazily by the search boxes (see
+# src/utils/searchIndex.js). "tokens" maps every lowercase word of a post's
+# title, excerpt, tags and section headings to the ids of the posts that
+# contain it, with keys sorted so the client can prefix-match by binary
+# search; "tags" maps each tag to its post ids.
+
+SEARCH_INDEX = PUBLIC_DIR / "search-index.json"
+SEARCH_INDEX_VERSION = 1
+_SEARCH_TOKEN = re.compile(r"[a-z0-9]+")
+_MD_HEADING = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+
+
+def search_tokens(text: str) -> List[str]:
+    return _SEARCH_TOKEN.findall(text.lower())
+
+
+def markdown_headings(content: str) -> List[str]:
+    """Heading texts of a markdown document, ignoring fenced code blocks."""
+    headings = []
+    in_code = False
+    for line in content.split("\n"):
+        if line.startswith("```"):
+            in_code = not in_code
+        elif not in_code:
+            match = _MD_HEADING.match(line)
+            if match:
+                headings.append(match.group(1))
+    return headings
+
+
+def build_search_index(registry: Registry) -> dict:
+    tokens: Dict[str, set] = {}
+    tags: Dict[str, set] = {}
+    for post in registry.posts:
+        post_id = post["id"]
+        words = [post.get("title", ""), post.get("excerpt", "")]
+        for tag in post.get("tags", []):
+            tags.setdefault(tag.lower(), set()).add(post_id)
+            words.append(tag)
+        words.extend(markdown_headings(read_writeup_markdown(post)))
+        for token in search_tokens(" ".join(words)):
+            tokens.setdefault(token, set()).add(post_id)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "tokens": {token: sorted(ids) for token, ids in sorted(tokens.items())},
+        "tags": {tag: sorted(ids) for tag, ids in sorted(tags.items())},
+    }
+
+
+@timed()
+def write_search_index(registry: Registry) -> bool:
+    """Write public/search-index.json if it changed. Returns True when written."""
+    inputs = ""
+    if _build_state is not None:
+        sources = [markdown_path(post) for post in registry.posts
+                   if post.get("componentPath")]
+        hashes = [content_hash(path) if page_exists(path) else None for path in sources]
+        inputs = hash_inputs(stage_version("search"), registry.to_json(), hashes)
+        if _build_state.fresh("search", "site", inputs):
+            return False
+    text = json.dumps(build_search_index(registry), separators=(",", ":")) + "\n"
+    changed = not (page_exists(SEARCH_INDEX) and read_page(SEARCH_INDEX) == text)
+    if changed:
+        write_page(SEARCH_INDEX, text)
+    if _build_state is not None:
+        _build_state.record("search", "site", inputs, {SEARCH_INDEX: hash_text(text)})
+    return changed
+
+
+# ---- Sitemap, feed and tag shards ----
+#
+# public/sitemap.xml lists the static routes, every post and every tag page;
+# public/feed.xml is an Atom feed of the newest posts. public/tag-shards/
+# <tag>.json holds the TagDetail cards of the posts carrying that tag (see
+# src/utils/tagShards.js), so the page fetches one small file instead of
+# bundling every post. Each shard is tracked in the build state on its own:
+# adding or removing a post rewrites only the shards of its tags.
+
+SITEMAP = PUBLIC_DIR / "sitemap.xml"
+FEED = PUBLIC_DIR / "feed.xml"
+FEED_SIZE = 20
+FEED_AUTHOR = "V01"
+TAG_SHARD_DIR = PUBLIC_DIR / "tag-shards"
+TAG_SHARD_VERSION = 1
+TAG_SHARD_SAFE = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+SITE_ROUTES = ("/", "/writeups", "/projects", "/tags")
+
+
+def post_day(post: dict) -> Optional[str]:
+    """The post's date as YYYY-MM-DD, or None if it does not parse."""
+    try:
+        return datetime.strptime(post.get("date", ""), "%b %d, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def tag_shard_name(tag: str) -> str:
+    """File name (without .json) of a tag's shard: the lowercased tag with
+    every character outside [a-z0-9_-] spelled ~<hex code point>~, so it
+    needs no URL escaping and maps back to one tag. tagShardName() in
+    src/utils/tagShards.js must match."""
+    return "".join(c if c in TAG_SHARD_SAFE else f"~{ord(c):x}~" for c in tag.lower())
+
+
+def tag_shard_path(tag: str) -> Path:
+    return TAG_SHARD_DIR / f"{tag_shard_name(tag)}.json"
+
+
+def tag_members(registry: Registry) -> Dict[str, List[dict]]:
+    """Lowercase tag -> the posts carrying it, in display order."""
+    members: Dict[str, List[dict]] = {}
+    for post in registry.posts:
+        for tag in dict.fromkeys(tag.lower() for tag in post.get("tags", [])):
+            members.setdefault(tag, []).append(post)
+    return members
+
+
+def render_sitemap(registry: Registry, members: Dict[str, List[dict]]) -> str:
+    def url(path: str, day: Optional[str]) -> str:
+        lastmod = f"<lastmod>{day}</lastmod>" if day else ""
+        return f"  <url><loc>{html.escape(SITE_URL + path)}</loc>{lastmod}</url>"
+
+    linked = [post for post in registry.posts if post.get("link", "").startswith("/")]
+    newest = max(filter(None, map(post_day, registry.posts)), default=None)
+    urls = [url(path, newest) for path in SITE_ROUTES]
+    urls += [url(post["link"], post_day(post)) for post in linked]
+    urls += [url(f"/tags/{urllib.parse.quote(tag)}",
+                 max(filter(None, map(post_day, posts)), default=None))
+             for tag, posts in sorted(members.items())]
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            + "\n".join(urls) + "\n</urlset>\n")
+
+
+def render_feed(registry: Registry) -> str:
+    esc = html.escape
+    posts = [post for post in registry.posts
+             if post.get("link", "").startswith("/")][:FEED_SIZE]
+    days = [post_day(post) or "1970-01-01" for post in posts]
+    entries = []
+    for post, day in zip(posts, days):
+        url = SITE_URL + post["link"]
+        categories = "".join(f'\n    <category term="{esc(tag)}"/>'
+                             for tag in post.get("tags", []))
+        entries.append(f"""  <entry>
+    <title>{esc(post['title'])}</title>
+    <link href="{esc(url)}"/>
+    <id>{esc(url)}</id>
+    <updated>{day}T00:00:00Z</updated>
+    <summary>{esc(post.get('excerpt', ''))}</summary>{categories}
+  </entry>""")
+    updated = max(days, default="1970-01-01")
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{esc(SITE_NAME)}</title>
+  <link href="{SITE_URL}/feed.xml" rel="self"/>
+  <link href="{SITE_URL}/"/>
+  <id>{SITE_URL}/</id>
+  <updated>{updated}T00:00:00Z</updated>
+  <author><name>{esc(FEED_AUTHOR)}</name></author>
+{chr(10).join(entries)}
+</feed>
+"""
+
+
+@timed()
+def write_feeds(registry: Registry) -> List[Path]:
+    """Write the sitemap, the Atom feed and the tag shards that changed, and
+    delete the shards of tags no post carries any more."""
+    members = tag_members(registry)
+    changed = []
+
+    def emit(stage: str, key: str, file_path: Path, inputs: str, render) -> None:
+        if _build_state is not None and _build_state.fresh(stage, key, inputs):
+            return
+        text = render()
+        if not (page_exists(file_path) and read_page(file_path) == text):
+            write_page(file_path, text)
+            changed.append(file_path)
+        if _build_state is not None:
+            _build_state.record(stage, key, inputs, {file_path: hash_text(text)})
+
+    site = hash_inputs(stage_version("feeds"), registry.to_json())
+    emit("feeds", "sitemap", SITEMAP, site, lambda: render_sitemap(registry, members))
+    emit("feeds", "feed", FEED, site, lambda: render_feed(registry))
+    for tag, posts in members.items():
+        cards = [dict(tag_detail_card(post)) for post in posts]
+        shard = {"version": TAG_SHARD_VERSION, "tag": tag, "posts": cards}
+        inputs = hash_inputs(stage_version("tags"), cards)
+        emit("tags", tag, tag_shard_path(tag), inputs,
+             lambda: json.dumps(shard, ensure_ascii=False,
+                                separators=(",", ":")) + "\n")
+
+    live = {tag_shard_path(tag).name for tag in members}
+    if TAG_SHARD_DIR.is_dir():
+        for file_path in sorted(TAG_SHARD_DIR.glob("*.json")):
+            if file_path.name not in live:
+                delete_path(file_path)
+                print(f"✓ Removed stale tag shard {file_path}")
+    if _build_state is not None:
+        stale = [key for key in _build_state.stages.get("tags", {})
+                 if key not in members]
+        for tag in stale:
+            del _build_state.stages["tags"][tag]
+            _build_state.changed = True
+    return changed
+
+
+# ---- Static snapshots ----
+#
+# build/writeups/<slug>-walkthrough/index.html is a full static rendering of
+# each writeup (header, table of contents and body, with the markup and class
+# names the React components use) inside the app shell, build/index.html,
+# with the post's title, description, OG/Twitter tags and canonical URL. The
+# hosts serve it ahead of the SPA fallback, so crawlers and first paint get
+# the whole article before the bundle has loaded; React then renders over it.
+# Snapshots are rendered from public/content/<slug>.json in a process pool
+# and skipped when the post, its content and the shell are unchanged.
+
+BUILD_DIR = Path("build")
+BUILD_SHELL = BUILD_DIR / "index.html"
+SNAPSHOT_ROOT_TAG = '<div id="root"></div>'
+
+
+def snapshot_path(post: dict) -> Path:
+    return BUILD_DIR / post["link"].strip("/") / "index.html"
+
+
+def inline_html(inline) -> str:
+    if isinstance(inline, str):
+        return html.escape(inline, quote=False)
+    parts = []
+    for part in inline:
+        if isinstance(part, str):
+            parts.append(html.escape(part, quote=False))
+            continue
+        text = html.escape(part[1], quote=False)
+        if part[0] == "a":
+            parts.append(f'<a href="{html.escape(part[2])}" target="_blank" '
+                         f'rel="noopener noreferrer" class="content-link">{text}</a>')
+        elif part[0] == "b":
+            parts.append(f"<strong>{text}</strong>")
+        elif part[0] == "i":
+            parts.append(f"<em>{text}</em>")
+        else:
+            parts.append(f'<code class="inline-code">{text}</code>')
+    return "".join(parts)
+
+
+def image_html(block: list) -> str:
+    _, alt, src, *attributes = block
+    width, height, sources = (attributes + [None, None, []])[:3]
+    size = f' width="{width}" height="{height}"' if width and height else ""
+    img = (f'<img src="{html.escape(src)}" alt="{html.escape(alt)}"{size} '
+           f'loading="lazy" decoding="async" class="content-image">')
+    if not sources:
+        return img
+    sizes = f' sizes="(max-width: {width}px) 100vw, {width}px"' if width else ""
+    tags = "".join(f'<source type="{mime}" srcset="{html.escape(srcset)}"{sizes}>'
+                   for mime, srcset in sources)
+    return f"<picture>{tags}{img}</picture>"
+
+
+def blocks_html(blocks: list) -> str:
+    """The same elements renderBlocks() builds in the browser."""
+    out = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "h":
+            _, level, anchor, inline = block
+            out.append(f'<h{level} id="{html.escape(anchor)}">'
+                       f'{inline_html(inline)}</h{level}>')
+        elif kind == "p":
+            out.append(f"<p>{inline_html(block[1])}</p>")
+        elif kind == "code":
+            language, code = block[1], block[2]
+            label = "Shell" if language == "bash" else (language or "Terminal")
+            prompt = ('<span class="terminal-prompt">$ </span>'
+                      if language in ("bash", "shell") else "")
+            css = f"terminal-code language-{language}" if language else "terminal-code"
+            out.append(f'<div class="code-block-container">'
+                       f'<div class="code-block-header">'
+                       f'<span class="code-block-language">{html.escape(label)}</span>'
+                       f'</div><pre><code class="{html.escape(css)}">{prompt}'
+                       f"{html.escape(code, quote=False)}</code></pre></div>")
+        elif kind == "img":
+            out.append(f'<div class="image-container">{image_html(block)}</div>')
+        elif kind == "info":
+            message = re.sub(r"\*\*([^*]+)\*\*", r"<strong>\1</strong>",
+                             html.escape(block[2], quote=False))
+            title = html.escape(block[1], quote=False)
+            out.append(f'<div class="info-status info-status-info">'
+                       f'<div class="info-status-content">'
+                       f'<div class="info-status-title">{title}</div>'
+                       f'<div class="info-status-message">{message}</div></div></div>')
+        else:
+            out.append("<br>")
+    return "\n".join(out)
+
+
+def _set_meta(page: str, key: str, value: str) -> str:
+    pattern = re.compile(r'(<meta (?:name|property)="%s" content=")[^"]*(")'
+                         % re.escape(key))
+    return pattern.sub(lambda m: m.group(1) + html.escape(value) + m.group(2), page,
+                       count=1)
+
+
+def render_snapshot(post: dict, document: dict, shell: str) -> str:
+    """One writeup's static page. Runs in a worker process."""
+    def esc(value) -> str:
+        return html.escape(str(value), quote=False)
+
+    title = f"{post['title']} | {SITE_NAME}"
+    description = post.get("previewDescription") or post.get("excerpt", "")
+    url = SITE_URL + post["link"]
+    tags = post.get("displayTags") or format_tags_for_writeups(post.get("tags", []))
+    toc = "".join(f'<li class="toc-level-{entry["level"]}">'
+                  f'<a href="#{html.escape(entry["id"])}">{esc(entry["text"])}</a></li>'
+                  for entry in document["toc"])
+    info = "".join(f'<div class="info-item">{label}: {esc(post[key])}</div>'
+                   for label, key in (("OS", "os"), ("Difficulty", "difficulty"),
+                                      ("IP", "ip"))
+                   if post.get(key))
+    badges = "".join(f'<span class="tag-badge">{esc(tag)}</span>' for tag in tags)
+    image = html.escape(post.get("image", ""))
+    body = f"""<div class="writeup-detail-page"><div class="writeup-header">
+<a href="/writeups" class="back-button"><span>Back to Writeups</span></a>
+<div class="writeup-title-section"><h1 id="writeup-title">{esc(post['title'])}</h1>
+<div class="writeup-meta"><div class="meta-item"><span>{esc(post.get('date', ''))}</span></div></div>
+<div class="writeup-tags">{badges}</div></div>
+<div class="machine-info"><div class="machine-info-content"><div class="machine-info-left"><div class="machine-info-vertical">{info}</div></div>
+<div class="machine-info-right"><img src="{image}" alt="{html.escape(post['title'])}" class="machine-image"></div></div></div>
+</div>
+<nav class="table-of-contents toc--collapsed"><ul>{toc}</ul></nav>
+<div class="markdown-content">
+{blocks_html(document["blocks"])}
+</div></div>"""  # noqa: E501
+
+    page = re.sub(r"<title>[^<]*</title>", lambda m: f"<title>{esc(title)}</title>",
+                  shell, count=1)
+    for key, value in (("description", description), ("og:title", title),
+                       ("og:description", description), ("og:url", url),
+                       ("og:image", SITE_URL + post.get("image", "")),
+                       ("og:type", "article"), ("twitter:title", title),
+                       ("twitter:description", description), ("twitter:url", url),
+                       ("twitter:image", SITE_URL + post.get("image", ""))):
+        page = _set_meta(page, key, value)
+    canonical = f'<link rel="canonical" href="{html.escape(url)}"/>'
+    page = page.replace("</head>", f"{canonical}</head>", 1)
+    return page.replace(SNAPSHOT_ROOT_TAG, f'<div id="root">{body}</div>', 1)
+
+
+@timed()
+def write_snapshots(registry: Registry, workers: Optional[int] = None) -> List[Path]:
+    """Render every writeup's static snapshot under build/ in a process pool,
+    writing only the files that changed and deleting snapshots of removed posts."""
+    if not page_exists(BUILD_SHELL):
+        print(f"Error: {BUILD_SHELL} not found; run `npm run build` first",
+              file=sys.stderr)
+        return []
+    shell = read_page(BUILD_SHELL)
+    if SNAPSHOT_ROOT_TAG not in shell:
+        print(f"Error: {BUILD_SHELL} has no empty {SNAPSHOT_ROOT_TAG}", file=sys.stderr)
+        return []
+
+    posts = [post for post in registry.writeups
+             if post.get("link") and post.get("componentPath")
+             and page_exists(content_path(post))]
+    pending = []
+    for post in posts:
+        content = read_page(content_path(post))
+        inputs = hash_inputs(stage_version("snapshot"), post, hash_text(content),
+                             hash_text(shell))
+        if (_build_state is not None
+                and _build_state.fresh("snapshot", post["slug"], inputs)):
+            continue
+        pending.append((post, json.loads(content), inputs))
+
+    changed: List[Path] = []
+
+    def record(post: dict, inputs: str, text: str) -> None:
+        file_path = snapshot_path(post)
+        if not (page_exists(file_path) and read_page(file_path) == text):
+            write_page(file_path, text)
+            changed.append(file_path)
+        if _build_state is not None:
+            _build_state.record("snapshot", post["slug"], inputs,
+                                {file_path: hash_text(text)})
+
+    workers = workers or os.cpu_count() or 1
+    if len(pending) <= 1 or workers == 1:
+        for post, document, inputs in pending:
+            record(post, inputs, render_snapshot(post, document, shell))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(render_snapshot, post, document, shell):
+                       (post, inputs) for post, document, inputs in pending}
+            for future in as_completed(futures):
+                record(*futures[future], future.result())
+
+    live = {snapshot_path(post).parent for post in posts}
+    snapshot_dir = BUILD_DIR / "writeups"
+    if snapshot_dir.is_dir():
+        for directory in sorted(snapshot_dir.glob("*-walkthrough")):
+            if directory not in live and (directory / "index.html").exists():
+                delete_path(directory)
+                print(f"✓ Removed stale snapshot {directory}")
+    return changed
+
+
+# ---- Hashed assets ----
+#
+# After `npm run build` has copied public/ into build/, prerender copies every
+# image under build/images to build/images/h/<first 16 hex digits of its
+# SHA-256><ext> and rewrites each /images/... URL in the built pages,
+# bundles and data files (HTML, JS, CSS, JSON, XML) to the new name. The name
+# changes whenever the content does, so _headers can let browsers and CDNs
+# keep these for a year without revalidating, and identical files (the same
+# screenshot in two machines' folders) are fetched once. The originals stay
+# deployed under their old URLs for pages and feeds already cached or shared
+# elsewhere. The sources under public/ and src/ are never touched.
+# build/images/assets.json records the mapping, so running prerender again
+# on the same build is a no-op.
+
+ASSET_DIR = BUILD_DIR / "images" / "h"
+ASSET_MAP = BUILD_DIR / "images" / "assets.json"
+ASSET_MAP_VERSION = 1
+ASSET_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif")
+ASSET_TEXT_SUFFIXES = (".html", ".js", ".css", ".json", ".xml")
+ASSET_HASH_LENGTH = 16
+ASSET_MAX_AGE = 365 * 24 * 3600
+_IMAGE_URL = re.compile(r"/images/[^\s'\"`()<>,\\]+")
+
+
+def build_web_path(path: Path) -> str:
+    """/images/... URL of a file under build/."""
+    return "/" + path.relative_to(BUILD_DIR).as_posix()
+
+
+@timed()
+def hash_build_assets() -> List[Path]:
+    """Copy the images under build/images to their content-hashed names and
+    point every built file at the copies. Returns the text files rewritten."""
+    assets: Dict[str, str] = {}
+    if page_exists(ASSET_MAP):
+        try:
+            assets = json.loads(read_page(ASSET_MAP)).get("assets", {})
+        except ValueError:
+            pass
+    hashed = 0
+    for name in sorted(scan_files(BUILD_DIR / "images")):
+        path = Path(name)
+        if path.suffix.lower() not in ASSET_SUFFIXES or ASSET_DIR in path.parents:
+            continue
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:ASSET_HASH_LENGTH]
+        target = ASSET_DIR / f"{digest}{path.suffix.lower()}"
+        if not page_exists(target):
+            write_page(target, data)
+        assets[build_web_path(path)] = build_web_path(target)
+        hashed += 1
+
+    def replace(match: re.Match) -> str:
+        return assets.get(match.group(0), match.group(0))
+
+    changed = []
+    for name in sorted(scan_files(BUILD_DIR)):
+        path = Path(name)
+        if path.suffix not in ASSET_TEXT_SUFFIXES or path == ASSET_MAP:
+            continue
+        try:
+            text = read_page(path)
+        except UnicodeDecodeError:
+            continue
+        rewritten = _IMAGE_URL.sub(replace, text)
+        if rewritten != text:
+            write_page(path, rewritten)
+            changed.append(path)
+            if _build_state is not None:
+                _build_state.update_output(path, hash_text(rewritten))
+    document = {"version": ASSET_MAP_VERSION, "assets": dict(sorted(assets.items()))}
+    write_page(ASSET_MAP, json.dumps(document, indent=2) + "\n")
+    shipped = len(set(assets.values()))
+    print(f"✓ Hashed {hashed} image(s) into {shipped} file(s) under {ASSET_DIR}, "
+          f"{len(changed)} built file(s) rewritten")
+    return changed
+
+
+# ---- Remove functions ----
+
+@timed()
+def remove_writeup_component(machine_name: str,
+                             component_path: Optional[str] = None) -> bool:
+    """Delete the component's .js/.css/.md. `component_path` is the registry's
+    componentPath (e.g. './writeups/dc02/DC02Walkthrough'); without it the
+    default <machine>/<Machine>Walkthrough layout is assumed."""
+    try:
+        if component_path:
+            component_file = Path("src/pages") / component_path[2:]
+            component_dir, component_name = component_file.parent, component_file.name
+        else:
+            component_name = f"{machine_name.capitalize()}Walkthrough"
+            component_dir = Path(f"src/pages/writeups/{machine_name.lower()}")
+        files = [component_dir / f"{component_name}{suffix}"
+                 for suffix in (".js", ".css", ".md")]
+        for f in files:
+            if f.exists():
+                delete_path(f)
+                print(f"✓ Removed {f}")
+        if component_dir.exists() and all(f in files for f in component_dir.iterdir()):
+            delete_path(component_dir)
+            print(f"✓ Removed directory {component_dir}")
+        return True
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
+
+
+@timed()
+def remove_machine_image(machine_name: str) -> bool:
+    try:
+        image_dir = Path(f"public/images/writeups/{machine_name.lower()}")
+        if image_dir.exists():
+            delete_path(image_dir)
+            print(f"✓ Removed image directory {image_dir}")
+            if page_exists(IMAGE_MANIFEST):
+                prefix = image_web_path(image_dir) + "/"
+                images = load_image_manifest()
+                save_image_manifest({k: v for k, v in images.items()
+                                     if not k.startswith(prefix)})
+            return True
+        return False
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
+
+
+def remove_writeup(machine_name: str, registry: Registry) -> bool:
+    """Remove a writeup from the registry and delete its component and images.
+    The caller regenerates the pages (see publish)."""
+    print(f"\n{'='*60}\nRemoving writeup: {machine_name}\n{'='*60}\n")
+    success = True
+    entry = registry.remove(machine_name)
+    if entry is None:
+        print(f"Warning: '{machine_name.lower()}' is not in {registry.path}",
+              file=sys.stderr)
+        success = False
+    else:
+        print(f"✓ Removed '{entry['slug']}' from {registry.path}")
+    component_path = entry.get("componentPath") if entry else None
+    if not remove_writeup_component(machine_name, component_path):
+        success = False
+    if not remove_machine_image(machine_name):
+        success = False
+    if _build_state is not None:
+        slug = machine_name.lower()
+
+        def forget_build_records():
+            if registry.get(slug) is None:  # unless a later entry re-created it
+                _build_state.forget(slug)
+
+        # Only once the files are really gone: an aborted or rolled-back removal
+        # keeps the records that still describe them.
+        after_commit(forget_build_records)
     print("✓ Writeup removal completed." if success else "⚠ Completed with warnings.")
     return success
 
 
+def create_writeup(machine_name: str, title: str, description: str, tags: list,
+                   difficulty: str, os: str, ip: str, date: str, registry: Registry,
+                   timer: Optional[PhaseTimer] = None,
+                   image: Optional[Tuple[bool, str]] = None,
+                   variant: Optional[str] = None) -> bool:
+    """Run every create step for one machine and record it in the registry.
+    The caller regenerates the pages (see publish).
+
+    `image` is a (success, image_path) result from an earlier concurrent
+    download; when omitted the avatar is downloaded here. `variant` is a
+    TEMPLATE_VARIANTS key (default: chosen from the tags and OS).
+    """
+    timer = timer or PhaseTimer()
+    variant = variant or choose_variant({"tags": tags, "os": os})
+
+    print(f"\n{'='*60}\nCreating writeup: {machine_name}\n{'='*60}\n")
+
+    print("Step 1: Downloading machine image...")
+    if image is None and not is_machine_variant(variant):
+        # Sherlocks and Challenges have no machine avatar; the author adds one
+        image = (True, f"/images/writeups/{machine_name.lower()}/machine.png")
+        print(f"No HTB avatar for a {TEMPLATE_VARIANTS[variant]['kind']}; "
+              f"add public{image[1]} yourself")
+    if image is None:
+        with timer.phase("download"):
+            image = download_machine_image(machine_name)
+    success, image_path = image
+    if not success:
+        return False
+    image_dir = IMAGES_ROOT / "writeups" / machine_name.lower()
+
+    def optimize_machine_images():
+        with timer.phase("images"):
+            if not optimize_images([image_dir], workers=1):
+                print("Warning: image optimization failed; "
+                      "continuing with the original image", file=sys.stderr)
+
+    # Variants are derived from the committed image, so they are built after commit.
+    after_commit(optimize_machine_images)
+
+    print("\nStep 2: Creating writeup component...")
+    with timer.phase("component"):
+        if not create_writeup_component(
+            machine_name, title, description, tags,
+            difficulty, os, ip, date, image_path, variant,
+        ):
+            return False
+
+    print("\nStep 3: Registering writeup...")
+    with timer.phase("registry"):
+        registry.add(make_writeup_entry(
+            registry, machine_name, title, description, tags,
+            difficulty, os, ip, date, image_path,
+        ))
+    print(f"✓ Added '{machine_name.lower()}' to {registry.path}")
+    return True
+
+
+# ---- Batch mode ----
+
+CREATE_FIELDS = ("title", "description", "tags", "difficulty", "os", "ip")
+
+
+def required_fields(variant: str) -> Tuple[str, ...]:
+    if is_machine_variant(variant):
+        return CREATE_FIELDS
+    return tuple(attr for attr in CREATE_FIELDS if attr not in ("os", "ip"))
+
+
+@timed()
+def load_manifest(path: Path) -> List[dict]:
+    """Load a batch manifest (JSON or YAML) and return its list of machine entries."""
+    text = path.read_text()
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(
+                "PyYAML is required for YAML manifests (pip install pyyaml)")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("machines")
+    if not isinstance(data, list):
+        raise ValueError("manifest must be a list of machines "
+                         "or a mapping with a 'machines' list")
+
+    entries = []
+    for index, raw in enumerate(data, 1):
+        if not isinstance(raw, dict):
+            raise ValueError(
+                f"entry {index}: expected a mapping, got {type(raw).__name__}")
+        entry = dict(raw)
+        entry["name"] = str(entry.get("name") or entry.get("machine") or "").strip()
+        if not entry["name"]:
+            raise ValueError(f"entry {index}: 'name' is required")
+        entry["action"] = str(entry.get("action", "create")).lower()
+        if entry["action"] not in ("create", "remove"):
+            raise ValueError(
+                f"entry {index} ({entry['name']}): action must be 'create' or 'remove'")
+        if entry["action"] == "create":
+            if isinstance(entry.get("tags"), str):
+                entry["tags"] = [t.strip() for t in entry["tags"].split(",")]
+            if entry.get("template") and entry["template"] not in TEMPLATE_VARIANTS:
+                raise ValueError(f"entry {index} ({entry['name']}): template must be "
+                                 f"one of {', '.join(TEMPLATE_VARIANTS)}")
+            if is_machine_variant(choose_variant(entry)):
+                fill_machine_fields(entry["name"], entry)
+            entry["template"] = choose_variant(entry)
+            missing = [attr for attr in required_fields(entry["template"])
+                       if not entry.get(attr)]
+            if missing:
+                raise ValueError(
+                    f"entry {index} ({entry['name']}): missing {', '.join(missing)}")
+            entry["tags"] = [str(t) for t in entry["tags"]]
+        entries.append(entry)
+    return entries
+
+
+def run_manifest(manifest_path: Path, workers: int = DEFAULT_WORKERS) -> bool:
+    """Apply every create/remove in a manifest in one transaction, with a
+    single read and write per file. An entry that fails is rolled back on its
+    own, files and registry alike; the rest are committed together."""
+    timer = PhaseTimer()
+    with timer.phase("load"):
+        try:
+            entries = load_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            print(f"Error: invalid manifest {manifest_path}: {e}", file=sys.stderr)
+            return False
+
+    current_date = get_current_date()
+    results: List[Tuple[str, str, bool]] = []
+    written: List[Path] = []
+    try:
+        with transaction() as txn:
+            with timer.phase("download"):
+                images = download_machine_images(
+                    [e["name"] for e in entries
+                     if e["action"] == "create" and is_machine_variant(e["template"])],
+                    workers,
+                )
+            with timer.phase("load"):
+                registry = Registry.load()
+            for entry in entries:
+                name = entry["name"]
+                savepoint, posts = txn.savepoint(), registry.snapshot()
+                if entry["action"] == "remove":
+                    with timer.phase("remove"):
+                        ok = remove_writeup(name, registry)
+                else:
+                    ok = create_writeup(
+                        name, entry["title"], entry["description"], entry["tags"],
+                        entry["difficulty"], entry.get("os"), entry.get("ip"),
+                        str(entry.get("date") or current_date), registry, timer,
+                        images.get(name), entry["template"],
+                    )
+                if not ok:
+                    txn.rollback_to(savepoint)
+                    registry.restore(posts)
+                results.append((name, entry["action"], ok))
+            with timer.phase("build"):
+                published = publish(registry)
+            if published:
+                with timer.phase("write"):
+                    written = txn.commit()
+            else:
+                txn.abort()
+    except OSError as e:
+        print(f"Error: writing files failed; all changes were rolled back: {e}",
+              file=sys.stderr)
+        return False
+
+    print(f"\n{'='*60}\nBatch summary ({manifest_path})\n{'='*60}")
+    for name, action, ok in results:
+        print(f"{'✓' if ok else '✗'} {name} ({action})")
+    names = ", ".join(str(p) for p in written) or "none"
+    print(f"\nWrote {len(written)} file(s): {names}")
+    print("\nTime per phase:")
+    print(timer.report())
+    return published and all(ok for _, _, ok in results)
+
+
+# ---- Watch mode ----
+#
+# `watch` keeps the generated files in step with a writeup while it is being
+# written. Changes under src/pages/writeups/ and public/images/writeups/ are
+# picked up with inotify (Linux, through ctypes) or, where that is not
+# available, by polling mtimes; a burst of events is debounced into one
+# cycle, and each changed file is mapped to the machine whose directory it is
+# in. Only that machine's stages run: its new or edited images are
+# optimized, a saved component has its `writeup` object's card fields copied
+# into the registry, and its preview and content are re-rendered. The pages
+# and search index are site-wide but skip themselves via the build state
+# when nothing they read has changed.
+
+WRITEUPS_SRC_DIR = Path("src/pages/writeups")
+WATCH_ROOTS = (WRITEUPS_SRC_DIR, IMAGES_ROOT / "writeups")
+WATCH_SOURCE_KINDS = {".md": "markdown", ".js": "component"}
+CARD_FIELDS = ("title", "excerpt", "date", "difficulty", "os", "ip")
+DEFAULT_DEBOUNCE_MS = 100
+DEFAULT_POLL_INTERVAL = 0.25
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Recursive inotify watch on a set of directories (Linux only)."""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, roots: List[Path]):
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root: Path) -> None:
+        if not root.is_dir():
+            return
+        for directory in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory),
+                                              self.MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def read(self, timeout: Optional[float]) -> set:
+        """Paths changed within `timeout` seconds (None waits for the first)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._dirs.get(wd)
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files can land in a new directory before its watch exists
+                    self._add_tree(path)
+                    changed.update(p for p in path.rglob("*") if p.is_file())
+                continue
+            if mask & ~IN_CREATE:  # a file counts once it is written or moved in
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher: rescans (mtime, size) of every file under the roots."""
+
+    def __init__(self, roots: List[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        self.roots = roots
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for directory, _, files in os.walk(root):
+                for name in files:
+                    path = Path(directory) / name
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def read(self, timeout: Optional[float]) -> set:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None
+                       else max(0.0, min(self.interval, deadline - time.monotonic())))
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(roots: List[Path], poll: bool = False):
+    """An inotify watcher, or a polling one if asked or inotify is unavailable."""
+    if not poll:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            print("inotify unavailable; polling for changes instead.")
+    return PollingWatcher(roots)
+
+
+def classify_change(path: Path) -> Optional[Tuple[str, str]]:
+    """(machine slug, kind) of a watched file, kind being "markdown",
+    "component" or "image"; None for anything watch does not act on
+    (CSS, editor swap files, generated image variants)."""
+    if path.name.startswith("."):
+        return None
+    suffix = path.suffix.lower()
+    for root, kind in ((WATCH_ROOTS[0], WATCH_SOURCE_KINDS.get(suffix)),
+                       (WATCH_ROOTS[1],
+                        "image" if suffix in IMAGE_SOURCE_SUFFIXES else None)):
+        try:
+            parts = path.relative_to(root).parts
+        except ValueError:
+            continue
+        return (parts[0].lower(), kind) if kind and len(parts) > 1 else None
+    return None
+
+
+def sync_card_metadata(post: dict) -> List[str]:
+    """Copy the card fields edited in the component's `writeup` object into
+    its registry entry. Returns the names of the fields that changed."""
+    metadata = read_component_metadata(post["componentPath"])
+    changed = []
+    for key in CARD_FIELDS:
+        value = metadata.get(key)
+        if isinstance(value, str) and value and post.get(key) != value:
+            post[key] = value
+            changed.append(key)
+    tags = metadata.get("tags")
+    if isinstance(tags, list) and tags:
+        tags = [str(tag) for tag in tags]
+        if post.get("tags") != format_tags_for_home(tags):
+            post["tags"] = format_tags_for_home(tags)
+            changed.append("tags")
+        if tags == format_tags_for_writeups(post["tags"]):
+            if post.get("displayTags", tags) != tags:
+                del post["displayTags"]
+                changed.append("displayTags")
+        elif post.get("displayTags") != tags:
+            post["displayTags"] = tags
+            changed.append("displayTags")
+    return changed
+
+
+def already_optimized(path: Path, manifest: dict) -> bool:
+    """True if `path` is exactly what the last optimization wrote (so the
+    event is our own lossless recompression, not an edit)."""
+    entry = manifest.get(image_web_path(path))
+    try:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        return bool(entry) and entry["sha256"] == digest
+    except OSError:
+        return False
+
+
+@timed()
+def watch_cycle(changes: Dict[str, set], avif: bool = False,
+                workers: Optional[int] = None) -> List[Path]:
+    """Re-run the stages affected by `changes` ({slug: {(kind, path)}}) in one
+    transaction. Returns the files written."""
+    with transaction() as txn:
+        registry = Registry.load()
+        for slug, events in sorted(changes.items()):
+            images = sorted(path for kind, path in events
+                            if kind == "image" and path.exists())
+            if images:
+                optimize_images(images, workers, avif=avif)
+            post = registry.get(slug)
+            if post is None or not post.get("componentPath"):
+                if any(kind != "image" for kind, _ in events):
+                    print(f"  {slug} is not in {registry.path}; create it first")
+                continue
+            if any(kind == "component" for kind, _ in events):
+                fields = sync_card_metadata(post)
+                if fields:
+                    print(f"✓ Synced {', '.join(fields)} of {slug} "
+                          f"into {registry.path}")
+            _write_preview(post)
+            _write_content(post)
+        registry.save()
+        build_site(registry)
+        write_search_index(registry)
+    return txn.written
+
+
+def written_by_cycle(path: Path, written: Dict[Path, str]) -> bool:
+    """True if `path` is still exactly what the last watch cycle wrote (so the
+    event is the tool's own write, not an edit)."""
+    try:
+        return (path in written
+                and written[path] == hashlib.sha256(path.read_bytes()).hexdigest())
+    except OSError:
+        return False
+
+
+def watch(poll: bool = False, debounce: float = DEFAULT_DEBOUNCE_MS / 1000,
+          avif: bool = False, workers: Optional[int] = None) -> None:
+    """Run watch cycles until interrupted."""
+    watcher = open_watcher(list(WATCH_ROOTS), poll)
+    own: Dict[Path, str] = {}
+    kind = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    roots = ", ".join(str(root) for root in WATCH_ROOTS)
+    print(f"Watching {roots} ({kind}); Ctrl-C to stop.")
+    try:
+        while True:
+            paths = watcher.read(None)
+            while True:
+                more = watcher.read(debounce)
+                if not more:
+                    break
+                paths |= more
+
+            start = time.perf_counter()
+            manifest = load_image_manifest()
+            changes: Dict[str, set] = {}
+            for path in paths:
+                change = classify_change(path)
+                if (change is None or written_by_cycle(path, own)
+                        or (change[1] == "image"
+                            and already_optimized(path, manifest))):
+                    continue
+                changes.setdefault(change[0], set()).add((change[1], path))
+            if not changes:
+                continue
+            try:
+                written = watch_cycle(changes, avif, workers)
+            except Exception as e:
+                print(f"Error: {e}; nothing was written", file=sys.stderr)
+                continue
+            finally:
+                save_build_state()
+            own = {file_path: hashlib.sha256(file_path.read_bytes()).hexdigest()
+                   for file_path in written
+                   if file_path.is_file() and classify_change(file_path)}
+            for file_path in written:
+                if file_path != IMAGE_MANIFEST:  # optimize_images reports it
+                    print(f"✓ Regenerated {file_path}")
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"✓ {', '.join(sorted(changes))}: {len(written)} file(s) updated "
+                  f"in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+
+
+# ---- Consistency check ----
+#
+# `check` is a read-only pre-deploy gate. It reads the registry, the three
+# card pages (Home, Writeups, Tags), the WriteupDetail route map, every
+# writeup's markdown and one directory walk each of src/pages/writeups/ and
+# public/images/, indexes them by id, route and path, and cross-references
+# the indexes instead of searching files per post. When the build state
+# shows the pages are exactly what the last build generated from this
+# registry, their cards and routes are taken from the registry instead of
+# being lexed again, which keeps a check of thousands of writeups well under
+# a second. Problems are grouped by kind: duplicate ids, missing cards,
+# routes, components and images, cards or routes that disagree with the
+# registry, orphans nothing refers to, and oversized images.
+#
+# check-baseline.json lists the problems accepted by the last
+# `check --update-baseline` (screenshots kept for a later edit of a writeup,
+# project images not yet shrunk); those are reported but do not fail the
+# check, so the gate only trips on new ones.
+
+DEFAULT_MAX_IMAGE_KB = 1024
+CHECK_KINDS = ("duplicate", "missing", "mismatch", "orphan", "oversized")
+CHECK_BASELINE = Path("check-baseline.json")
+CHECK_BASELINE_VERSION = 1
+
+
+def scan_files(root: Path) -> Dict[str, int]:
+    """Size of every file under `root`, keyed by POSIX path, from one walk."""
+    sizes = {}
+    pending = [str(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    else:
+                        sizes[entry.path.replace(os.sep, "/")] = entry.stat().st_size
+                except OSError:
+                    pass
+    return sizes
+
+
+@timed()
+def check_site(registry: Registry, max_image_bytes: int = DEFAULT_MAX_IMAGE_KB * 1024
+               ) -> List[Tuple[str, str]]:
+    """Cross-check every generated and hand-written artifact. Returns
+    (kind, message) pairs, kind being one of CHECK_KINDS."""
+    problems: List[Tuple[str, str]] = []
+
+    def report(kind: str, message: str) -> None:
+        problems.append((kind, message))
+
+    def label(item: dict) -> str:
+        return f"'{item.get('title', '?')}' (id {item.get('id')})"
+
+    posts_by_id: Dict[object, dict] = {}
+    slugs: Dict[str, dict] = {}
+    for post in registry.posts:
+        if post.get("id") in posts_by_id:
+            other = label(posts_by_id[post.get("id")])
+            report("duplicate", f"{registry.path}: id {post.get('id')} is used by "
+                                f"{other} and '{post.get('title')}'")
+        posts_by_id.setdefault(post.get("id"), post)
+        if post.get("slug") in slugs:
+            report("duplicate", f"{registry.path}: slug '{post['slug']}' is used by "
+                                f"{label(slugs[post['slug']])} and {label(post)}")
+        if post.get("slug"):
+            slugs.setdefault(post["slug"], post)
+
+    public_prefix = len(PUBLIC_DIR.as_posix())
+    images = {path[public_prefix:]: size
+              for path, size in scan_files(IMAGES_ROOT).items()}
+    referenced = set()
+
+    def check_image(src: str, where: str) -> None:
+        if not src.startswith("/images/") or src in referenced:
+            return
+        referenced.add(src)
+        size = images.get(src)
+        if size is None:
+            report("missing", f"{where}: image {src} does not exist")
+        elif size > max_image_bytes:
+            report("oversized", f"{where}: image {src} is {format_bytes(size)} "
+                                f"(limit {format_bytes(max_image_bytes)})")
+
+    generated = pages_fresh(registry)
+    for file_path, (card_renderer, writeups_only) in PAGE_CARDS.items():
+        expected = registry.writeups if writeups_only else registry.posts
+        try:
+            cards = ([dict(card_renderer(post)) for post in expected] if generated
+                     else load_cards(file_path).cards)
+        except (OSError, ValueError) as e:
+            report("missing", f"{file_path}: card array unreadable: {e}")
+            continue
+        seen: Dict[object, dict] = {}
+        for card in cards:
+            if card.get("id") in seen:
+                other = label(seen[card.get("id")])
+                report("duplicate", f"{file_path}: id {card.get('id')} is used by "
+                                    f"{other} and '{card.get('title')}'")
+                continue
+            seen[card.get("id")] = card
+            post = posts_by_id.get(card.get("id"))
+            if post is None:
+                report("orphan",
+                       f"{file_path}: card {label(card)} is not in {registry.path}")
+            elif (card.get("title") != post.get("title")
+                  or card.get("link", post.get("link")) != post.get("link")):
+                report("mismatch", f"{file_path}: card {label(card)} does not match "
+                                   f"{registry.path} ('{post.get('title')}', "
+                                   f"{post.get('link')})")
+            if card.get("image"):
+                check_image(card["image"], f"{file_path} card {label(card)}")
+        for post in expected:
+            if post.get("id") not in seen:
+                report("missing", f"{file_path}: no card for {label(post)}")
+
+    sources = scan_files(WRITEUPS_SRC_DIR)
+    try:
+        if generated:
+            routes = {writeup_route(post): post["componentPath"]
+                      for post in registry.writeups if post.get("componentPath")}
+        else:
+            routes = ComponentMap(read_page(WRITEUP_DETAIL)).routes
+    except (OSError, ValueError) as e:
+        report("missing", f"{WRITEUP_DETAIL}: route map unreadable: {e}")
+        routes = {}
+    posts_by_route = {writeup_route(post): post for post in registry.writeups
+                      if post.get("link")}
+    for route, post in posts_by_route.items():
+        if route not in routes:
+            report("missing", f"{WRITEUP_DETAIL}: no route '{route}' for {label(post)}")
+        elif post.get("componentPath") and routes[route] != post["componentPath"]:
+            report("mismatch", f"{WRITEUP_DETAIL}: route '{route}' imports "
+                               f"{routes[route]}, {registry.path} has "
+                               f"{post['componentPath']}")
+    for route, import_path in routes.items():
+        if route not in posts_by_route:
+            report("orphan",
+                   f"{WRITEUP_DETAIL}: route '{route}' has no post in {registry.path}")
+        component = f"src/pages/{import_path[2:]}.js"
+        if component not in sources:
+            report("missing", f"{WRITEUP_DETAIL}: route '{route}' imports "
+                              f"{component}, which does not exist")
+
+    imported = {f"src/pages/{path[2:]}.js" for path in routes.values()}
+    for path in sorted(sources):
+        if path.endswith(".js") and path not in imported:
+            report("orphan", f"{path} is not routed from {WRITEUP_DETAIL}")
+
+    for post in registry.writeups:
+        where = label(post)
+        if post.get("image"):
+            check_image(post["image"], f"{registry.path} {where}")
+        if not post.get("componentPath"):
+            continue
+        source = f"src/pages/{post['componentPath'][2:]}.md"
+        if source not in sources:
+            report("missing", f"{source} does not exist (markdown of {where})")
+            continue
+        for match in _MD_IMAGE.finditer(read_page(Path(source))):
+            check_image(match.group(2), source)
+
+    writeup_images = IMAGES_ROOT / "writeups"
+    prefix = image_web_path(writeup_images) + "/"
+    orphan_dirs = set()
+    for src in sorted(images):
+        machine, _, name = src[len(prefix):].partition("/")
+        if (not src.startswith(prefix) or not name
+                or Path(name).suffix.lower() not in IMAGE_SOURCE_SUFFIXES):
+            continue
+        if machine.lower() not in slugs:
+            if machine not in orphan_dirs:
+                orphan_dirs.add(machine)
+                report("orphan", f"{writeup_images / machine}/ belongs to no post "
+                                 f"in {registry.path}")
+        elif src not in referenced:
+            report("orphan", f"{PUBLIC_DIR}{src} is not used by any card or markdown")
+    return problems
+
+
+# ---- Page weight report ----
+#
+# `report` measures what each writeup costs a visitor and what the whole
+# site weighs, from the source tree and, when `npm run build` has left
+# build/static/ behind, the built bundle. Per writeup: its component (JS)
+# and CSS, its public/content/<slug>.json, all gzipped as they are served,
+# and the images its card and markdown reference, raw, as served (the
+# smallest full-size WebP/AVIF variant where one exists) and the largest
+# one. The bundle columns are the lazy chunks whose source maps list the
+# writeup's directory. Site-wide: every JS and CSS file under src/, the
+# bundle, the content files and every image that is deployed: everything
+# under build/ once it has been built (after prerender, the hashed copies
+# rather than the originals they were copied from, which the pages no longer
+# link), else everything under public/, which the build copies as is.
+#
+# report-baseline.json holds the budgets (bytes, per writeup and site-wide)
+# and the measurements of the last `report --update-baseline`; each run is
+# diffed against it, and the command exits 1 when a budget is exceeded (or,
+# with --max-growth, when a size grew by more than that share).
+
+REPORT_BASELINE = Path("report-baseline.json")
+REPORT_VERSION = 1
+REPORT_SOURCE_SUFFIXES = {"js": (".js",), "css": (".css",)}
+REPORT_METRICS = {
+    "js": "JS", "css": "CSS", "content": "content", "images": "images",
+    "images_served": "served", "largest_image": "largest",
+    "bundle_js": "bundle JS", "bundle_css": "bundle CSS",
+}
+DEFAULT_BUDGETS = {
+    "writeup": {"js": 16 * 1024, "css": 8 * 1024, "content": 64 * 1024,
+                "images": 8 * 1024 * 1024, "images_served": 6 * 1024 * 1024,
+                "largest_image": DEFAULT_MAX_IMAGE_KB * 1024,
+                "bundle_js": 64 * 1024, "bundle_css": 8 * 1024},
+    "site": {"js": 512 * 1024, "css": 128 * 1024, "content": 1024 * 1024,
+             "images": 64 * 1024 * 1024, "largest_image": 2 * 1024 * 1024,
+             "bundle_js": 1024 * 1024, "bundle_css": 128 * 1024},
+}
+
+
+def gzip_size(data: bytes) -> int:
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def bundle_assets() -> Dict[Path, List[str]]:
+    """JS/CSS files of the built bundle -> the source paths their source maps
+    list ({} when build/static/ is missing)."""
+    manifest = BUILD_DIR / "asset-manifest.json"
+    try:
+        files = json.loads(manifest.read_text()).get("files", {}).values()
+    except (OSError, ValueError):
+        return {}
+    assets = {}
+    for url in files:
+        path = BUILD_DIR / url.lstrip("/")
+        if path.suffix not in (".js", ".css") or not path.is_file():
+            continue
+        try:
+            source_map = json.loads(path.with_name(path.name + ".map").read_text())
+            sources = source_map.get("sources", [])
+        except (OSError, ValueError):
+            sources = []
+        assets[path] = sources
+    return assets
+
+
+def served_image_bytes(src: str, size: int, images: dict) -> int:
+    """Bytes a browser that supports the variants downloads for an image."""
+    variants = image_variants(src, images.get(src))
+    return min([v["bytes"] for name, v in variants.items() if name.startswith("full.")]
+               + [size])
+
+
+def writeup_weights(post: dict, images: dict,
+                    bundle: Dict[Path, List[str]]) -> Dict[str, int]:
+    component = Path("src/pages") / f"{post['componentPath'][2:]}.js"
+    directory = component.parent.as_posix() + "/"
+    weights = {
+        "js": gzip_size(component.read_bytes()) if component.is_file() else 0,
+        "css": sum(gzip_size(path.read_bytes())
+                   for path in sorted(component.parent.glob("*.css"))),
+        "content": (gzip_size(content_path(post).read_bytes())
+                    if content_path(post).is_file() else 0),
+    }
+    markdown = read_writeup_markdown(post)
+    srcs = [post.get("image", "")] + [match.group(2)
+                                      for match in _MD_IMAGE.finditer(markdown)]
+    sizes = {}
+    for src in dict.fromkeys(srcs):
+        path = PUBLIC_DIR / src.lstrip("/")
+        if src.startswith("/images/") and path.is_file():
+            sizes[src] = path.stat().st_size
+    weights["images"] = sum(sizes.values())
+    weights["images_served"] = sum(served_image_bytes(src, size, images)
+                                   for src, size in sizes.items())
+    weights["largest_image"] = max(sizes.values(), default=0)
+    if bundle:
+        for kind in ("js", "css"):
+            weights[f"bundle_{kind}"] = sum(
+                gzip_size(path.read_bytes()) for path, sources in bundle.items()
+                if path.suffix == f".{kind}"
+                and any(directory in source for source in sources))
+    return weights
+
+
+def site_weights(bundle: Dict[Path, List[str]]) -> Dict[str, int]:
+    weights = {}
+    sources = scan_files(Path("src"))
+    for kind, suffixes in REPORT_SOURCE_SUFFIXES.items():
+        weights[kind] = sum(gzip_size(Path(path).read_bytes())
+                            for path in sorted(sources)
+                            if Path(path).suffix in suffixes)
+    weights["content"] = sum(gzip_size(path.read_bytes())
+                             for path in sorted(CONTENT_DIR.glob("*.json")))
+    deployed = BUILD_DIR if bundle else PUBLIC_DIR
+    hashed = set()
+    if bundle and ASSET_MAP.exists():
+        try:
+            hashed = {BUILD_DIR / url.lstrip("/")
+                      for url in json.loads(ASSET_MAP.read_text()).get("assets", {})}
+        except ValueError:
+            pass
+    images = [size for path, size in scan_files(deployed).items()
+              if Path(path).suffix.lower() in ASSET_SUFFIXES
+              and Path(path) not in hashed]
+    weights["images"] = sum(images)
+    weights["largest_image"] = max(images, default=0)
+    if bundle:
+        for kind in ("js", "css"):
+            weights[f"bundle_{kind}"] = sum(gzip_size(path.read_bytes())
+                                            for path in bundle
+                                            if path.suffix == f".{kind}")
+    return weights
+
+
+@timed()
+def measure_weights(registry: Registry) -> dict:
+    """{"site": weights, "writeups": {slug: weights}}, weights being bytes per
+    metric."""
+    bundle = bundle_assets()
+    images = load_image_manifest()
+    writeups = {post["slug"]: writeup_weights(post, images, bundle)
+                for post in registry.writeups
+                if post.get("slug") and post.get("componentPath")}
+    return {"site": site_weights(bundle), "writeups": writeups}
+
+
+def load_report_baseline(path: Path = REPORT_BASELINE) -> dict:
+    """The stored budgets and measurements; default budgets and no
+    measurements if the file does not exist yet."""
+    baseline = {"budgets": DEFAULT_BUDGETS, "site": {}, "writeups": {}}
+    if path.exists():
+        try:
+            baseline.update(json.loads(path.read_text()))
+        except ValueError as e:
+            print(f"Error: {path} is not valid JSON ({e}); using the default budgets",
+                  file=sys.stderr)
+    return baseline
+
+
+def save_report_baseline(weights: dict, budgets: dict,
+                         path: Path = REPORT_BASELINE) -> None:
+    document = {"version": REPORT_VERSION, "budgets": budgets, **weights}
+    write_page(path, json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def _delta(value: int, previous: Optional[int]) -> str:
+    if previous is None:
+        return " (new)" if value else ""
+    if value == previous:
+        return ""
+    return f" ({'+' if value > previous else '-'}{format_bytes(abs(value - previous))})"
+
+
+def compare_weights(weights: dict, baseline: dict, max_growth: Optional[float] = None
+                    ) -> List[Tuple[str, str]]:
+    """("budget" | "growth", message) for every size over its budget or, with
+    `max_growth` (percent), grown by more than that since the baseline."""
+    problems = []
+    scopes = [("site", "site", weights["site"], baseline["site"])]
+    scopes += [("writeup", slug, values, baseline["writeups"].get(slug, {}))
+               for slug, values in sorted(weights["writeups"].items())]
+    for scope, name, values, previous in scopes:
+        budgets = baseline["budgets"].get(scope, {})
+        for metric, value in values.items():
+            label = f"{name}: {REPORT_METRICS[metric]}"
+            budget = budgets.get(metric)
+            if budget is not None and value > budget:
+                change = _delta(value, previous.get(metric)) if previous else ""
+                problems.append(("budget",
+                                 f"{label} is {format_bytes(value)}, over its "
+                                 f"{format_bytes(budget)} budget{change}"))
+            old = previous.get(metric)
+            if max_growth is not None and old and value > old * (1 + max_growth / 100):
+                problems.append(("growth",
+                                 f"{label} grew {(value / old - 1) * 100:.0f}% "
+                                 f"({format_bytes(old)} -> {format_bytes(value)})"))
+    return problems
+
+
+def format_weights(weights: dict, baseline: dict) -> str:
+    """A table of every writeup and the site total, with the change since the
+    baseline."""
+    metrics = [m for m in REPORT_METRICS if m in weights["site"]
+               or any(m in values for values in weights["writeups"].values())]
+    rows = [("writeup", *(REPORT_METRICS[m] for m in metrics))]
+    scopes = [(slug, values, baseline["writeups"].get(slug, {}))
+              for slug, values in sorted(weights["writeups"].items())]
+    scopes.append(("(site)", weights["site"], baseline["site"]))
+    for name, values, previous in scopes:
+        cells = []
+        for m in metrics:
+            if m not in values:
+                cells.append("-")
+                continue
+            change = _delta(values[m], previous.get(m)) if previous else ""
+            cells.append(f"{format_bytes(values[m])}{change}")
+        rows.append((name, *cells))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                       for i, (cell, width) in enumerate(zip(row, widths)))
+             for row in rows]
+    return "\n".join(line.rstrip() for line in lines)
+
+
+# ---- Subcommands ----
+
+def cmd_build(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py build",
+        description="Regenerate the page card arrays and WriteupDetail routes "
+                    f"from {REGISTRY_PATH}",
+    )
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH}); "
+                             "imported from the pages if missing")
+    parser.add_argument("--check", action="store_true",
+                        help="Only report generated files that are out of date; "
+                             "exit 1 if any are")
+    parser.add_argument("--force", action="store_true",
+                        help=f"Ignore {BUILD_STATE_PATH} and regenerate everything")
+    parser.add_argument("--variants", action="store_true",
+                        help="List the WebP/AVIF variants that optimize-images wrote "
+                             "in the content's srcset (deploy builds; the variants "
+                             "are not committed)")
+    args = parser.parse_args(argv)
+    configure_image_variants(args.variants)
+    if args.force and _build_state is not None:
+        _build_state.stages.clear()
+        _build_state.changed = True
+
+    registry = Registry.load(args.registry)
+    if args.check:
+        stale = [path for path, text in render_pages(registry).items()
+                 if read_page(path) != text]
+        for path in stale:
+            print(f"✗ {path} is out of date with {args.registry}")
+        print("✓ All generated pages are up to date." if not stale
+              else "Run: python htb_writeup.py build")
+        return 1 if stale else 0
+    return 0 if publish_transaction(registry) else 1
+
+
+def cmd_optimize_images(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py optimize-images",
+        description="Recompress PNGs losslessly and write WebP/AVIF thumb/full "
+                    f"variants plus {IMAGE_MANIFEST}",
+    )
+    parser.add_argument("paths", type=Path, nargs="*", metavar="PATH",
+                        help="Files or directories to optimize "
+                             f"(default: {IMAGES_ROOT})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--quality", type=int, default=DEFAULT_IMAGE_QUALITY,
+                        help="WebP/AVIF quality, 1-100 "
+                             f"(default: {DEFAULT_IMAGE_QUALITY})")
+    parser.add_argument("--no-avif", action="store_true", help="Skip AVIF variants")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess images even if their hash is unchanged")
+    args = parser.parse_args(argv)
+
+    ok = optimize_images(args.paths or None, args.workers, args.quality,
+                         avif=not args.no_avif, force=args.force)
+    return 0 if ok else 1
+
+
+def cmd_regen_previews(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py regen-previews",
+        description="Render every public/<slug>-walkthrough.html link preview, "
+                    f"{HEADERS_FILE} and {REDIRECTS_FILE} from {REGISTRY_PATH}",
+    )
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Previews rendered in parallel "
+                             f"(default: {DEFAULT_WORKERS})")
+    args = parser.parse_args(argv)
+
+    registry = Registry.load(args.registry)
+    try:
+        with transaction():
+            changed = write_previews(registry, args.workers)
+    except OSError as e:
+        print(f"Error regenerating previews: {e}", file=sys.stderr)
+        return 1
+    for file_path in changed:
+        print(f"✓ Regenerated {file_path}")
+    print(f"✓ {len(changed)} file(s) changed, "
+          f"{len(registry.writeups)} preview(s) checked")
+    return 0
+
+
+def cmd_add_images(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py add-images",
+        description="Import a folder of screenshots as "
+                    "public/images/writeups/<machine>/N.png and print their markdown",
+    )
+    parser.add_argument("machine", help="Machine name (e.g. Editor)")
+    parser.add_argument("source_dir", type=Path, metavar="DIR",
+                        help="Folder of raw captures")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    parser.add_argument("--similar", type=int, default=0, metavar="BITS",
+                        help="Also skip captures whose difference hash is within "
+                             "BITS of a kept image (default: 0, exact pixel matches "
+                             "only)")
+    args = parser.parse_args(argv)
+
+    try:
+        with transaction() as txn:
+            lines = add_images(args.machine, args.source_dir, args.workers,
+                               max(0, args.similar))
+            if lines is None:
+                txn.abort()
+                return 1
+    except OSError as e:
+        print(f"Error: writing files failed; all changes were rolled back: {e}",
+              file=sys.stderr)
+        return 1
+    if lines:
+        print("\nMarkdown:\n" + "\n\n".join(lines))
+    return 0
+
+
+def load_check_baseline(path: Path = CHECK_BASELINE) -> set:
+    """The accepted (kind, message) problems; none if the file does not exist."""
+    if not path.exists():
+        return set()
+    try:
+        problems = json.loads(path.read_text()).get("problems", [])
+        return {tuple(problem) for problem in problems}
+    except ValueError as e:
+        print(f"Error: {path} is not valid JSON ({e}); ignoring it", file=sys.stderr)
+        return set()
+
+
+def save_check_baseline(problems: List[Tuple[str, str]],
+                        path: Path = CHECK_BASELINE) -> None:
+    """One problem per line, so accepting or fixing one is a one-line diff."""
+    lines = ",\n".join(f"    {json.dumps(list(problem), ensure_ascii=False)}"
+                       for problem in sorted(set(problems)))
+    write_page(path, f'{{\n  "version": {CHECK_BASELINE_VERSION},\n'
+                     f'  "problems": [\n{lines}\n  ]\n}}\n')
+
+
+def cmd_check(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py check",
+        description="Cross-check the registry, card pages, routes, components and "
+                    "images; exit 1 on any problem",
+    )
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH})")
+    parser.add_argument("--max-image-kb", type=int, default=DEFAULT_MAX_IMAGE_KB,
+                        metavar="KB",
+                        help="Report referenced images larger than this "
+                             f"(default: {DEFAULT_MAX_IMAGE_KB})")
+    parser.add_argument("--baseline", type=Path, default=CHECK_BASELINE, metavar="FILE",
+                        help="Accepted problems, which do not fail the check "
+                             f"(default: {CHECK_BASELINE})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Accept every current problem")
+    args = parser.parse_args(argv)
+
+    registry = Registry.load(args.registry)
+    problems = check_site(registry, args.max_image_kb * 1024)
+    if args.update_baseline:
+        save_check_baseline(problems, args.baseline)
+        print(f"✓ Stored {len(problems)} accepted problem(s) in {args.baseline}")
+    if args.update_baseline:
+        accepted = set(problems)
+    else:
+        accepted = load_check_baseline(args.baseline)
+    for kind in CHECK_KINDS:
+        for _, message in sorted(p for p in problems if p[0] == kind):
+            print(f"{'•' if (kind, message) in accepted else '✗'} [{kind}] {message}")
+    fixed = len(accepted - set(problems))
+    if fixed:
+        print(f"✓ {fixed} problem(s) in {args.baseline} no longer occur; "
+              "run `check --update-baseline` to drop them")
+    new = [problem for problem in problems if problem not in accepted]
+    if new:
+        known = len(problems) - len(new)
+        print(f"✗ {len(new)} problem(s) in {len(registry.posts)} post(s)"
+              + (f", {known} more in {args.baseline}" if known else ""))
+        return 1
+    if problems:
+        print(f"✓ {len(registry.posts)} post(s) checked; "
+              f"{len(problems)} known problem(s), "
+              f"all in {args.baseline}")
+        return 0
+    print(f"✓ {len(registry.posts)} post(s) consistent across pages, routes, "
+          "components and images")
+    return 0
+
+
+def cmd_watch(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py watch",
+        description="Regenerate a writeup's images, card fields, preview, content "
+                    "and the search index whenever its sources change",
+    )
+    parser.add_argument("--poll", action="store_true",
+                        help="Poll for changes instead of using inotify")
+    parser.add_argument("--debounce", type=int, default=DEFAULT_DEBOUNCE_MS,
+                        metavar="MS",
+                        help="Quiet period that ends a burst of changes "
+                             f"(default: {DEFAULT_DEBOUNCE_MS})")
+    parser.add_argument("--avif", action="store_true",
+                        help="Also write AVIF variants (slow; optimize-images "
+                             "writes them otherwise)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for image optimization "
+                             "(default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    watch(args.poll, max(0, args.debounce) / 1000, args.avif, args.workers)
+    return 0
+
+
+def cmd_prerender(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py prerender",
+        description=f"Render each writeup into a static page under {BUILD_DIR}/ "
+                    f"from {BUILD_SHELL}",
+    )
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    registry = Registry.load(args.registry)
+    if not page_exists(BUILD_SHELL):
+        print(f"Error: {BUILD_SHELL} not found; run `npm run build` first",
+              file=sys.stderr)
+        return 1
+    try:
+        with transaction():
+            write_content(registry)
+            changed = write_snapshots(registry, args.workers)
+            hash_build_assets()
+    except OSError as e:
+        print(f"Error prerendering: {e}", file=sys.stderr)
+        return 1
+    for file_path in changed:
+        print(f"✓ Prerendered {file_path}")
+    print(f"✓ {len(changed)} snapshot(s) changed, "
+          f"{len(registry.writeups)} writeup(s) checked")
+    return 0
+
+
+def cmd_sync(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py sync",
+        description="Refresh the HTB profile of every known machine in the "
+                    "machine store",
+    )
+    parser.add_argument("machines", nargs="*", metavar="MACHINE",
+                        help="Also fetch these machines "
+                             "(e.g. before creating their writeups)")
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH})")
+    parser.add_argument("--machine-db", type=Path, default=DEFAULT_MACHINE_DB,
+                        metavar="FILE",
+                        help="SQLite store of HTB machine profiles "
+                             f"(default: {DEFAULT_MACHINE_DB})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent requests (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--rate", type=float, default=DEFAULT_SYNC_RATE, metavar="N",
+                        help="At most N requests per second "
+                             f"(default: {DEFAULT_SYNC_RATE:g})")
+    args = parser.parse_args(argv)
+
+    token = os.getenv("HTB_TOKEN")
+    if not token:
+        print("Error: HTB_TOKEN environment variable is not set.", file=sys.stderr)
+        return 1
+    configure_http(pool_size=max(1, args.workers))
+    configure_machine_store(args.machine_db)
+    ok = sync_machines(Registry.load(args.registry), args.machines, token,
+                       args.workers, args.rate)
+    return 0 if ok else 1
+
+
+def cmd_report(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="htb_writeup.py report",
+        description="Report the JS, CSS, content and image bytes of every writeup "
+                    f"and of the site, diffed against {REPORT_BASELINE}; exit 1 "
+                    "when a budget is exceeded",
+    )
+    parser.add_argument("--registry", type=Path, default=REGISTRY_PATH, metavar="FILE",
+                        help=f"Registry file (default: {REGISTRY_PATH})")
+    parser.add_argument("--baseline", type=Path, default=REPORT_BASELINE,
+                        metavar="FILE",
+                        help=f"Budgets and baseline sizes (default: {REPORT_BASELINE})")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store these sizes as the new baseline (budgets are kept)")
+    parser.add_argument("--max-growth", type=float, default=None, metavar="PCT",
+                        help="Also fail when a size grew by more than PCT%% since "
+                             "the baseline")
+    parser.add_argument("--json", type=Path, metavar="FILE",
+                        help="Also write the sizes as JSON (\"-\" for stdout)")
+    args = parser.parse_args(argv)
+
+    registry = Registry.load(args.registry)
+    baseline = load_report_baseline(args.baseline)
+    weights = measure_weights(registry)
+    print(format_weights(weights, baseline))
+    if not weights["site"].get("bundle_js"):
+        print("  (no bundle columns: run `npm run build` to measure "
+              f"{BUILD_DIR}/static/)")
+    if args.json:
+        text = json.dumps(weights, indent=2, sort_keys=True)
+        if str(args.json) == "-":
+            print(text)
+        else:
+            args.json.write_text(text + "\n")
+
+    max_growth = None if args.update_baseline else args.max_growth
+    problems = compare_weights(weights, baseline, max_growth)
+    for kind, message in problems:
+        print(f"✗ [{kind}] {message}")
+    if args.update_baseline:
+        save_report_baseline(weights, baseline["budgets"], args.baseline)
+        print(f"✓ Stored the sizes of {len(weights['writeups'])} writeup(s) "
+              f"in {args.baseline}")
+    if problems:
+        if all(k == "budget" for k, _ in problems):
+            print(f"✗ {len(problems)} size(s) over budget")
+        else:
+            print(f"✗ {len(problems)} size(s) over budget or grown past --max-growth")
+        return 1
+    print(f"✓ {len(weights['writeups'])} writeup(s) and the site within budget")
+    return 0
+
+
+COMMANDS = {
+    "build": cmd_build,
+    "regen-previews": cmd_regen_previews,
+    "optimize-images": cmd_optimize_images,
+    "watch": cmd_watch,
+    "check": cmd_check,
+    "add-images": cmd_add_images,
+    "prerender": cmd_prerender,
+    "sync": cmd_sync,
+    "report": cmd_report,
+}
+
+
+def parse_instrumentation_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """Pull the global --timings/--timings-json/--profile options out of argv,
+    so they work with every subcommand."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--timings", action="store_true")
+    parser.add_argument("--timings-json", metavar="FILE")
+    parser.add_argument("--profile", action="store_true")
+    return parser.parse_known_args(argv)
+
+
+@contextmanager
+def instrumented(options: argparse.Namespace):
+    """Capture cProfile/tracemalloc data if asked and emit the timings report
+    when the run ends, however it ends."""
+    profiler = None
+    if options.profile:
+        import cProfile
+        import tracemalloc
+        tracemalloc.start(10)
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            import pstats
+            import tracemalloc
+            profiler.disable()
+            stats = pstats.Stats(profiler)
+            top = sorted(stats.stats.items(),
+                         key=lambda item: -item[1][3])[:PROFILE_TOP]
+            _metrics.profile = [
+                {"function": f"{Path(file).name}:{line}({func})", "calls": ncalls,
+                 "tottime": round(tottime, 6), "cumtime": round(cumtime, 6)}
+                for (file, line, func), (_, ncalls, tottime, cumtime, _) in top
+            ]
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            _metrics.memory = {
+                "current": current,
+                "peak": peak,
+                "top": [{"where": str(stat.traceback[0]), "bytes": stat.size}
+                        for stat in snapshot.statistics("lineno")[:PROFILE_TOP // 2]],
+            }
+        if options.timings or (options.profile and not options.timings_json):
+            print("\n" + _metrics.report())
+        if options.timings_json:
+            text = json.dumps(_metrics.to_dict(), indent=2) + "\n"
+            if options.timings_json == "-":
+                sys.stdout.write(text)
+            else:
+                Path(options.timings_json).write_text(text)
+
+
 def main():
+    options, argv = parse_instrumentation_args(sys.argv[1:])
+    sys.argv = sys.argv[:1] + argv
+    configure_build_state()
+    with instrumented(options):
+        try:
+            run()
+        finally:
+            save_build_state()
+
+
+def run():
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(COMMANDS[sys.argv[1]](sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="Download HTB machine image + create/remove writeup (unified)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__,
     )
     parser.add_argument("--remove", type=str, metavar="MACHINE", help="Remove writeup for machine")
+    parser.add_argument("--manifest", type=Path, metavar="FILE",
+                        help="Create/remove many writeups from a JSON or YAML manifest")
     parser.add_argument("machine_name", type=str, nargs="?", help="Machine name (for create)")
     parser.add_argument("--title", type=str, help="Writeup title (e.g. 'Active Walkthrough')")
     parser.add_argument("--description", type=str, help="Description/excerpt")
     parser.add_argument("--tags", type=str, help="Comma-separated tags")
-    parser.add_argument("--difficulty", type=str, choices=["Easy", "Medium", "Hard", "Insane"])
-    parser.add_argument("--os", type=str, choices=["Linux", "Windows"])
-    parser.add_argument("--ip", type=str, help="Machine IP")
+    parser.add_argument("--difficulty", type=str, choices=DIFFICULTIES,
+                        help="Default: from the machine store / HTB profile")
+    parser.add_argument("--os", type=str, choices=OS_NAMES,
+                        help="Default: from the machine store / HTB profile")
+    parser.add_argument("--ip", type=str,
+                        help="Machine IP (default: from the machine store / HTB "
+                             "profile)")
+    parser.add_argument("--date", type=str,
+                        help="Writeup date, e.g. 'Mar 16, 2026' (default: today)")
+    parser.add_argument("--template", choices=TEMPLATE_VARIANTS,
+                        help="Template variant (default: sherlock/challenge if tagged "
+                             "so, else windows-ad for Windows, linux otherwise)")
+    parser.add_argument("--connect-timeout", type=float,
+                        default=DEFAULT_CONNECT_TIMEOUT, metavar="SECS",
+                        help="HTTP connect timeout "
+                             f"(default: {DEFAULT_CONNECT_TIMEOUT})")
+    parser.add_argument("--read-timeout", type=float, default=DEFAULT_READ_TIMEOUT,
+                        metavar="SECS",
+                        help=f"HTTP read timeout (default: {DEFAULT_READ_TIMEOUT})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="Retries on connection errors and 429/5xx "
+                             f"(default: {DEFAULT_RETRIES})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Parallel downloads in batch mode "
+                             f"(default: {DEFAULT_WORKERS})")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                        metavar="DIR",
+                        help="HTTP cache for HTB profiles and avatars "
+                             f"(default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable the HTTP cache")
+    parser.add_argument("--offline", action="store_true",
+                        help="Serve HTB profiles and avatars from the cache only "
+                             "(no network)")
+    parser.add_argument("--cache-max-age", type=float,
+                        default=DEFAULT_CACHE_MAX_AGE_DAYS, metavar="DAYS",
+                        help="Evict cache entries unused for this long "
+                             f"(default: {DEFAULT_CACHE_MAX_AGE_DAYS})")
+    parser.add_argument("--cache-max-size", type=float, default=DEFAULT_CACHE_MAX_MB,
+                        metavar="MB",
+                        help="Evict least-recently-used entries above this size "
+                             f"(default: {DEFAULT_CACHE_MAX_MB})")
+    parser.add_argument("--machine-db", type=Path, default=DEFAULT_MACHINE_DB,
+                        metavar="FILE",
+                        help="SQLite store of HTB machine profiles "
+                             f"(default: {DEFAULT_MACHINE_DB})")
     args = parser.parse_args()
 
+    if args.offline and args.no_cache:
+        parser.error("--offline needs the cache; drop --no-cache")
+    configure_http(args.connect_timeout, args.read_timeout, args.retries,
+                   pool_size=max(1, args.workers))
+    cache = configure_cache(None if args.no_cache else args.cache_dir, args.offline,
+                            args.cache_max_age, args.cache_max_size)
+    if cache is not None:
+        cache.evict()
+    configure_machine_store(args.machine_db)
+
+    if args.manifest:
+        sys.exit(0 if run_manifest(args.manifest, args.workers) else 1)
+
     if args.remove:
-        sys.exit(0 if remove_writeup(args.remove) else 1)
+        registry = Registry.load()
+        try:
+            with transaction() as txn:
+                removed = remove_writeup(args.remove, registry)
+                published = publish(registry)
+                if not published:
+                    txn.abort()
+        except OSError as e:
+            print(f"Error: writing files failed; all changes were rolled back: {e}",
+                  file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0 if published and removed else 1)
 
     if not args.machine_name:
         parser.error("machine_name required for create")
-    for attr in ("title", "description", "tags", "difficulty", "os", "ip"):
+    fields = vars(args)
+    tags = [t.strip() for t in (args.tags or "").split(",") if t.strip()]
+    if is_machine_variant(choose_variant({**fields, "tags": tags})):
+        for attr in fill_machine_fields(args.machine_name, fields):
+            print(f"✓ --{attr} {fields[attr]} (from the HTB profile)")
+    variant = choose_variant({**fields, "tags": tags})
+    for attr in required_fields(variant):
         if not getattr(args, attr, None):
             parser.error(f"--{attr} required for create")
 
-    current_date = get_current_date()
-    tags = [t.strip() for t in args.tags.split(",")]
+    current_date = args.date or get_current_date()
     machine_name_lower = args.machine_name.lower()
     link = f"/writeups/{machine_name_lower}-walkthrough"
 
-    print(f"\n{'='*60}\nCreating writeup: {args.machine_name}\n{'='*60}\n")
-
-    print("Step 1: Downloading machine image...")
-    success, image_path = download_machine_image(args.machine_name)
-    if not success:
-        sys.exit(1)
-
-    print("\nStep 2: Creating writeup component...")
-    if not create_writeup_component(
-        args.machine_name, args.title, args.description, tags,
-        args.difficulty, args.os, args.ip, current_date, image_path,
-    ):
+    registry = Registry.load()
+    try:
+        with transaction() as txn:
+            ok = create_writeup(
+                args.machine_name, args.title, args.description, tags,
+                args.difficulty, args.os, args.ip, current_date, registry,
+                variant=variant,
+            )
+            if ok:
+                print("\nStep 4: Regenerating pages...")
+                ok = publish(registry)
+            if not ok:
+                txn.abort()
+                print("✗ Nothing was written.", file=sys.stderr)
+    except OSError as e:
+        print(f"Error: writing files failed; all changes were rolled back: {e}",
+              file=sys.stderr)
         sys.exit(1)
-
-    print("\nStep 3: Adding route...")
-    if not add_route_to_writeup_detail(args.machine_name):
+    if not ok:
         sys.exit(1)
 
-    print("\nStep 4: Adding cards...")
-    add_card_to_home(args.machine_name, args.title, args.description, tags, image_path, link, args.os, current_date)
-    add_card_to_writeups(args.machine_name, args.title, args.description, tags, image_path, link, args.difficulty, args.os, current_date)
-    add_card_to_tags(args.machine_name, args.title, tags)
-    add_card_to_tag_detail(args.machine_name, args.title, args.description, tags, image_path, link, current_date, args.os)
-
     print(f"\n{'='*60}\n✓ Writeup creation completed.\n{'='*60}")
-    print(f"Edit: src/pages/writeups/{machine_name_lower}/{args.machine_name.capitalize()}Walkthrough.js")
+    component_name = f"{args.machine_name.capitalize()}Walkthrough"
+    print(f"Edit: src/pages/writeups/{machine_name_lower}/{component_name}.md")
     print(f"Images: public/images/writeups/{machine_name_lower}/")
     print(f"URL: http://localhost:3000{link}")
 
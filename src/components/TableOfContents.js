@@ -1,64 +1,23 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { FaBookOpen, FaChevronLeft, FaChevronRight } from 'react-icons/fa';
 import './TableOfContents.css';
 
-const TableOfContents = ({ content, title }) => {
-  const [headings, setHeadings] = useState([]);
+/**
+ * Table of contents for a walkthrough. `headings` is the precomputed TOC of
+ * its content ({ id, text, level }, see src/utils/writeupContent.js); the
+ * heading elements already carry those ids.
+ */
+const TableOfContents = ({ headings: contentHeadings = [], title }) => {
   const [activeSection, setActiveSection] = useState('');
   const [collapsed, setCollapsed] = useState(true);
 
-  useEffect(() => {
-    // Extract headings from content
-    const lines = content.split('\n');
-    const extractedHeadings = [];
-    
-    lines.forEach((line, index) => {
-      if (line.startsWith('# ')) {
-        extractedHeadings.push({
-          id: `heading-${index}`,
-          text: line.substring(2),
-          level: 1,
-          lineIndex: index
-        });
-      } else if (line.startsWith('## ')) {
-        extractedHeadings.push({
-          id: `heading-${index}`,
-          text: line.substring(3),
-          level: 2,
-          lineIndex: index
-        });
-      } else if (line.startsWith('### ')) {
-        extractedHeadings.push({
-          id: `heading-${index}`,
-          text: line.substring(4),
-          level: 3,
-          lineIndex: index
-        });
-      }
-    });
-
-    // Prepend writeup title as first TOC item (links to id="writeup-title" in header)
-    const withTitle = title
-      ? [{ id: 'writeup-title', text: title, level: 1 }, ...extractedHeadings]
-      : extractedHeadings;
-    
-    setHeadings(withTitle);
-  }, [content, title]);
-
-  useEffect(() => {
-    // Add IDs to headings in the content (title is outside .markdown-content, so offset by 1 when title exists)
-    const contentElement = document.querySelector('.markdown-content');
-    if (contentElement) {
-      const headingElements = contentElement.querySelectorAll('h1, h2, h3');
-      const offset = title ? 1 : 0;
-      headingElements.forEach((heading, index) => {
-        if (headings[index + offset]) {
-          heading.id = headings[index + offset].id;
-        }
-      });
-    }
-  }, [headings, title]);
+  // Prepend writeup title as first TOC item (links to id="writeup-title" in header)
+  const headings = useMemo(() => (
+    title
+      ? [{ id: 'writeup-title', text: title, level: 1 }, ...contentHeadings]
+      : contentHeadings
+  ), [contentHeadings, title]);
 
   useEffect(() => {
     const handleScroll = () => {
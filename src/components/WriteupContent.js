@@ -0,0 +1,54 @@
+import React, { useState } from 'react';
+import { FaCopy, FaCheck } from 'react-icons/fa';
+import { renderBlocks } from '../utils/markdownRenderer';
+
+// CodeBlock component for terminal-like code blocks
+const WalkthroughCodeBlock = ({ language, children }) => {
+  const [copied, setCopied] = useState(false);
+
+  const handleCopy = async () => {
+    try {
+      await navigator.clipboard.writeText(children);
+      setCopied(true);
+      setTimeout(() => setCopied(false), 2000);
+    } catch (err) {
+      console.error('Failed to copy text: ', err);
+    }
+  };
+
+  const displayLanguage = language === 'bash' ? 'Shell' : language;
+  const showPrompt = language === 'bash' || language === 'shell';
+
+  return (
+    <div className="code-block-container">
+      <div className="code-block-header">
+        <span className="code-block-language">{displayLanguage || 'Terminal'}</span>
+        <button
+          className={`copy-button ${copied ? 'copied' : ''}`}
+          onClick={handleCopy}
+          title={copied ? 'Copied!' : 'Copy to clipboard'}
+        >
+          {copied ? <FaCheck /> : <FaCopy />}
+        </button>
+      </div>
+      <pre>
+        <code className={`terminal-code ${language ? `language-${language}` : ''}`}>
+          {showPrompt && <span className="terminal-prompt">$ </span>}
+          {children}
+        </code>
+      </pre>
+    </div>
+  );
+};
+
+/**
+ * The body of a walkthrough, rendered from its pre-tokenized blocks
+ * (see src/utils/writeupContent.js)
+ */
+const WriteupContent = ({ blocks }) => (
+  <div className="markdown-content">
+    {renderBlocks(blocks, WalkthroughCodeBlock)}
+  </div>
+);
+
+export default WriteupContent;
@@ -1,18 +1,16 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useMemo } from 'react';
 import { motion } from 'framer-motion';
 import { FaClock, FaSearch } from 'react-icons/fa';
 import Card from '../components/Card';
 import SEO from '../components/SEO';
+import { useSearch } from '../utils/searchIndex';
 import './Home.css';
 
 const Home = () => {
   const [searchTerm, setSearchTerm] = useState('');
-  const [filteredPosts, setFilteredPosts] = useState([]);
 
   // Recent posts data
   const recentPosts = useMemo(() => [
-    
-    
     {
       id: 17,
       title: 'Principal Walkthrough',
@@ -23,7 +21,8 @@ const Home = () => {
       image: '/images/writeups/principal/machine.png',
       link: '/writeups/principal-walkthrough',
       os: 'Linux'
-    },{
+    },
+    {
       id: 16,
       title: 'Expressway Walkthrough',
       excerpt: 'Expressway is an easy-difficulty Linux machine that demonstrates enumeration and exploits the IKE service, a component of the IPsec framework. Upon leaking the Pre-Shared key of the service and cracking it, the retrieved clear-text credentials are used to access the target via SSH. For privilege escalation, CVE-2025-32462 is exploited to get a privileged shell as the root user.',
@@ -33,7 +32,8 @@ const Home = () => {
       image: '/images/writeups/expressway/machine.png',
       link: '/writeups/expressway-walkthrough',
       os: 'Linux'
-    },{
+    },
+    {
       id: 15,
       title: 'Umz Walkthrough',
       excerpt: 'Umz is an easy Hack My VM machine featuring a DDoS-triggered backend, OS command injection via a ping form, sudo md5sum, rainbow table recovery, and SUID dd for root.',
@@ -111,26 +111,26 @@ const Home = () => {
       os: 'Windows'
     },
     {
-    id: 7,
-    title: 'Wcorp Walkthrough',
-    excerpt: 'A challenging Windows Active Directory environment featuring SMB enumeration, AS-REP roasting, Kerberoasting, and DCSync techniques. This writeup covers advanced lateral movement and privilege escalation methods.',
-    date: 'Sep 05, 2025',
-    category: 'writeup',
-    tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking'],
-    image: '/images/writeups/wcorp/machine.png',
-    link: '/writeups/wcorp-walkthrough',
-    os: 'Windows'
+      id: 7,
+      title: 'Wcorp Walkthrough',
+      excerpt: 'A challenging Windows Active Directory environment featuring SMB enumeration, AS-REP roasting, Kerberoasting, and DCSync techniques. This writeup covers advanced lateral movement and privilege escalation methods.',
+      date: 'Sep 05, 2025',
+      category: 'writeup',
+      tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking'],
+      image: '/images/writeups/wcorp/machine.png',
+      link: '/writeups/wcorp-walkthrough',
+      os: 'Windows'
     },
     {
-    id: 2,
-    title: 'DC02 Walkthrough',
-    excerpt: 'This Windows Domain Controller (DC01) in the SOUPEDECODE.LOCAL domain was discovered via internal network scanning. Enumeration revealed multiple Active Directory services and valid SMB credentials (charlie:charlie). AS-REP roasting against zximena448 yielded the password internet, granting Backup Operators group privileges.',
-    date: 'Aug 20, 2025',
-    category: 'writeup',
-    tags: ["hmv", "windows", "ad", "asreproast", "dcsync", "backup-operators", "password-cracking", "smb", "ldap"],
-    image: '/images/writeups/dc02/machine.png',
-    link: '/writeups/dc02-walkthrough',
-    os: 'Windows'
+      id: 2,
+      title: 'DC02 Walkthrough',
+      excerpt: 'This Windows Domain Controller (DC01) in the SOUPEDECODE.LOCAL domain was discovered via internal network scanning. Enumeration revealed multiple Active Directory services and valid SMB credentials (charlie:charlie). AS-REP roasting against zximena448 yielded the password internet, granting Backup Operators group privileges.',
+      date: 'Aug 20, 2025',
+      category: 'writeup',
+      tags: ['hmv', 'windows', 'ad', 'asreproast', 'dcsync', 'backup-operators', 'password-cracking', 'smb', 'ldap'],
+      image: '/images/writeups/dc02/machine.png',
+      link: '/writeups/dc02-walkthrough',
+      os: 'Windows'
     },
     {
       id: 6,
@@ -155,15 +155,15 @@ const Home = () => {
       github: 'https://github.com/EndlssNightmare/MullvScript'
     },
     {
-    id: 4,
-    title: 'Digispark Scripts',
-    excerpt: 'Collection of Arduino Digispark payloads and scripts for penetration testing and security research. Includes various USB attack vectors and automation scripts for ethical hacking assessments.',
-    date: 'Feb 03, 2025',
-    category: 'project',
-    tags: ['arduino', 'usb', 'pentesting'],
-    image: '/images/projects/digispark_scripts.png',
-    link: 'https://github.com/EndlssNightmare/Digispark-scripts',
-    github: 'https://github.com/EndlssNightmare/Digispark-scripts'
+      id: 4,
+      title: 'Digispark Scripts',
+      excerpt: 'Collection of Arduino Digispark payloads and scripts for penetration testing and security research. Includes various USB attack vectors and automation scripts for ethical hacking assessments.',
+      date: 'Feb 03, 2025',
+      category: 'project',
+      tags: ['arduino', 'usb', 'pentesting'],
+      image: '/images/projects/digispark_scripts.png',
+      link: 'https://github.com/EndlssNightmare/Digispark-scripts',
+      github: 'https://github.com/EndlssNightmare/Digispark-scripts'
     },
     {
       id: 1,
@@ -175,22 +175,10 @@ const Home = () => {
       image: '/images/projects/Knock-Tool.png',
       link: 'https://github.com/EndlssNightmare/Knock-Tool',
       github: 'https://github.com/EndlssNightmare/Knock-Tool'
-      }], []);
+    }
+  ], []);
 
-  useEffect(() => {
-    const filtered = recentPosts.filter(post => {
-      const matchesSearch = post.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                           post.excerpt.toLowerCase().includes(searchTerm.toLowerCase());
-      return matchesSearch;
-    });
-    
-    // Remove duplicates based on ID
-    const uniqueFiltered = filtered.filter((post, index, self) => 
-      index === self.findIndex(p => p.id === post.id)
-    );
-    
-    setFilteredPosts(uniqueFiltered);
-  }, [searchTerm, recentPosts]);
+  const filteredPosts = useSearch(recentPosts, searchTerm);
 
   const containerVariants = {
     hidden: { opacity: 0 },
@@ -1,12 +1,12 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useMemo } from 'react';
 import { motion } from 'framer-motion';
 import { FaCode, FaSearch } from 'react-icons/fa';
 import Card from '../components/Card';
+import { useSearch } from '../utils/searchIndex';
 import './Projects.css';
 
 const Projects = () => {
   const [searchTerm, setSearchTerm] = useState('');
-  const [filteredProjects, setFilteredProjects] = useState([]);
 
   const projects = useMemo(() => [
     {
@@ -59,20 +59,7 @@ const Projects = () => {
     }
   ], []);
 
-  useEffect(() => {
-    const filtered = projects.filter(project => {
-      const matchesSearch = project.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                           project.excerpt.toLowerCase().includes(searchTerm.toLowerCase());
-      return matchesSearch;
-    });
-    
-    // Remove duplicates based on ID
-    const uniqueFiltered = filtered.filter((project, index, self) => 
-      index === self.findIndex(p => p.id === project.id)
-    );
-    
-    setFilteredProjects(uniqueFiltered);
-  }, [searchTerm, projects]);
+  const filteredProjects = useSearch(projects, searchTerm);
 
   const containerVariants = {
     hidden: { opacity: 0 },
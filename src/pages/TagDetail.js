@@ -1,188 +1,16 @@
-import React, { useState, useEffect } from 'react';
+import React from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { FaArrowLeft, FaFileAlt, FaCode } from 'react-icons/fa';
 import Card from '../components/Card';
+import { useTagShard } from '../utils/tagShards';
 import './TagDetail.css';
 
 const TagDetail = () => {
   const { tag } = useParams();
-  const [isLoading, setIsLoading] = useState(true);
 
-  // All available posts data
-  const allPosts = [
-    
-    
-    
-    {
-      id: 17,
-      title: 'Principal Walkthrough',
-      excerpt: 'Principal is a medium difficulty machine that is themed around misplaced cryptographic trust. The foothold exploits CVE-2026-29000, an authentication bypass in pac4j-jwts JwtAuthenticator where a PlainJWT wrapped inside a valid JWE envelope bypasses signature verification entirely. After forging an admin token and extracting SSH credentials from the corporate dashboard, privilege escalation abuses an SSH CA configuration that trusts any certificate signed by the CA without validating the principal (username) claim, allowing us to forge a certificate for root. Both attack stages exploit the same class of flaw: a system that verifies the cryptographic envelope but never validates the identity claim inside it.',
-      date: 'Mar 16, 2026',
-      tags: ['htb', 'linux', 'jwt', 'pac4j', 'ca'],
-      image: '/images/writeups/principal/machine.png',
-      link: '/writeups/principal-walkthrough',
-      category: 'writeup',
-      os: 'Linux'
-    },{
-      id: 16,
-      title: 'Expressway Walkthrough',
-      excerpt: 'Expressway is an easy-difficulty Linux machine that demonstrates enumeration and exploits the IKE service, a component of the IPsec framework. Upon leaking the Pre-Shared key of the service and cracking it, the retrieved clear-text credentials are used to access the target via SSH. For privilege escalation, CVE-2025-32462 is exploited to get a privileged shell as the root user.',
-      date: 'Mar 07, 2026',
-      tags: ['ike', 'htb', 'linux', 'ipsec', 'sudo_chwoot'],
-      image: '/images/writeups/expressway/machine.png',
-      link: '/writeups/expressway-walkthrough',
-      category: 'writeup',
-      os: 'Linux'
-    },{
-      id: 14,
-      title: 'Active Walkthrough',
-      excerpt: 'Active is an easy to medium difficulty machine, which features two very prevalent techniques to gain privileges within an Active Directory environment.',
-      date: 'Feb 15, 2026',
-      tags: ['htb', 'ad', 'gpp', 'kerberoasting', 'kerberos', 'windows', 'smb', 'password-cracking'],
-      image: '/images/writeups/active/machine.png',
-      link: '/writeups/active-walkthrough',
-      category: 'writeup',
-      os: 'Windows'
-    },
-    {
-      id: 15,
-      title: 'Umz Walkthrough',
-      excerpt: 'Umz is an easy Hack My VM machine featuring a DDoS-triggered backend, OS command injection via a ping form, sudo md5sum, rainbow table recovery, and SUID dd for root.',
-      date: 'Mar 05, 2026',
-      tags: ['hmv', 'linux', 'ddos', 'command-injection', 'sudo_md5sum', 'rainbowlist', 'dd'],
-      image: '/images/writeups/umz/machine.png',
-      link: '/writeups/umz-walkthrough',
-      category: 'writeup',
-      os: 'Linux'
-    },
-    {
-      id: 12,
-      title: 'Editor Walkthrough',
-      excerpt: 'Full Nmap reconnaissance exposed SSH, nginx and a vulnerable XWiki on Jetty. XWiki RCE gave an xwiki reverse shell, revealed plaintext DB credentials in /etc/xwiki to SSH as oliver, and a writable SUID ndsudo binary was abused via an untrusted-search-path exploit to escalate to root.',
-      date: 'Dec 06, 2025',
-      tags: ['htb', 'linux', 'xwiki', 'ndsudo'],
-      image: '/images/writeups/editor/machine.png',
-      link: '/writeups/editor-walkthrough',
-      category: 'writeup',
-      os: 'Linux'
-    },
-    {
-      id: 13,
-      title: 'TombWatcher Walkthrough',
-      excerpt: 'TombWatcher is a medium-difficulty Windows Active Directory machine that demonstrates advanced ADCS exploitation techniques. Starting with provided credentials (henry / H3nry_987TGV!), the machine showcases GMSA enumeration, Kerberoasting attacks, and ESC15 vulnerability exploitation through Certipy. The walkthrough covers tombstone object abuse, certificate template manipulation, and privilege escalation to Domain Administrator through ADCS certificate abuse.',
-      date: 'Oct 11, 2025',
-      tags: ['htb', 'ad', 'adcs', 'password-cracking', 'gmsa', 'kerberoasting', 'kerberos', 'tombstone', 'esc15'],
-      image: '/images/writeups/tombwatcher/machine.png',
-      link: '/writeups/tombwatcher-walkthrough',
-      category: 'writeup',
-      os: 'Windows'
-    },
-    {
-      id: 10,
-      title: 'Aria Walkthrough',
-      excerpt: 'Aria is a Linux machine that demonstrates file upload bypass techniques, zero-width steganography, and JSON-RPC exploitation through aria2c. The machine showcases how improper input validation and services running with elevated privileges can lead to complete system compromise.',
-      date: 'Oct 04, 2025',
-      tags: ['linux', 'hmv', 'steg', 'aria2c', 'json-rpc'],
-      image: '/images/writeups/aria/machine.png',
-      link: '/writeups/aria-walkthrough',
-      category: 'writeup'
-    },
-    {
-      id: 9,
-      title: 'Puppy Walkthrough',
-      excerpt: 'Puppy is an medium-difficulty Windows Active Directory machine built around an assumed-breach scenario where credentials for a low-privileged user are provided (levi.james / KingofAkron2025!). Initial SMB/BloodHound enumeration reveals GenericWrite on the Developers group, allowing the attacker to add the user and access the DEV share. A KeePass file harvested from DEV is cracked to recover additional credentials. A password-spraying and further enumeration lead to steph.cooper and extraction of DPAPI-protected secrets. Using steph.cooper_adm recovered credentials the box allows DCSync to dump the Administrator hash, enabling remote authentication and full domain compromise.',
-      date: 'Sep 27, 2025',
-      tags: ['htb', 'ad', 'dpapi', 'password-cracking', 'kerberos', 'smb', 'ldap', 'windows', 'dcsync'],
-      image: '/images/writeups/puppy/machine.png',
-      link: '/writeups/puppy-walkthrough',
-      category: 'writeup'
-    },
-    {
-      id: 8,
-      title: 'Fluffy Walkthrough',
-      excerpt: 'Fluffy is an easy-difficulty Windows machine designed around an assumed breach scenario, where credentials for a low-privileged user are provided. By exploiting CVE-2025-24071, the credentials of another low-privileged user can be obtained. Further enumeration reveals the existence of ACLs over the winrm_svc and ca_svc accounts. WinRM can then be used to log in to the target using the winrc_svc account. Exploitation of an Active Directory Certificate service (ESC15) using the ca_svc account is required to obtain access to the Administrator account.',
-      date: 'Sep 20, 2025',
-      tags: ['htb', 'ad', 'adcs', 'smb', 'ldap', 'windows', 'password-cracking', 'kerberoasting'],
-      image: '/images/writeups/fluffy/machine.png',
-      link: '/writeups/fluffy-walkthrough',
-      category: 'writeup'
-    },
-    {
-    id: 7,
-    title: 'Wcorp Walkthrough',
-    excerpt: 'A challenging Windows Active Directory environment featuring SMB enumeration, AS-REP roasting, Kerberoasting, and DCSync techniques. This writeup covers advanced lateral movement and privilege escalation methods.',
-    date: 'Sep 05, 2025',
-    tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking'],
-    image: '/images/writeups/wcorp/machine.png',
-    link: '/writeups/wcorp-walkthrough',
-    category: 'writeup'
-    },
-    {
-    id: 2,
-    title: 'DC02 Walkthrough',
-    excerpt: 'This Windows Domain Controller (DC01) in the SOUPEDECODE.LOCAL domain was discovered via internal network scanning. Enumeration revealed multiple Active Directory services and valid SMB credentials (charlie:charlie). AS-REP roasting against zximena448 yielded the password internet, granting Backup Operators group privileges.',
-    date: 'Aug 20, 2025',
-    tags: ["hmv", "windows", "ad", "asreproast", "dcsync", "backup-operators", "password-cracking", "smb", "ldap"],
-    image: '/images/writeups/dc02/machine.png',
-    link: '/writeups/dc02-walkthrough',
-    category: 'writeup',
-    os: 'Windows'
-    },
-    {
-    id: 1,
-    title: 'Knock-Tool',
-    excerpt: 'A network reconnaissance tool designed for port knocking techniques and stealthy network enumeration. Features advanced scanning capabilities with customizable timing and protocol support.',
-    date: 'May 05, 2024',
-    tags: ['python', 'network', 'security'],
-    image: '/images/projects/Knock-Tool.png',
-    link: 'https://github.com/EndlssNightmare/Knock-Tool',
-    category: 'project',
-    github: 'https://github.com/EndlssNightmare/Knock-Tool'
-    },
-    {
-    id: 4,
-    title: 'Digispark Scripts',
-    excerpt: 'Collection of Arduino Digispark payloads and scripts for penetration testing and security research. Includes various USB attack vectors and automation scripts for ethical hacking assessments.',
-    date: 'Feb 03, 2025',
-    tags: ['arduino', 'usb', 'pentesting'],
-    image: '/images/projects/digispark_scripts.png',
-    link: 'https://github.com/EndlssNightmare/Digispark-scripts',
-    category: 'project',
-    github: 'https://github.com/EndlssNightmare/Digispark-scripts'
-    },
-    {
-    id: 5,
-    title: 'MullvScript',
-    excerpt: 'Automated VPN configuration and management script for Mullvad VPN. Streamlines the setup process and provides enhanced privacy features for secure network connections.',
-    date: 'Feb 27, 2025',
-    tags: ['bash', 'vpn'],
-    image: '/images/projects/MullvScript.png',
-    link: 'https://github.com/EndlssNightmare/MullvScript',
-    category: 'project',
-    github: 'https://github.com/EndlssNightmare/MullvScript'
-    },
-    {
-    id: 6,
-    title: 'zsh-configs',
-    excerpt: 'Custom zsh configuration files and aliases optimized for penetration testing workflows. Includes specialized functions for common security tools and enhanced terminal productivity features.',
-    date: 'Jul 28, 2025',
-    tags: ['zsh', 'shell', 'pentesting'],
-    image: '/images/projects/zshconf.png',
-    link: 'https://github.com/EndlssNightmare/zsh-configs',
-    category: 'project',
-    github: 'https://github.com/EndlssNightmare/zsh-configs'
-    }];
-
-  // Filter posts that contain the selected tag
-  const filteredPosts = allPosts.filter(post => 
-    post.tags.some(postTag => postTag.toLowerCase() === tag.toLowerCase())
-  );
-  
-  // Remove duplicates based on ID
-  const uniqueFilteredPosts = filteredPosts.filter((post, index, self) => 
-    index === self.findIndex(p => p.id === post.id)
-  );
+  // Cards of the posts carrying the selected tag (public/tag-shards/<tag>.json)
+  const { posts: uniqueFilteredPosts, loading: isLoading } = useTagShard(tag);
 
   const tagData = {
     name: tag,
@@ -190,17 +18,6 @@ const TagDetail = () => {
     posts: uniqueFilteredPosts
   };
 
-  // Handle loading state
-  useEffect(() => {
-    setIsLoading(true);
-    // Simulate loading time to ensure smooth transitions
-    const timer = setTimeout(() => {
-      setIsLoading(false);
-    }, 100);
-    
-    return () => clearTimeout(timer);
-  }, [tag]);
-
   const containerVariants = {
     hidden: { opacity: 0 },
     visible: {
@@ -305,8 +122,8 @@ const TagDetail = () => {
         <h3>Related Tags</h3>
         <div className="related-tags-grid">
           {(() => {
-            // Get all unique tags from all posts
-            const allTags = [...new Set(allPosts.flatMap(post => post.tags))];
+            // Get all unique tags from the posts carrying this one
+            const allTags = [...new Set(uniqueFilteredPosts.flatMap(post => post.tags))];
             
             // Filter out the current tag
             const otherTags = allTags.filter(tagName => tagName.toLowerCase() !== tag.toLowerCase());
@@ -9,38 +9,38 @@ const Tags = () => {
 
   // All available posts data for counting
   const allPosts = [
-    
-    
     {
       id: 17,
       title: 'Principal Walkthrough',
       category: 'writeup',
       tags: ['htb', 'linux', 'jwt', 'pac4j', 'ca']
-    },{
+    },
+    {
       id: 16,
       title: 'Expressway Walkthrough',
       category: 'writeup',
       tags: ['ike', 'htb', 'linux', 'ipsec', 'sudo_chwoot']
-    },{
+    },
+    {
       id: 15,
       title: 'Umz Walkthrough',
-      excerpt: 'Umz is an easy Hack My VM machine featuring a DDoS-triggered backend, OS command injection via a ping form, sudo md5sum, rainbow table recovery, and SUID dd for root.',
       category: 'writeup',
       tags: ['hmv', 'linux', 'ddos', 'command-injection', 'sudo_md5sum', 'rainbowlist', 'dd']
     },
     {
-      id: 14,
+      id: 13,
       title: 'Active Walkthrough',
       category: 'writeup',
       tags: ['htb', 'ad', 'gpp', 'kerberoasting', 'kerberos', 'windows', 'smb', 'password-cracking']
-    },{
+    },
+    {
       id: 12,
       title: 'Editor Walkthrough',
       category: 'writeup',
       tags: ['htb', 'linux', 'xwiki', 'ndsudo']
     },
     {
-      id: 13,
+      id: 11,
       title: 'TombWatcher Walkthrough',
       category: 'writeup',
       tags: ['htb', 'ad', 'adcs', 'password-cracking', 'gmsa', 'kerberoasting', 'kerberos', 'tombstone', 'esc15']
@@ -64,57 +64,42 @@ const Tags = () => {
       tags: ['htb', 'ad', 'adcs', 'smb', 'ldap', 'windows', 'password-cracking', 'kerberoasting']
     },
     {
-    id: 7,
-    title: 'Wcorp Walkthrough',
-    category: 'writeup',
-    tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking']
+      id: 7,
+      title: 'Wcorp Walkthrough',
+      category: 'writeup',
+      tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking']
     },
     {
-    id: 1,
-    title: 'DC02 Walkthrough',
-    category: 'writeup',
-    tags: ['hmv', 'windows', 'ad', 'asreproast', 'dcsync', 'backup-operators', 'password-cracking', 'smb', 'ldap']
+      id: 2,
+      title: 'DC02 Walkthrough',
+      category: 'writeup',
+      tags: ['hmv', 'windows', 'ad', 'asreproast', 'dcsync', 'backup-operators', 'password-cracking', 'smb', 'ldap']
     },
     {
-    id: 1,
-    title: 'Knock-Tool',
-    excerpt: 'A network reconnaissance tool designed for port knocking techniques and stealthy network enumeration. Features advanced scanning capabilities with customizable timing and protocol support.',
-    date: 'Aug 20, 2025',
-    tags: ['python', 'network', 'security'],
-    image: '/images/projects/Knock-Tool.png',
-    link: 'https://github.com/EndlssNightmare/Knock-Tool',
-    category: 'project'
+      id: 6,
+      title: 'zsh-configs',
+      category: 'project',
+      tags: ['zsh', 'shell', 'pentesting']
     },
     {
-    id: 4,
-    title: 'Digispark Scripts',
-    excerpt: 'Collection of Arduino Digispark payloads and scripts for penetration testing and security research. Includes various USB attack vectors and automation scripts for ethical hacking assessments.',
-    date: 'Aug 5, 2025',
-    tags: ['arduino', 'usb', 'pentesting'],
-    image: '/images/projects/digispark_scripts.png',
-    link: 'https://github.com/EndlssNightmare/Digispark-scripts',
-    category: 'project'
+      id: 5,
+      title: 'MullvScript',
+      category: 'project',
+      tags: ['bash', 'vpn']
     },
     {
-    id: 5,
-    title: 'MullvScript',
-    excerpt: 'Automated VPN configuration and management script for Mullvad VPN. Streamlines the setup process and provides enhanced privacy features for secure network connections.',
-    date: 'Feb 27, 2025',
-    tags: ['bash', 'vpn'],
-    image: '/images/projects/MullvScript.png',
-    link: 'https://github.com/EndlssNightmare/MullvScript',
-    category: 'project'
+      id: 4,
+      title: 'Digispark Scripts',
+      category: 'project',
+      tags: ['arduino', 'usb', 'pentesting']
     },
     {
-    id: 6,
-    title: 'zsh-configs',
-    excerpt: 'Custom zsh configuration files and aliases optimized for penetration testing workflows. Includes specialized functions for common security tools and enhanced terminal productivity features.',
-    date: 'Jul 28, 2025',
-    tags: ['zsh', 'shell', 'pentesting'],
-    image: '/images/projects/zshconf.png',
-    link: 'https://github.com/EndlssNightmare/zsh-configs',
-    category: 'project'
-    }];
+      id: 1,
+      title: 'Knock-Tool',
+      category: 'project',
+      tags: ['python', 'network', 'security']
+    }
+  ];
 
   // Calculate actual tag counts
   const calculateTagCount = (tagName) => {
@@ -1,43 +1,29 @@
-import React from 'react';
+import React, { Suspense, lazy } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import { FaArrowLeft } from 'react-icons/fa';
 import './WriteupDetail.css';
 
-// Import specific writeup components
-import TombwatcherWalkthrough from './writeups/tombwatcher/TombwatcherWalkthrough';
-import AriaWalkthrough from './writeups/aria/AriaWalkthrough';
-import PuppyWalkthrough from './writeups/puppy/PuppyWalkthrough';
-import FluffyWalkthrough from './writeups/fluffy/FluffyWalkthrough';
-import WcorpWalkthrough from './writeups/Wcorp/WcorpWalkthrough';
-import DC02Walkthrough from './writeups/dc02/DC02Walkthrough';
-import EditorWalkthrough from './writeups/editor/EditorWalkthrough';
-import ActiveWalkthrough from './writeups/active/ActiveWalkthrough';
-import UmzWalkthrough from './writeups/umz/UmzWalkthrough';
-import ExpresswayWalkthrough from './writeups/expressway/ExpresswayWalkthrough';
-import PrincipalWalkthrough from './writeups/principal/PrincipalWalkthrough';
+// Map of available writeups. Each walkthrough is split into its own chunk
+// and only loaded when its route is visited.
+const writeupComponents = {
+  'principal-walkthrough': lazy(() => import('./writeups/principal/PrincipalWalkthrough')),
+  'expressway-walkthrough': lazy(() => import('./writeups/expressway/ExpresswayWalkthrough')),
+  'umz-walkthrough': lazy(() => import('./writeups/umz/UmzWalkthrough')),
+  'active-walkthrough': lazy(() => import('./writeups/active/ActiveWalkthrough')),
+  'editor-walkthrough': lazy(() => import('./writeups/editor/EditorWalkthrough')),
+  'tombwatcher-walkthrough': lazy(() => import('./writeups/tombwatcher/TombwatcherWalkthrough')),
+  'aria-walkthrough': lazy(() => import('./writeups/aria/AriaWalkthrough')),
+  'puppy-walkthrough': lazy(() => import('./writeups/puppy/PuppyWalkthrough')),
+  'fluffy-walkthrough': lazy(() => import('./writeups/fluffy/FluffyWalkthrough')),
+  'wcorp-walkthrough': lazy(() => import('./writeups/Wcorp/WcorpWalkthrough')),
+  'dc02-walkthrough': lazy(() => import('./writeups/dc02/DC02Walkthrough'))
+};
 
 const WriteupDetail = () => {
   const { id } = useParams();
   const normalizedId = (id || '').toLowerCase();
 
-  // Map of available writeups
-  const writeupComponents = {
-    'dc02-walkthrough': DC02Walkthrough,
-    'wcorp-walkthrough': WcorpWalkthrough,
-    'fluffy-walkthrough': FluffyWalkthrough,
-    'puppy-walkthrough': PuppyWalkthrough,
-    'aria-walkthrough': AriaWalkthrough,
-    'tombwatcher-walkthrough': TombwatcherWalkthrough,
-    'editor-walkthrough': EditorWalkthrough,
-    'active-walkthrough': ActiveWalkthrough,
-    'umz-walkthrough': UmzWalkthrough,
-  
-    'expressway-walkthrough': ExpresswayWalkthrough,
-  
-    'principal-walkthrough': PrincipalWalkthrough
-  };
-
   // Get the component for this writeup
   const WriteupComponent = writeupComponents[normalizedId];
 
@@ -70,8 +56,12 @@ const WriteupDetail = () => {
     );
   }
 
-  // Render the specific writeup component
-  return <WriteupComponent />;
+  // Render the specific writeup component once its chunk has loaded
+  return (
+    <Suspense fallback={<div className="writeup-detail-page" />}>
+      <WriteupComponent />
+    </Suspense>
+  );
 };
 
 export default WriteupDetail;
@@ -1,18 +1,15 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useMemo } from 'react';
 import { motion } from 'framer-motion';
 import { FaFileAlt, FaSearch } from 'react-icons/fa';
 import Card from '../components/Card';
+import { useSearch } from '../utils/searchIndex';
 import './Writeups.css';
 
 const Writeups = () => {
   const [searchTerm, setSearchTerm] = useState('');
-  const [filteredWriteups, setFilteredWriteups] = useState([]);
 
   // Writeups data
   const writeups = useMemo(() => [
-    
-    
-    
     {
       id: 17,
       title: 'Principal Walkthrough',
@@ -24,7 +21,8 @@ const Writeups = () => {
       difficulty: 'Medium',
       category: 'writeup',
       os: 'Linux'
-    },{
+    },
+    {
       id: 16,
       title: 'Expressway Walkthrough',
       excerpt: 'Expressway is an easy-difficulty Linux machine that demonstrates enumeration and exploits the IKE service, a component of the IPsec framework. Upon leaking the Pre-Shared key of the service and cracking it, the retrieved clear-text credentials are used to access the target via SSH. For privilege escalation, CVE-2025-32462 is exploited to get a privileged shell as the root user.',
@@ -35,7 +33,8 @@ const Writeups = () => {
       difficulty: 'Easy',
       category: 'writeup',
       os: 'Linux'
-    },{
+    },
+    {
       id: 15,
       title: 'Umz Walkthrough',
       excerpt: 'Umz is an easy Hack My VM machine featuring a DDoS-triggered backend, OS command injection via a ping form, sudo md5sum, rainbow table recovery, and SUID dd for root.',
@@ -48,7 +47,7 @@ const Writeups = () => {
       os: 'Linux'
     },
     {
-      id: 14,
+      id: 13,
       title: 'Active Walkthrough',
       excerpt: 'Active is an easy to medium difficulty machine, which features two very prevalent techniques to gain privileges within an Active Directory environment.',
       date: 'Feb 15, 2026',
@@ -58,7 +57,8 @@ const Writeups = () => {
       difficulty: 'Easy',
       category: 'writeup',
       os: 'Windows'
-    },{
+    },
+    {
       id: 12,
       title: 'Editor Walkthrough',
       excerpt: 'Full Nmap reconnaissance exposed SSH, nginx and a vulnerable XWiki on Jetty. XWiki RCE gave an xwiki reverse shell, revealed plaintext DB credentials in /etc/xwiki to SSH as oliver, and a writable SUID ndsudo binary was abused via an untrusted-search-path exploit to escalate to root.',
@@ -71,7 +71,7 @@ const Writeups = () => {
       os: 'Linux'
     },
     {
-      id: 13,
+      id: 11,
       title: 'TombWatcher Walkthrough',
       excerpt: 'TombWatcher is a medium-difficulty Windows Active Directory machine that demonstrates advanced ADCS exploitation techniques. Starting with provided credentials (henry / H3nry_987TGV!), the machine showcases GMSA enumeration, Kerberoasting attacks, and ESC15 vulnerability exploitation through Certipy. The walkthrough covers tombstone object abuse, certificate template manipulation, and privilege escalation to Domain Administrator through ADCS certificate abuse.',
       date: 'Oct 11, 2025',
@@ -119,44 +119,32 @@ const Writeups = () => {
       os: 'Windows'
     },
     {
-    id: 7,
-    title: 'Wcorp Walkthrough',
-    excerpt: 'A challenging Windows Active Directory environment featuring SMB enumeration, AS-REP roasting, Kerberoasting, and DCSync techniques. This writeup covers advanced lateral movement and privilege escalation methods.',
-    date: 'Sep 05, 2025',
-    tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking'],
-    image: '/images/writeups/wcorp/machine.png',
-    link: '/writeups/wcorp-walkthrough',
-    difficulty: 'Hard',
-    category: 'writeup',
-    os: 'Windows'
+      id: 7,
+      title: 'Wcorp Walkthrough',
+      excerpt: 'A challenging Windows Active Directory environment featuring SMB enumeration, AS-REP roasting, Kerberoasting, and DCSync techniques. This writeup covers advanced lateral movement and privilege escalation methods.',
+      date: 'Sep 05, 2025',
+      tags: ['hc', 'smb', 'ad', 'windows', 'asreproast', 'dcsync', 'kerberoasting', 'password-cracking'],
+      image: '/images/writeups/wcorp/machine.png',
+      link: '/writeups/wcorp-walkthrough',
+      difficulty: 'Hard',
+      category: 'writeup',
+      os: 'Windows'
     },
     {
-    id: 1,
-    title: 'DC02 Walkthrough',
-    excerpt: 'This Windows Domain Controller (DC01) in the SOUPEDECODE.LOCAL domain was discovered via internal network scanning. Enumeration revealed multiple Active Directory services and valid SMB credentials (charlie:charlie). AS-REP roasting against zximena448 yielded the password internet, granting Backup Operators group privileges.',
-    date: 'Aug 20, 2025',
-    tags: ["hmv", "windows", "ad", "asreproast", "dcsync", "backup-operators", "password-cracking", "smb", "ldap"],
-    image: '/images/writeups/dc02/machine.png',
-    link: '/writeups/dc02-walkthrough',
-    difficulty: 'Medium',
-    category: 'writeup',
-    os: 'Windows'
-    }], []);
+      id: 2,
+      title: 'DC02 Walkthrough',
+      excerpt: 'This Windows Domain Controller (DC01) in the SOUPEDECODE.LOCAL domain was discovered via internal network scanning. Enumeration revealed multiple Active Directory services and valid SMB credentials (charlie:charlie). AS-REP roasting against zximena448 yielded the password internet, granting Backup Operators group privileges.',
+      date: 'Aug 20, 2025',
+      tags: ['hmv', 'windows', 'ad', 'asreproast', 'dcsync', 'backup-operators', 'password-cracking', 'smb', 'ldap'],
+      image: '/images/writeups/dc02/machine.png',
+      link: '/writeups/dc02-walkthrough',
+      difficulty: 'Medium',
+      category: 'writeup',
+      os: 'Windows'
+    }
+  ], []);
 
-  useEffect(() => {
-    const filtered = writeups.filter(writeup => {
-      const matchesSearch = writeup.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                           writeup.excerpt.toLowerCase().includes(searchTerm.toLowerCase());
-      return matchesSearch;
-    });
-    
-    // Remove duplicates based on ID
-    const uniqueFiltered = filtered.filter((writeup, index, self) => 
-      index === self.findIndex(w => w.id === writeup.id)
-    );
-    
-    setFilteredWriteups(uniqueFiltered);
-  }, [searchTerm, writeups]);
+  const filteredWriteups = useSearch(writeups, searchTerm);
 
   const containerVariants = {
     hidden: { opacity: 0 },
@@ -2,120 +2,131 @@ import React, { useState } from 'react';
 import { motion } from 'framer-motion';
 import { FaCopy, FaCheck } from 'react-icons/fa';
 import CodeBlock from '../components/CodeBlock';
+import InfoStatus from '../components/InfoStatus';
 
 /**
- * Renders markdown content with enhanced code blocks that include copy functionality
- * @param {string} content - The markdown content to render
- * @returns {Array} Array of React elements
+ * Renders the inline spans of a pre-tokenized block (see htb_writeup.py,
+ * "Writeup content"): a plain string, or a list of strings and
+ * ["b"|"i"|"c", text] / ["a", text, href] spans
+ * @param {string|Array} inline - Inline content of a block
+ * @returns {string|Array} Text or array of React elements
  */
-export const renderMarkdownWithCopyButtons = (content) => {
-  const lines = content.split('\n');
-  const elements = [];
-  let i = 0;
-  
-  while (i < lines.length) {
-    const line = lines[i];
-    
-    if (line.startsWith('# ')) {
-      elements.push(<h1 key={i}>{line.substring(2)}</h1>);
-    } else if (line.startsWith('## ')) {
-      elements.push(<h2 key={i}>{line.substring(3)}</h2>);
-    } else if (line.startsWith('### ')) {
-      elements.push(<h3 key={i}>{line.substring(4)}</h3>);
-    } else if (line.startsWith('```')) {
-      // Handle code blocks with copy functionality
-      const language = line.substring(3).trim();
-      const codeLines = [];
-      i++;
-      
-      while (i < lines.length && !lines[i].startsWith('```')) {
-        codeLines.push(lines[i]);
-        i++;
-      }
-      
-      elements.push(
-        <CodeBlock key={i} language={language}>
-          {codeLines.join('\n')}
-        </CodeBlock>
-      );
-    } else if (line.startsWith('![') && line.includes('](') && line.endsWith(')')) {
-      const altText = line.match(/\[(.*?)\]/)[1];
-      const imageSrc = line.match(/\((.*?)\)/)[1];
-      elements.push(
-        <div key={i} className="image-container">
-          <img src={imageSrc} alt={altText} className="content-image" />
-        </div>
-      );
-    } else if (line.trim() === '') {
-      elements.push(<br key={i} />);
-    } else {
-      // Process inline markdown
-      const processedLine = line
-        .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>') // Bold
-        .replace(/\*(.*?)\*/g, '<em>$1</em>') // Italic
-        .replace(/`(.*?)`/g, '<code class="inline-code">$1</code>'); // Inline code
-      
-      elements.push(
-        <p key={i} dangerouslySetInnerHTML={{ __html: processedLine }} />
+export const renderInline = (inline) => {
+  if (typeof inline === 'string') {
+    return inline;
+  }
+  return inline.map((part, key) => {
+    if (typeof part === 'string') {
+      return part;
+    }
+    const [type, text, href] = part;
+    if (type === 'a') {
+      return (
+        <a key={key} href={href} target="_blank" rel="noopener noreferrer" className="content-link">
+          {text}
+        </a>
       );
     }
-    
-    i++;
+    if (type === 'b') {
+      return <strong key={key}>{text}</strong>;
+    }
+    if (type === 'i') {
+      return <em key={key}>{text}</em>;
+    }
+    return <code key={key} className="inline-code">{text}</code>;
+  });
+};
+
+/**
+ * Renders an image block: intrinsic width/height so the layout does not
+ * shift, lazy loading, and a <picture> with the AVIF/WebP variants from
+ * public/images/manifest.json when they exist
+ * @param {Array} block - ["img", alt, src, width, height, [[type, srcset], ...]]
+ * @returns {Object} React element
+ */
+export const renderImage = ([, alt, src, width, height, sources = []]) => {
+  const image = (
+    <img
+      src={src}
+      alt={alt}
+      width={width}
+      height={height}
+      loading="lazy"
+      decoding="async"
+      className="content-image"
+    />
+  );
+  if (sources.length === 0) {
+    return image;
   }
-  
-  return elements;
+  const sizes = width ? `(max-width: ${width}px) 100vw, ${width}px` : undefined;
+  return (
+    <picture>
+      {sources.map(([type, srcSet]) => (
+        <source key={type} type={type} srcSet={srcSet} sizes={sizes} />
+      ))}
+      {image}
+    </picture>
+  );
 };
 
 /**
- * Extracts all code blocks from markdown content
- * @param {string} content - The markdown content
- * @returns {Array} Array of objects with language and code content
+ * Maps pre-tokenized markdown blocks to React elements
+ * @param {Array} blocks - Block tree from public/content/<slug>.json
+ * @param {Function} Code - Component used for code blocks
+ * @returns {Array} Array of React elements
  */
-export const extractCodeBlocks = (content) => {
-  const codeBlocks = [];
-  const lines = content.split('\n');
-  let i = 0;
-  
-  while (i < lines.length) {
-    const line = lines[i];
-    
-    if (line.startsWith('```')) {
-      const language = line.substring(3).trim();
-      const codeLines = [];
-      i++;
-      
-      while (i < lines.length && !lines[i].startsWith('```')) {
-        codeLines.push(lines[i]);
-        i++;
-      }
-      
-      codeBlocks.push({
-        language,
-        code: codeLines.join('\n')
-      });
+export const renderBlocks = (blocks, Code = CodeBlock) => blocks.map((block, key) => {
+  switch (block[0]) {
+    case 'h': {
+      const [, level, id, inline] = block;
+      const Heading = `h${level}`;
+      return <Heading key={key} id={id}>{renderInline(inline)}</Heading>;
     }
-    
-    i++;
+    case 'p':
+      return <p key={key}>{renderInline(block[1])}</p>;
+    case 'code':
+      return <Code key={key} language={block[1]}>{block[2]}</Code>;
+    case 'img':
+      return <div key={key} className="image-container">{renderImage(block)}</div>;
+    case 'info':
+      return <InfoStatus key={key} title={block[1]} message={block[2]} />;
+    default:
+      return <br key={key} />;
   }
-  
-  return codeBlocks;
-};
+});
+
+/**
+ * Renders markdown blocks with enhanced code blocks that include copy functionality
+ * @param {Array} blocks - Block tree from public/content/<slug>.json
+ * @returns {Array} Array of React elements
+ */
+export const renderMarkdownWithCopyButtons = (blocks) => renderBlocks(blocks, CodeBlock);
+
+/**
+ * Extracts all code blocks from the block tree
+ * @param {Array} blocks - Block tree from public/content/<slug>.json
+ * @returns {Array} Array of objects with language and code content
+ */
+export const extractCodeBlocks = (blocks) => blocks
+  .filter(block => block[0] === 'code')
+  .map(([, language, code]) => ({ language, code }));
 
 /**
  * Creates a "Copy All Code" button that copies all code blocks from the content
- * @param {string} content - The markdown content
+ * @param {Array} blocks - Block tree from public/content/<slug>.json
  * @returns {Function} A function that returns a React component for the copy all button
  */
-export const createCopyAllButton = (content) => {
-  const codeBlocks = extractCodeBlocks(content);
-  
+export const createCopyAllButton = (blocks) => {
+  const codeBlocks = extractCodeBlocks(blocks);
+
   if (codeBlocks.length === 0) {
     return null;
   }
-  
+
   return () => {
     const [copied, setCopied] = useState(false);
-    
+
     const handleCopyAll = async () => {
       const allCode = codeBlocks
         .map(block => {
@@ -125,7 +136,7 @@ export const createCopyAllButton = (content) => {
           return block.code;
         })
         .join('\n\n');
-      
+
       try {
         await navigator.clipboard.writeText(allCode);
         setCopied(true);
@@ -143,7 +154,7 @@ export const createCopyAllButton = (content) => {
         setTimeout(() => setCopied(false), 3000);
       }
     };
-    
+
     return (
       <motion.button
         className={`copy-all-button ${copied ? 'copied' : ''}`}
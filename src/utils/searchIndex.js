@@ -0,0 +1,133 @@
+import { useEffect, useMemo, useState } from 'react';
+
+const INDEX_URL = '/search-index.json';
+
+let indexPromise = null;
+
+/**
+ * Fetches the prebuilt search index (public/search-index.json, written by
+ * htb_writeup.py) once and shares it between pages.
+ * @returns {Promise<Object|null>} The index, or null if it could not be loaded
+ */
+export const loadSearchIndex = () => {
+  if (!indexPromise) {
+    indexPromise = fetch(INDEX_URL)
+      .then(response => (response.ok ? response.json() : null))
+      .then(data => (data ? { ...data, keys: Object.keys(data.tokens).sort() } : null))
+      .catch(() => null);
+  }
+  return indexPromise;
+};
+
+/**
+ * Splits text into the lowercase words the index is keyed by
+ * @param {string} text
+ * @returns {Array<string>}
+ */
+export const tokenize = (text) => text.toLowerCase().match(/[a-z0-9]+/g) || [];
+
+// First position in the sorted token list that is >= prefix
+const lowerBound = (keys, prefix) => {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (keys[mid] < prefix) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+};
+
+/**
+ * Ids of the posts matching every word of the query, each word matched as a
+ * prefix of an indexed token
+ * @param {Object} index - Loaded search index
+ * @param {string} query - Search box text
+ * @returns {Set<number>|null} Matching ids, or null if the query has no words
+ */
+export const searchIds = (index, query) => {
+  const words = tokenize(query);
+  if (words.length === 0) {
+    return null;
+  }
+  let result = null;
+  for (const word of words) {
+    const ids = new Set();
+    for (let i = lowerBound(index.keys, word); i < index.keys.length && index.keys[i].startsWith(word); i++) {
+      index.tokens[index.keys[i]].forEach(id => ids.add(id));
+    }
+    result = result === null ? ids : new Set([...result].filter(id => ids.has(id)));
+    if (result.size === 0) {
+      break;
+    }
+  }
+  return result;
+};
+
+/**
+ * Drops posts whose id was already seen, keeping the first occurrence
+ * @param {Array<Object>} posts
+ * @returns {Array<Object>}
+ */
+export const uniqueById = (posts) => {
+  const seen = new Set();
+  return posts.filter(post => {
+    if (seen.has(post.id)) {
+      return false;
+    }
+    seen.add(post.id);
+    return true;
+  });
+};
+
+const useSearchIndex = (enabled) => {
+  const [index, setIndex] = useState(null);
+
+  useEffect(() => {
+    if (!enabled || index) {
+      return undefined;
+    }
+    let active = true;
+    loadSearchIndex().then(data => {
+      if (active && data) {
+        setIndex(data);
+      }
+    });
+    return () => {
+      active = false;
+    };
+  }, [enabled, index]);
+
+  return index;
+};
+
+/**
+ * Filters posts by the search box text. The index is fetched on the first
+ * keystroke; until it arrives (or if it is unavailable) posts are matched by
+ * a plain title/excerpt scan.
+ * @param {Array<Object>} posts - Posts shown on the page
+ * @param {string} searchTerm - Search box text
+ * @returns {Array<Object>} Matching posts, without duplicates
+ */
+export const useSearch = (posts, searchTerm) => {
+  const index = useSearchIndex(searchTerm.trim() !== '');
+
+  return useMemo(() => {
+    const unique = uniqueById(posts);
+    const term = searchTerm.trim().toLowerCase();
+    if (!term) {
+      return unique;
+    }
+    if (!index) {
+      return unique.filter(post =>
+        post.title.toLowerCase().includes(term) ||
+        (post.excerpt || '').toLowerCase().includes(term)
+      );
+    }
+    const ids = searchIds(index, term);
+    return ids === null ? unique : unique.filter(post => ids.has(post.id));
+  }, [posts, searchTerm, index]);
+};
@@ -0,0 +1,61 @@
+import { useEffect, useState } from 'react';
+
+const SHARD_URL = '/tag-shards';
+
+const EMPTY = { tag: '', posts: [] };
+
+const cache = new Map();
+
+const SAFE_CHAR = /^[a-z0-9_-]$/;
+
+/**
+ * File name (without .json) of a tag's shard: the lowercased tag with every
+ * character outside [a-z0-9_-] spelled ~<hex code point>~. Must match
+ * tag_shard_name() in htb_writeup.py.
+ * @param {string} tag - Tag name (any case)
+ * @returns {string} Shard name, safe to use in a URL as is
+ */
+export const tagShardName = (tag) => Array.from(tag.toLowerCase())
+  .map(char => (SAFE_CHAR.test(char) ? char : `~${char.codePointAt(0).toString(16)}~`))
+  .join('');
+
+/**
+ * Fetches the cards of the posts carrying a tag
+ * (public/tag-shards/<tagShardName(tag)>.json, written by htb_writeup.py)
+ * once per session.
+ * @param {string} tag - Tag name (any case)
+ * @returns {Promise<Object>} { tag, posts }; no posts if it could not be loaded
+ */
+export const loadTagShard = (tag) => {
+  const name = tag.toLowerCase();
+  if (!cache.has(name)) {
+    cache.set(name, fetch(`${SHARD_URL}/${tagShardName(name)}.json`)
+      .then(response => (response.ok ? response.json() : EMPTY))
+      .catch(() => EMPTY));
+  }
+  return cache.get(name);
+};
+
+/**
+ * The posts carrying a tag
+ * @param {string} tag - Tag name
+ * @returns {Object} { posts, loading }
+ */
+export const useTagShard = (tag) => {
+  const [state, setState] = useState({ posts: [], loading: true });
+
+  useEffect(() => {
+    let active = true;
+    setState({ posts: [], loading: true });
+    loadTagShard(tag).then(data => {
+      if (active) {
+        setState({ posts: data.posts, loading: false });
+      }
+    });
+    return () => {
+      active = false;
+    };
+  }, [tag]);
+
+  return state;
+};
@@ -0,0 +1,45 @@
+import { useEffect, useState } from 'react';
+
+const CONTENT_URL = '/content';
+
+const EMPTY = { toc: [], blocks: [] };
+
+const cache = new Map();
+
+/**
+ * Fetches a writeup's pre-tokenized content (public/content/<slug>.json,
+ * written by htb_writeup.py) once per session.
+ * @param {string} slug - Writeup slug, e.g. 'editor'
+ * @returns {Promise<Object>} { toc, blocks }; empty if it could not be loaded
+ */
+export const loadWriteupContent = (slug) => {
+  if (!cache.has(slug)) {
+    cache.set(slug, fetch(`${CONTENT_URL}/${slug}.json`)
+      .then(response => (response.ok ? response.json() : EMPTY))
+      .catch(() => EMPTY));
+  }
+  return cache.get(slug);
+};
+
+/**
+ * The content of a writeup, empty until it has loaded
+ * @param {string} slug - Writeup slug
+ * @returns {Object} { toc, blocks }
+ */
+export const useWriteupContent = (slug) => {
+  const [content, setContent] = useState(EMPTY);
+
+  useEffect(() => {
+    let active = true;
+    loadWriteupContent(slug).then(data => {
+      if (active) {
+        setContent(data);
+      }
+    });
+    return () => {
+      active = false;
+    };
+  }, [slug]);
+
+  return content;
+};
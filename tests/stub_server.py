@@ -0,0 +1,108 @@
+"""A local HTTP server that stands in for HTB_API_BASE/HTB_IMAGE_BASE in tests.
+
+Each route is a callable that gets the request and returns a Reply; the
+server records every request (path, headers, client port) and the most
+requests it had in flight at once.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+
+class Reply:
+    """A canned response. `truncate` sends only that many body bytes (with the
+    full Content-Length) and drops the connection; `length=False` leaves out
+    Content-Length and ends the body by closing the connection."""
+
+    def __init__(self, status: int = 200, body: bytes = b"",
+                 headers: Optional[Dict[str, str]] = None, delay: float = 0.0,
+                 truncate: Optional[int] = None, length: bool = True):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.delay = delay
+        self.truncate = truncate
+        self.length = length
+
+
+class Request:
+    def __init__(self, path: str, headers: Dict[str, str], port: int):
+        self.path = path
+        self.headers = headers
+        self.port = port
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        stub = self.server.stub
+        request = Request(self.path, dict(self.headers), self.client_address[1])
+        route = stub.routes.get(self.path)
+        with stub.lock:
+            stub.requests.append(request)
+            stub.active += 1
+            stub.max_active = max(stub.max_active, stub.active)
+        try:
+            reply = route(request) if route else Reply(404)
+            if reply.delay:
+                time.sleep(reply.delay)
+            self.send_reply(reply)
+        finally:
+            with stub.lock:
+                stub.active -= 1
+
+    def send_reply(self, reply: Reply) -> None:
+        self.send_response(reply.status)
+        for name, value in reply.headers.items():
+            self.send_header(name, value)
+        if reply.length:
+            self.send_header("Content-Length", str(len(reply.body)))
+        else:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        if reply.truncate is not None:
+            self.wfile.write(reply.body[:reply.truncate])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(reply.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    def __init__(self, routes: Optional[Dict[str, Callable[[Request], Reply]]] = None):
+        self.routes = dict(routes or {})
+        self.requests: List[Request] = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path: str) -> str:
+        return self.base + path
+
+    def hits(self, path: str) -> List[Request]:
+        return [request for request in self.requests if request.path == path]
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def replies(*sequence: Reply) -> Callable[[Request], Reply]:
+    """A route that answers with each reply in turn, then repeats the last."""
+    queue = list(sequence)
+
+    def route(request: Request) -> Reply:
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+    return route
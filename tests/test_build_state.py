@@ -0,0 +1,64 @@
+"""Build state: a stage reruns when its inputs or its STAGE_VERSIONS entry change."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+
+
+class StageVersionTest(unittest.TestCase):
+    post = {"id": 1, "slug": "box", "category": "writeup", "title": "Box",
+            "link": "/writeups/box-walkthrough", "image": "/images/box.png", "tags": [],
+            "componentPath": "./writeups/box/BoxWalkthrough"}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.state = hw.configure_build_state(Path("state.json"))
+        self.addCleanup(hw.configure_build_state, None)
+        self.source = hw.markdown_path(self.post)
+        self.source.parent.mkdir(parents=True)
+        self.source.write_text("## Overview\nText.\n")
+
+    def build(self):
+        """Run the content and preview stages; returns which ones rendered."""
+        with mock.patch.object(hw, "parse_markdown",
+                               wraps=hw.parse_markdown) as parse, \
+                mock.patch.object(hw, "render_preview",
+                                  wraps=hw.render_preview) as preview:
+            hw._write_content(self.post, {})
+            hw._write_preview(self.post)
+        return {"content": parse.called, "preview": preview.called}
+
+    def test_unchanged_stages_are_skipped(self):
+        self.assertEqual(self.build(), {"content": True, "preview": True})
+        self.assertEqual(self.build(), {"content": False, "preview": False})
+
+    def test_bumping_a_version_reruns_only_that_stage(self):
+        self.build()
+        with mock.patch.dict(hw.STAGE_VERSIONS, {"content": 2}):
+            self.assertEqual(self.build(), {"content": True, "preview": False})
+            self.assertEqual(self.build(), {"content": False, "preview": False})
+
+    def test_changed_input_reruns_the_stage(self):
+        self.build()
+        self.source.write_text("## Overview\nMore text.\n")
+        self.assertEqual(self.build(), {"content": True, "preview": False})
+
+    def test_every_stage_has_a_version(self):
+        for stage in self.state.stages:
+            self.assertIn(stage, hw.STAGE_VERSIONS)
+        self.assertNotEqual(hw.stage_version("content"), hw.stage_version("preview"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""check: accepted problems in the baseline file do not fail the gate."""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+
+ORPHAN = ("orphan", "public/images/writeups/box/9.png is not used by any card")
+OVERSIZED = ("oversized", "src/pages/Home.js card 'Tool' (id 1): image is 1.5 MB")
+
+
+class CheckBaselineTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.baseline = Path("baseline.json")
+        patches = [mock.patch.object(hw.Registry, "load",
+                                     return_value=hw.Registry([{"id": 1}])),
+                   mock.patch.object(hw, "check_site")]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def check(self, problems, *argv):
+        hw.check_site.return_value = problems
+        with redirect_stdout(io.StringIO()) as out:
+            code = hw.cmd_check(["--baseline", str(self.baseline), *argv])
+        return code, out.getvalue()
+
+    def test_round_trip(self):
+        hw.save_check_baseline([OVERSIZED, ORPHAN, ORPHAN], self.baseline)
+        self.assertEqual(hw.load_check_baseline(self.baseline), {ORPHAN, OVERSIZED})
+        self.assertEqual(len(self.baseline.read_text().splitlines()), 7)
+
+    def test_missing_baseline_accepts_nothing(self):
+        self.assertEqual(hw.load_check_baseline(self.baseline), set())
+        self.assertEqual(self.check([ORPHAN])[0], 1)
+
+    def test_accepted_problems_pass(self):
+        self.assertEqual(self.check([ORPHAN, OVERSIZED], "--update-baseline")[0], 0)
+        code, out = self.check([ORPHAN, OVERSIZED])
+        self.assertEqual(code, 0)
+        self.assertIn(f"• [orphan] {ORPHAN[1]}", out)
+
+    def test_new_problems_fail(self):
+        hw.save_check_baseline([ORPHAN], self.baseline)
+        code, out = self.check([ORPHAN, OVERSIZED])
+        self.assertEqual(code, 1)
+        self.assertIn(f"✗ [oversized] {OVERSIZED[1]}", out)
+        self.assertIn("1 more in baseline.json", out)
+
+    def test_fixed_problems_are_pointed_out(self):
+        hw.save_check_baseline([ORPHAN, OVERSIZED], self.baseline)
+        code, out = self.check([ORPHAN])
+        self.assertEqual(code, 0)
+        self.assertIn("1 problem(s) in baseline.json no longer occur", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Avatar downloads: Range/If-Range resume, size cap and image verification."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+from bench_htb_writeup import tiny_png  # noqa: E402
+from stub_server import Reply, StubServer, replies  # noqa: E402
+
+AVATAR = tiny_png()
+PNG = {"Content-Type": "image/png"}
+
+
+class ResumableAvatar:
+    """Drops the connection after `cut` bytes on the first request, then
+    answers Range requests with a 206 (or a full 200 if `honour_range` is
+    off, like a server or proxy that ignores Range)."""
+
+    def __init__(self, body: bytes, cut: int, honour_range: bool = True,
+                 etag: str = '"a1"'):
+        self.body = body
+        self.cut = cut
+        self.honour_range = honour_range
+        self.etag = etag
+        self.calls = 0
+
+    def __call__(self, request) -> Reply:
+        self.calls += 1
+        headers = dict(PNG, ETag=self.etag)
+        if self.calls == 1:
+            return Reply(200, self.body, headers, truncate=self.cut)
+        range_ = request.headers.get("Range", "")
+        if (self.honour_range and range_.startswith("bytes=")
+                and request.headers.get("If-Range") == self.etag):
+            start = int(range_[len("bytes="):].rstrip("-"))
+            size = len(self.body)
+            headers["Content-Range"] = f"bytes {start}-{size - 1}/{size}"
+            return Reply(206, self.body[start:], headers)
+        return Reply(200, self.body, headers)
+
+
+class DownloadTestCase(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.cache = hw.configure_cache(self.root)
+        self.addCleanup(hw.configure_cache, None)
+        hw.configure_http(connect_timeout=2, read_timeout=2, retries=2, backoff=0)
+        self.addCleanup(hw.configure_http)
+        patcher = mock.patch.object(hw, "DEFAULT_BACKOFF", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.url = self.stub.url("/avatar.png")
+
+    def assertNoPartial(self):
+        self.assertFalse(hw.partial_path(self.url).exists())
+
+
+class ResumeTest(DownloadTestCase):
+    def test_truncated_transfer_resumes_with_range(self):
+        cut = len(AVATAR) // 2
+        self.stub.routes["/avatar.png"] = ResumableAvatar(AVATAR, cut)
+        self.assertEqual(hw.download_image(self.url, "Box"), AVATAR)
+        first, second = self.stub.hits("/avatar.png")
+        self.assertNotIn("Range", first.headers)
+        self.assertEqual(second.headers["Range"], f"bytes={cut}-")
+        self.assertEqual(second.headers["If-Range"], '"a1"')
+        self.assertNoPartial()
+
+    def test_server_ignoring_range_restarts_the_file(self):
+        cut = len(AVATAR) // 2
+        self.stub.routes["/avatar.png"] = ResumableAvatar(AVATAR, cut,
+                                                         honour_range=False)
+        self.assertEqual(hw.download_image(self.url, "Box"), AVATAR)
+        self.assertEqual(self.stub.hits("/avatar.png")[1].headers["Range"],
+                         f"bytes={cut}-")
+        self.assertNoPartial()
+
+    def test_partial_survives_to_the_next_run(self):
+        hw.configure_http(connect_timeout=2, read_timeout=2, retries=0, backoff=0)
+        cut = len(AVATAR) // 3
+        self.stub.routes["/avatar.png"] = ResumableAvatar(AVATAR, cut)
+        with self.assertRaises(hw.requests.exceptions.ChunkedEncodingError):
+            hw.download_image(self.url, "Box")
+        self.assertEqual(hw.partial_path(self.url).stat().st_size, cut)
+        self.assertEqual(hw.download_image(self.url, "Box"), AVATAR)
+        self.assertEqual(self.stub.hits("/avatar.png")[1].headers["Range"],
+                         f"bytes={cut}-")
+
+    def test_416_discards_the_partial(self):
+        part = hw.partial_path(self.url)
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"stale")
+        part.with_suffix(".json").write_text('{"validator": "\\"old\\""}')
+        self.stub.routes["/avatar.png"] = replies(Reply(416), Reply(200, AVATAR, PNG))
+        self.assertEqual(hw.download_image(self.url, "Box"), AVATAR)
+        self.assertNotIn("Range", self.stub.hits("/avatar.png")[1].headers)
+
+    def test_revalidated_avatar_comes_from_the_cache(self):
+        self.stub.routes["/avatar.png"] = replies(
+            Reply(200, AVATAR, dict(PNG, ETag='"a1"')), Reply(304))
+        hw.download_image(self.url, "Box")
+        self.assertEqual(hw.download_image(self.url, "Box"), AVATAR)
+        second = self.stub.hits("/avatar.png")[1]
+        self.assertEqual(second.headers["If-None-Match"], '"a1"')
+
+
+class RejectTest(DownloadTestCase):
+    def test_content_length_over_the_cap(self):
+        self.stub.routes["/avatar.png"] = replies(Reply(200, AVATAR, PNG))
+        with self.assertRaises(hw.DownloadError):
+            hw.download_image(self.url, "Box", max_bytes=len(AVATAR) - 1)
+        self.assertEqual(len(self.stub.hits("/avatar.png")), 1)
+        self.assertNoPartial()
+
+    def test_unsized_body_over_the_cap(self):
+        body = AVATAR * 4
+        self.stub.routes["/avatar.png"] = replies(Reply(200, body, PNG, length=False))
+        with self.assertRaises(hw.DownloadError):
+            hw.download_image(self.url, "Box", max_bytes=len(AVATAR))
+        self.assertNoPartial()
+
+    def test_non_image_content_type(self):
+        headers = {"Content-Type": "text/html"}
+        self.stub.routes["/avatar.png"] = replies(Reply(200, AVATAR, headers))
+        with self.assertRaises(hw.DownloadError):
+            hw.download_image(self.url, "Box")
+
+    def test_non_image_bytes(self):
+        self.stub.routes["/avatar.png"] = replies(Reply(200, b"<html></html>", PNG))
+        with self.assertRaises(hw.DownloadError):
+            hw.download_image(self.url, "Box")
+        self.assertNoPartial()
+        self.assertIsNone(self.cache.lookup("Box", self.url))
+
+    def test_corrupt_png_fails_the_decode(self):
+        corrupt = AVATAR[:40] + bytes(len(AVATAR) - 40)
+        self.stub.routes["/avatar.png"] = replies(Reply(200, corrupt, PNG))
+        with self.assertRaises(hw.DownloadError):
+            hw.download_image(self.url, "Box")
+        self.assertIsNone(self.cache.lookup("Box", self.url))
+
+
+class SniffTest(unittest.TestCase):
+    def test_magic_bytes(self):
+        self.assertEqual(hw.sniff_image_type(AVATAR), "image/png")
+        self.assertEqual(hw.sniff_image_type(b"\xff\xd8\xff\xe0"), "image/jpeg")
+        self.assertEqual(hw.sniff_image_type(b"GIF89a"), "image/gif")
+        self.assertEqual(hw.sniff_image_type(b"RIFF\0\0\0\0WEBPVP8 "), "image/webp")
+        self.assertIsNone(hw.sniff_image_type(b"<svg"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Pooled HTB session: retries on 429/5xx, timeouts and concurrent fetching."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+from bench_htb_writeup import tiny_png  # noqa: E402
+from stub_server import Reply, StubServer, replies  # noqa: E402
+
+AVATAR = tiny_png()
+
+
+class HttpTestCase(unittest.TestCase):
+    """Runs each test against a fresh stub server, with no cache or store."""
+
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        hw.configure_cache(None)
+        hw.configure_machine_store(None)
+        hw.configure_build_state(None)
+        hw.configure_http(connect_timeout=2, read_timeout=2, retries=2, backoff=0)
+        self.addCleanup(hw.configure_http)
+
+
+class SessionTest(HttpTestCase):
+    def test_retries_5xx_then_succeeds(self):
+        self.stub.routes["/p"] = replies(Reply(503), Reply(502), Reply(200, b"ok"))
+        self.assertEqual(hw.http_get(self.stub.url("/p"), "m"), b"ok")
+        self.assertEqual(len(self.stub.hits("/p")), 3)
+
+    def test_retries_429(self):
+        self.stub.routes["/p"] = replies(Reply(429, headers={"Retry-After": "0"}),
+                                         Reply(200, b"ok"))
+        self.assertEqual(hw.http_get(self.stub.url("/p"), "m"), b"ok")
+        self.assertEqual(len(self.stub.hits("/p")), 2)
+
+    def test_gives_up_after_the_configured_retries(self):
+        self.stub.routes["/p"] = replies(Reply(500))
+        with self.assertRaises(requests.exceptions.HTTPError) as raised:
+            hw.http_get(self.stub.url("/p"), "m")
+        self.assertEqual(raised.exception.response.status_code, 500)
+        self.assertEqual(len(self.stub.hits("/p")), 3)
+
+    def test_client_errors_are_not_retried(self):
+        self.stub.routes["/p"] = replies(Reply(404))
+        with self.assertRaises(requests.exceptions.HTTPError):
+            hw.http_get(self.stub.url("/p"), "m")
+        self.assertEqual(len(self.stub.hits("/p")), 1)
+
+    def test_read_timeout(self):
+        hw.configure_http(connect_timeout=2, read_timeout=0.2, retries=0, backoff=0)
+        self.stub.routes["/slow"] = replies(Reply(200, b"late", delay=1.0))
+        start = time.perf_counter()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            hw.http_get(self.stub.url("/slow"), "m")
+        self.assertLess(time.perf_counter() - start, 0.9)
+
+    def test_keep_alive_reuses_the_connection(self):
+        self.stub.routes["/p"] = replies(Reply(200, b"ok"))
+        for _ in range(3):
+            hw.http_get(self.stub.url("/p"), "m")
+        self.assertEqual(len({request.port for request in self.stub.hits("/p")}), 1)
+
+
+class ConcurrentFetchTest(HttpTestCase):
+    machines = ["Alpha", "Bravo", "Charlie", "Delta"]
+
+    def setUp(self):
+        super().setUp()
+        for name in self.machines:
+            profile = {"info": {"name": name, "avatar": f"/avatars/{name}.png"}}
+            self.stub.routes[f"/api/machine/profile/{name}"] = replies(
+                Reply(200, json.dumps(profile).encode(), delay=0.2,
+                      headers={"Content-Type": "application/json"}))
+            self.stub.routes[f"/avatars/{name}.png"] = replies(
+                Reply(200, AVATAR, delay=0.2, headers={"Content-Type": "image/png"}))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        patches = [mock.patch.object(hw, "HTB_API_BASE", self.stub.url("/api")),
+                   mock.patch.object(hw, "HTB_IMAGE_BASE", self.stub.base),
+                   mock.patch.dict(os.environ, {"HTB_TOKEN": "token"})]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_profiles_and_avatars_are_fetched_in_parallel(self):
+        with hw.transaction():
+            results = hw.download_machine_images(self.machines, workers=4)
+        self.assertEqual(results, {
+            name: (True, f"/images/writeups/{name.lower()}/machine.png")
+            for name in self.machines})
+        self.assertGreater(self.stub.max_active, 1)
+        for name in self.machines:
+            path = Path("public/images/writeups") / name.lower() / "machine.png"
+            self.assertEqual(path.read_bytes(), AVATAR)
+            profile = self.stub.hits(f"/api/machine/profile/{name}")[0]
+            self.assertEqual(profile.headers["Authorization"], "Bearer token")
+
+    def test_one_failure_does_not_stop_the_others(self):
+        self.stub.routes["/avatars/Bravo.png"] = replies(Reply(404))
+        with hw.transaction():
+            results = hw.download_machine_images(self.machines, workers=4)
+        self.assertEqual(results["Bravo"], (False, ""))
+        self.assertEqual(sum(ok for ok, _ in results.values()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""HttpCache: conditional revalidation, 304s, offline mode and eviction."""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+from stub_server import Reply, StubServer  # noqa: E402
+
+LAST_MODIFIED = "Mon, 01 Jan 2026 00:00:00 GMT"
+
+
+class VersionedResource:
+    """A route serving `body` with an ETag and Last-Modified, answering 304
+    when the request's validators still match."""
+
+    def __init__(self, body: bytes, etag: str = '"v1"',
+                 last_modified: str = LAST_MODIFIED,
+                 use_etag: bool = True):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.use_etag = use_etag
+
+    def __call__(self, request) -> Reply:
+        headers = {"Last-Modified": self.last_modified}
+        if self.use_etag:
+            headers["ETag"] = self.etag
+            if request.headers.get("If-None-Match") == self.etag:
+                return Reply(304, headers=headers)
+        elif request.headers.get("If-Modified-Since") == self.last_modified:
+            return Reply(304, headers=headers)
+        return Reply(200, self.body, headers=headers)
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer()
+        self.addCleanup(self.stub.close)
+        hw.configure_http(retries=0, backoff=0)
+        self.addCleanup(hw.configure_http)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.cache = hw.HttpCache(self.root)
+        self.url = self.stub.url("/profile")
+
+    def index_entries(self) -> list:
+        paths = (self.root / "index").glob("*.json")
+        return [json.loads(path.read_text()) for path in paths]
+
+
+class RevalidationTest(CacheTestCase):
+    def test_etag_revalidation_serves_the_cached_body(self):
+        self.stub.routes["/profile"] = VersionedResource(b'{"v": 1}')
+        self.assertEqual(self.cache.get(self.url, "Box"), b'{"v": 1}')
+        self.assertEqual(self.cache.get(self.url, "Box"), b'{"v": 1}')
+        first, second = self.stub.hits("/profile")
+        self.assertNotIn("If-None-Match", first.headers)
+        self.assertEqual(second.headers["If-None-Match"], '"v1"')
+        self.assertEqual(second.headers["If-Modified-Since"], LAST_MODIFIED)
+
+    def test_last_modified_revalidation(self):
+        self.stub.routes["/profile"] = VersionedResource(b"body", use_etag=False)
+        self.cache.get(self.url, "Box")
+        self.assertEqual(self.cache.get(self.url, "Box"), b"body")
+        second = self.stub.hits("/profile")[1]
+        self.assertNotIn("If-None-Match", second.headers)
+        self.assertEqual(second.headers["If-Modified-Since"], LAST_MODIFIED)
+
+    def test_changed_resource_replaces_the_cached_copy(self):
+        resource = VersionedResource(b"old avatar")
+        self.stub.routes["/profile"] = resource
+        self.cache.get(self.url, "Box")
+        resource.body, resource.etag = b"new avatar", '"v2"'
+        self.assertEqual(self.cache.get(self.url, "Box"), b"new avatar")
+        self.assertEqual(self.cache.lookup("Box", self.url)[1], b"new avatar")
+        self.assertEqual(self.cache.lookup("Box", self.url)[0]["etag"], '"v2"')
+        self.assertEqual(self.cache.get(self.url, "Box"), b"new avatar")
+        last = self.stub.hits("/profile")[-1]
+        self.assertEqual(last.headers["If-None-Match"], '"v2"')
+
+    def test_entries_are_keyed_by_machine_and_url(self):
+        self.stub.routes["/profile"] = VersionedResource(b"body")
+        self.cache.get(self.url, "Box")
+        self.cache.get(self.url, "Other")
+        self.assertNotIn("If-None-Match", self.stub.hits("/profile")[1].headers)
+        self.assertEqual(len(list((self.root / "objects").iterdir())), 1)
+
+    def test_errors_are_not_cached(self):
+        self.stub.routes["/profile"] = lambda request: Reply(404)
+        with self.assertRaises(hw.requests.exceptions.HTTPError):
+            self.cache.get(self.url, "Box")
+        self.assertIsNone(self.cache.lookup("Box", self.url))
+
+
+class OfflineTest(CacheTestCase):
+    def test_offline_serves_the_cache_without_the_network(self):
+        self.stub.routes["/profile"] = VersionedResource(b"body")
+        self.cache.get(self.url, "Box")
+        offline = hw.HttpCache(self.root, offline=True)
+        self.assertEqual(offline.get(self.url, "Box"), b"body")
+        self.assertEqual(len(self.stub.hits("/profile")), 1)
+
+    def test_offline_miss(self):
+        offline = hw.HttpCache(self.root, offline=True)
+        with self.assertRaises(hw.CacheMiss):
+            offline.get(self.url, "Box")
+        self.assertEqual(self.stub.requests, [])
+
+
+class EvictionTest(CacheTestCase):
+    def store(self, machine: str, body: bytes, used: float) -> None:
+        entry = self.cache.store(machine, f"https://htb.test/{machine}", body, {})
+        entry["used"] = used
+        self.cache._index_path(machine, entry["url"]).write_text(json.dumps(entry))
+
+    def test_entries_unused_for_max_age_are_dropped(self):
+        now = time.time()
+        self.cache.max_age = 3600
+        self.store("old", b"old body", now - 7200)
+        self.store("new", b"new body", now)
+        self.assertEqual(self.cache.evict(), (1, len(b"old body")))
+        self.assertEqual([e["machine"] for e in self.index_entries()], ["new"])
+        self.assertEqual(len(list((self.root / "objects").iterdir())), 1)
+
+    def test_least_recently_used_go_first_when_over_size(self):
+        now = time.time()
+        self.cache.max_bytes = 250
+        self.store("a", b"a" * 100, now - 30)
+        self.store("b", b"b" * 100, now - 20)
+        self.store("c", b"c" * 100, now - 10)
+        removed, freed = self.cache.evict()
+        self.assertEqual((removed, freed), (1, 100))
+        self.assertEqual(sorted(e["machine"] for e in self.index_entries()), ["b", "c"])
+
+    def test_shared_objects_are_kept_while_referenced(self):
+        now = time.time()
+        self.cache.max_bytes = 150
+        self.store("a", b"same" * 25, now - 30)
+        self.store("b", b"same" * 25, now - 20)
+        self.store("c", b"c" * 100, now - 10)
+        self.cache.evict()
+        self.assertEqual(sorted(e["machine"] for e in self.index_entries()), ["c"])
+        self.assertEqual(len(list((self.root / "objects").iterdir())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
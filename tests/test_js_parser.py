@@ -0,0 +1,106 @@
+"""Round-trip tests for the JS literal parser behind the generated pages."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+
+HOME = """import React, { useMemo } from 'react';
+
+const Home = () => {
+  const recentPosts = useMemo(() => [
+{cards}
+  ], []);
+  return <div>{`${recentPosts.length} posts`}</div>;
+};
+
+export default Home;
+"""
+
+DETAIL = """import React, { lazy } from 'react';
+import Editor from './writeups/editor/EditorWalkthrough';
+
+const writeupComponents = {
+  'editor-walkthrough': Editor,
+  'dc02-walkthrough': lazy(() => import('./writeups/dc02/DC02Walkthrough')),
+};
+
+export default writeupComponents;
+"""
+
+
+def home_page(cards: str) -> str:
+    return HOME.replace("{cards}", cards)
+
+
+class JsStringTest(unittest.TestCase):
+    def test_quote_round_trip(self):
+        values = ["plain", "it's", "back\\slash", "two\nlines", "quote \" and ' both",
+                  "üñí"]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(hw.js_string_value(hw.js_quote(value)), value)
+
+    def test_escapes(self):
+        self.assertEqual(hw.js_string_value(r'"a\tbA\x42\u{1F600}"'),
+                         "a\tbAB\U0001F600")
+        self.assertEqual(hw.js_string_value("'line\\\ncontinued'"), "linecontinued")
+
+
+class CardArrayTest(unittest.TestCase):
+    anchor = hw.PAGE_ARRAYS[Path("src/pages/Home.js")]
+    fields = [("id", 7), ("title", "O'Brien's \"box\""), ("excerpt", "a\nb"),
+              ("tags", ["htb", "it's"]), ("featured", True), ("image", None),
+              ("score", 1.5)]
+
+    def test_render_card_round_trip(self):
+        text = home_page(hw.render_card(self.fields))
+        cards = hw.CardArray(text, self.anchor).cards
+        self.assertEqual(cards, [{"id": 7, "title": "O'Brien's \"box\"",
+                                  "excerpt": "a\nb", "tags": ["htb", "it's"],
+                                  "featured": True, "score": 1.5}])
+
+    def test_with_body_keeps_the_rest_of_the_file(self):
+        text = home_page(hw.render_card(self.fields))
+        array = hw.CardArray(text, self.anchor)
+        rewritten = array.with_body(f"\n{hw.render_card([('id', 1)])}\n  ")
+        self.assertEqual(rewritten, home_page(hw.render_card([("id", 1)])))
+        self.assertIn("{`${recentPosts.length} posts`}", rewritten)
+
+    def test_empty_and_trailing_comma(self):
+        self.assertEqual(hw.CardArray(home_page(""), self.anchor).cards, [])
+        text = home_page("    { id: 1, 'quoted-key': 'x', },")
+        self.assertEqual(hw.CardArray(text, self.anchor).cards,
+                         [{"id": 1, "quoted-key": "x"}])
+
+    def test_missing_anchor(self):
+        with self.assertRaises(ValueError):
+            hw.CardArray("const nothing = [];", self.anchor)
+
+    def test_malformed_literal(self):
+        with self.assertRaises(ValueError):
+            hw.CardArray(home_page("    { id: 1 id: 2 }"), self.anchor)
+
+
+class ComponentMapTest(unittest.TestCase):
+    def test_routes_from_static_and_lazy_entries(self):
+        self.assertEqual(hw.ComponentMap(DETAIL).routes, {
+            "editor-walkthrough": "./writeups/editor/EditorWalkthrough",
+            "dc02-walkthrough": "./writeups/dc02/DC02Walkthrough",
+        })
+
+    def test_render_round_trip(self):
+        entries = [f"'{route}': lazy(() => import('{path}'))"
+                   for route, path in hw.ComponentMap(DETAIL).routes.items()]
+        rendered = hw.ComponentMap(DETAIL).render(entries)
+        self.assertNotIn("import Editor from", rendered)
+        reparsed = hw.ComponentMap(rendered)
+        self.assertEqual(reparsed.routes, hw.ComponentMap(DETAIL).routes)
+        self.assertEqual(reparsed.render(entries), rendered)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Writeup markdown: the block tree parse_markdown builds and write_content."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+from bench_htb_writeup import tiny_png  # noqa: E402
+
+FIXTURE = """\
+# Box Walkthrough
+## Overview
+Plain text with **bold**, *italic*, `nmap -sV` and [a link](https://htb.test/x).
+
+## Overview
+### Port 80 & "HTTPS"
+```bash
+echo "<script>alert('x')</script>" | grep -E '\\d+'
+
+cat /etc/passwd
+```
+![Login page](/images/writeups/box/login.png)
+<InfoStatus title="Note" message="Don't skip this." />
+Ünïcödé — 🚩 and a \\backslash
+"""
+
+EXPECTED_BLOCKS = [
+    ["h", 1, "box-walkthrough", "Box Walkthrough"],
+    ["h", 2, "overview", "Overview"],
+    ["p", ["Plain text with ", ["b", "bold"], ", ", ["i", "italic"], ", ",
+           ["c", "nmap -sV"], " and ", ["a", "a link", "https://htb.test/x"], "."]],
+    ["br"],
+    ["h", 2, "overview-2", "Overview"],
+    ["h", 3, "port-80-https", 'Port 80 & "HTTPS"'],
+    ["code", "bash",
+     "echo \"<script>alert('x')</script>\" | grep -E '\\d+'\n\ncat /etc/passwd"],
+    ["img", "Login page", "/images/writeups/box/login.png"],
+    ["info", "Note", "Don't skip this."],
+    ["p", "Ünïcödé — 🚩 and a \\backslash"],
+    ["br"],
+]
+
+
+class ParseMarkdownTest(unittest.TestCase):
+    def test_fixture(self):
+        document = hw.parse_markdown(FIXTURE)
+        self.assertEqual(document["version"], hw.CONTENT_VERSION)
+        self.assertEqual(document["blocks"], EXPECTED_BLOCKS)
+        self.assertEqual(document["toc"], [
+            {"id": "box-walkthrough", "text": "Box Walkthrough", "level": 1},
+            {"id": "overview", "text": "Overview", "level": 2},
+            {"id": "overview-2", "text": "Overview", "level": 2},
+            {"id": "port-80-https", "text": 'Port 80 & "HTTPS"', "level": 3},
+        ])
+
+    def test_heading_anchor_uses_the_rendered_text(self):
+        document = hw.parse_markdown("## Abusing `SeBackup` via [DCSync](/x)")
+        self.assertEqual(document["blocks"][0][2], "abusing-sebackup-via-dcsync")
+
+    def test_unclosed_fence_runs_to_the_end(self):
+        self.assertEqual(hw.parse_markdown("```\n# not a heading\n**x**")["blocks"],
+                         [["code", "", "# not a heading\n**x**"]])
+
+    def test_deeper_headings_are_paragraphs(self):
+        self.assertEqual(hw.parse_markdown("#### Four")["blocks"], [["p", "#### Four"]])
+
+    def test_incomplete_info_status_is_dropped(self):
+        self.assertEqual(hw.parse_markdown('<InfoStatus title="t" />')["blocks"], [])
+
+
+class WriteContentTest(unittest.TestCase):
+    post = {"id": 1, "slug": "box", "category": "writeup",
+            "componentPath": "./writeups/BoxWalkthrough"}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        hw.configure_build_state(None)
+        source = hw.markdown_path(self.post)
+        source.parent.mkdir(parents=True)
+        source.write_text(FIXTURE)
+        image = hw.PUBLIC_DIR / "images/writeups/box/login.png"
+        image.parent.mkdir(parents=True)
+        image.write_bytes(tiny_png(32))
+
+    def test_writes_the_document_with_image_sizes(self):
+        registry = hw.Registry([self.post])
+        with hw.transaction():
+            changed = hw.write_content(registry)
+        target = hw.content_path(self.post)
+        self.assertEqual(changed, [target, hw.IMAGE_MANIFEST])
+        text = target.read_text(encoding="utf-8")
+        self.assertIn("Ünïcödé — 🚩", text)  # written as UTF-8, not \\u escapes
+        blocks = json.loads(text)["blocks"]
+        expected = [block + [32, 32, []] if block[0] == "img" else block
+                    for block in EXPECTED_BLOCKS]
+        self.assertEqual(blocks, expected)
+
+    def test_unchanged_content_is_not_rewritten(self):
+        registry = hw.Registry([self.post])
+        with hw.transaction():
+            hw.write_content(registry)
+        with hw.transaction():
+            self.assertEqual(hw.write_content(registry), [])
+
+    def test_removed_posts_lose_their_content(self):
+        stale = hw.CONTENT_DIR / "gone.json"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("{}")
+        with hw.transaction():
+            hw.write_content(hw.Registry([self.post]))
+        self.assertFalse(stale.exists())
+        self.assertTrue(hw.content_path(self.post).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tag shard names: htb_writeup.tag_shard_name must match tagShardName in
+src/utils/tagShards.js, or the site fetches shards that were never written."""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import htb_writeup as hw  # noqa: E402
+
+TAGS = [
+    "Active Directory", "web", "CVE-2024_1234", "Path/Traversal", "a~b", "C++",
+    "Kerberos.", "ÜBER", "Straße", "ΟΔΟΣ", "İstanbul", "日本語", "🚩 flag",
+    "tab\there", "100%", "",
+]
+
+# Evaluates the module with its React import removed (only the hook needs it)
+# and prints the shard name of every tag read from stdin.
+RUNNER = """\
+import { readFileSync } from 'node:fs';
+const { tagShardName } = await import(process.argv[2]);
+const tags = JSON.parse(readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify(tags.map(tagShardName)));
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class TagShardParityTest(unittest.TestCase):
+    def js_shard_names(self, tags):
+        source = (REPO_ROOT / "src/utils/tagShards.js").read_text(encoding="utf-8")
+        source = re.sub(r"^import .* from 'react';\n", "", source, flags=re.M)
+        with tempfile.TemporaryDirectory() as tmp:
+            module = Path(tmp) / "tagShards.mjs"
+            module.write_text(source, encoding="utf-8")
+            runner = Path(tmp) / "run.mjs"
+            runner.write_text(RUNNER)
+            result = subprocess.run(["node", str(runner), module.as_uri()],
+                                    input=json.dumps(tags), capture_output=True,
+                                    text=True, encoding="utf-8", check=True)
+        return json.loads(result.stdout)
+
+    def test_python_and_js_agree(self):
+        js = self.js_shard_names(TAGS)
+        self.assertEqual(len(js), len(TAGS))
+        for tag, name in zip(TAGS, js):
+            with self.subTest(tag=tag):
+                self.assertEqual(hw.tag_shard_name(tag), name)
+
+
+class TagShardNameTest(unittest.TestCase):
+    def test_safe_characters_pass_through(self):
+        self.assertEqual(hw.tag_shard_name("CVE-2024_1234"), "cve-2024_1234")
+
+    def test_everything_else_is_spelled_out(self):
+        self.assertEqual(hw.tag_shard_name("a b/c~"), "a~20~b~2f~c~7e~")
+        self.assertEqual(hw.tag_shard_name("🚩"), "~1f6a9~")
+
+    def test_names_are_unique_per_lowercased_tag(self):
+        names = {hw.tag_shard_name(tag) for tag in TAGS}
+        self.assertEqual(len(names), len({tag.lower() for tag in TAGS}))
+
+
+if __name__ == "__main__":
+    unittest.main()
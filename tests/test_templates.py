@@ -0,0 +1,110 @@
+"""Writeup templates: placeholders, filters, the parsed-template cache and variants."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import htb_writeup as hw  # noqa: E402
+
+CONTEXT = {
+    "component": "ActiveWalkthrough", "machine": "Active", "slug": "active",
+    "id": "active-walkthrough", "title": "Active Walkthrough",
+    "excerpt": "It's <b>active</b>.", "date": "Jan 01, 2026",
+    "tags": ["Htb", "Windows"], "difficulty": "Easy", "os": "Windows",
+    "ip": "10.10.10.100",
+    "image": "/images/writeups/active/machine.png",
+}
+
+
+class TemplateTest(unittest.TestCase):
+    def test_filters(self):
+        template = hw.Template("{{name}} {{name|js}} {{tags|js}} {{name|attr}}", "t")
+        rendered = template.render({"name": "O'Neil & <co>", "tags": ["a", "b"]})
+        self.assertEqual(rendered, "O'Neil & <co> 'O\\'Neil & <co>' ['a', 'b'] "
+                                   "O&#x27;Neil &amp; &lt;co&gt;")
+
+    def test_text_outside_placeholders_is_kept(self):
+        text = "editor Editor {not a placeholder} {{ spaced }}"
+        self.assertEqual(hw.Template(text, "t").render({}), text)
+
+    def test_missing_value(self):
+        template = hw.Template("{{a}} {{b|js}} {{c}}", "machine.js.tmpl")
+        with self.assertRaises(hw.TemplateError) as raised:
+            template.render({"a": 1})
+        self.assertEqual(str(raised.exception), "machine.js.tmpl: no value for b, c")
+
+    def test_unknown_filter(self):
+        with self.assertRaises(hw.TemplateError):
+            hw.Template("{{a|upper}}", "t")
+
+
+class TemplateCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        patcher = mock.patch.object(hw, "TEMPLATE_DIR", self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(hw._templates.clear)
+        hw._templates.clear()
+
+    def test_parsed_once_while_unchanged(self):
+        (self.dir / "a.tmpl").write_text("hello {{name}}")
+        with mock.patch.object(hw, "Template", wraps=hw.Template) as parse:
+            first = hw.load_template("a.tmpl")
+            second = hw.load_template("a.tmpl")
+        self.assertIs(first, second)
+        self.assertEqual(parse.call_count, 1)
+
+    def test_reparsed_when_the_file_changes(self):
+        path = self.dir / "a.tmpl"
+        path.write_text("hello {{name}}")
+        first = hw.load_template("a.tmpl")
+        path.write_text("goodbye {{name}}")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = hw.load_template("a.tmpl")
+        self.assertIsNot(first, second)
+        self.assertNotEqual(first.version, second.version)
+        self.assertEqual(second.render({"name": "x"}), "goodbye x")
+
+    def test_missing_template(self):
+        with self.assertRaises(hw.TemplateError):
+            hw.load_template("nope.tmpl")
+
+
+class VariantTest(unittest.TestCase):
+    def setUp(self):
+        template_dir = REPO_ROOT / "templates" / "writeup"
+        patcher = mock.patch.object(hw, "TEMPLATE_DIR", template_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(hw._templates.clear)
+
+    def test_every_variant_renders(self):
+        for variant in hw.TEMPLATE_VARIANTS:
+            with self.subTest(variant=variant):
+                rendered = hw.render_writeup(variant, CONTEXT)
+                self.assertEqual(set(rendered), {"js", "css", "md"})
+                self.assertIn("ActiveWalkthrough", rendered["js"])
+                for text in rendered.values():
+                    self.assertIsNone(hw._PLACEHOLDER.search(text))
+
+    def test_choose_variant(self):
+        self.assertEqual(hw.choose_variant({"os": "Windows", "tags": ["htb"]}),
+                         "windows-ad")
+        self.assertEqual(hw.choose_variant({"os": "Linux", "tags": ["htb"]}), "linux")
+        self.assertEqual(hw.choose_variant({"tags": ["Sherlock"]}), "sherlock")
+        self.assertEqual(hw.choose_variant({"template": "challenge", "os": "Linux"}),
+                         "challenge")
+
+
+if __name__ == "__main__":
+    unittest.main()
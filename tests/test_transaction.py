@@ -0,0 +1,165 @@
+"""Transaction: staged writes, abort and rollback of a failed commit."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import htb_writeup as hw  # noqa: E402
+
+
+class TransactionTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.a = self.root / "a.txt"
+        self.b = self.root / "b.txt"
+        self.a.write_text("old a")
+        self.b.write_text("old b")
+
+    def failing_replace(self, target: Path):
+        """os.replace that fails the first time it replaces `target`."""
+        real_replace = os.replace
+        failed = []
+
+        def replace(src, dst):
+            if Path(dst) == target and not failed:
+                failed.append(dst)
+                raise OSError("disk full")
+            return real_replace(src, dst)
+        return replace
+
+    def files(self):
+        return sorted(p.relative_to(self.root).as_posix() for p in self.root.rglob("*"))
+
+    def test_reads_see_staged_content_until_commit(self):
+        with hw.transaction():
+            hw.write_page(self.a, "new a")
+            hw.delete_path(self.b)
+            self.assertEqual(hw.read_page(self.a), "new a")
+            self.assertFalse(hw.page_exists(self.b))
+            self.assertEqual(self.a.read_text(), "old a")
+            self.assertTrue(self.b.exists())
+        self.assertEqual(self.a.read_text(), "new a")
+        self.assertFalse(self.b.exists())
+
+    def test_nested_block_joins_outer(self):
+        with hw.transaction() as outer:
+            with hw.transaction() as inner:
+                hw.write_page(self.a, "new a")
+            self.assertIs(inner, outer)
+            self.assertEqual(self.a.read_text(), "old a")
+        self.assertEqual(self.a.read_text(), "new a")
+
+    def test_abort_writes_nothing(self):
+        callbacks = []
+        with hw.transaction() as txn:
+            hw.write_page(self.a, "new a")
+            hw.write_page(self.root / "sub" / "c.txt", b"new c")
+            hw.after_commit(lambda: callbacks.append(True))
+            txn.abort()
+        self.assertEqual(self.a.read_text(), "old a")
+        self.assertEqual(self.files(), ["a.txt", "b.txt"])
+        self.assertEqual(callbacks, [])
+
+    def test_exception_in_block_writes_nothing(self):
+        with self.assertRaises(RuntimeError):
+            with hw.transaction():
+                hw.write_page(self.a, "new a")
+                raise RuntimeError("step failed")
+        self.assertEqual(self.a.read_text(), "old a")
+        self.assertIsNone(hw._transaction)
+
+    def test_failed_commit_restores_every_file(self):
+        new_file = self.root / "sub" / "c.txt"
+        replace = self.failing_replace(self.b)
+        with mock.patch.object(hw.os, "replace", side_effect=replace):
+            with self.assertRaises(OSError):
+                with hw.transaction():
+                    hw.write_page(self.a, "new a")
+                    hw.write_page(self.b, "new b")
+                    hw.write_page(new_file, "new c")
+        self.assertEqual(self.a.read_text(), "old a")
+        self.assertEqual(self.b.read_text(), "old b")
+        self.assertEqual(self.files(), ["a.txt", "b.txt"])
+
+    def test_failed_commit_restores_deleted_file(self):
+        replace = self.failing_replace(self.b)
+        with mock.patch.object(hw.os, "replace", side_effect=replace):
+            with self.assertRaises(OSError):
+                with hw.transaction():
+                    hw.delete_path(self.a)
+                    hw.write_page(self.b, "new b")
+        self.assertEqual(self.a.read_text(), "old a")
+        self.assertEqual(self.b.read_text(), "old b")
+        self.assertEqual(self.files(), ["a.txt", "b.txt"])
+
+    def test_unchanged_files_are_not_rewritten(self):
+        txn = hw.Transaction()
+        txn.write(self.a, "old a")
+        txn.write(self.b, "new b")
+        self.assertEqual(txn.commit(), [self.b])
+
+
+class ManifestRollbackTest(unittest.TestCase):
+    """The per-entry rollback run_manifest does: files, registry and the
+    build-state records a removal forgets."""
+
+    post = {"id": 1, "slug": "box", "category": "writeup",
+            "componentPath": "./writeups/box/BoxWalkthrough"}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        self.component = Path("src/pages/writeups/box/BoxWalkthrough.js")
+        self.component.parent.mkdir(parents=True)
+        self.component.write_text("component")
+        Path("public/images/writeups/box").mkdir(parents=True)
+        self.state = hw.configure_build_state(Path("state.json"))
+        self.addCleanup(hw.configure_build_state, None)
+        self.state.record("content", "box", "inputs", {})
+        self.registry = hw.Registry([dict(self.post)])
+
+    def test_committed_removal_forgets_the_records(self):
+        with hw.transaction():
+            self.assertTrue(hw.remove_writeup("Box", self.registry))
+            self.assertIn("box", self.state.stages["content"])
+        self.assertNotIn("box", self.state.stages["content"])
+        self.assertFalse(self.component.exists())
+
+    def test_aborted_removal_keeps_the_records(self):
+        with hw.transaction() as txn:
+            hw.remove_writeup("Box", self.registry)
+            txn.abort()
+        self.assertIn("box", self.state.stages["content"])
+        self.assertTrue(self.component.exists())
+
+    def test_rolled_back_entry_restores_files_registry_and_records(self):
+        with hw.transaction() as txn:
+            savepoint, posts = txn.savepoint(), self.registry.snapshot()
+            hw.remove_writeup("Box", self.registry)
+            txn.rollback_to(savepoint)
+            self.registry.restore(posts)
+            self.assertEqual(self.registry.get("box"), self.post)
+        self.assertEqual(self.registry.posts, [self.post])
+        self.assertIn("box", self.state.stages["content"])
+        self.assertTrue(self.component.exists())
+
+    def test_removal_then_recreation_keeps_the_new_records(self):
+        with hw.transaction():
+            hw.remove_writeup("Box", self.registry)
+            self.registry.add(dict(self.post))
+            self.state.record("content", "box", "new inputs", {})
+        self.assertEqual(self.state.stages["content"]["box"]["inputs"], "new inputs")
+
+
+if __name__ == "__main__":
+    unittest.main()